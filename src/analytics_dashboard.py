@@ -4,18 +4,32 @@ The Futuroptimist roadmap (see Phase 5 in ``INSTRUCTIONS.md``) promises a
 dashboard that visualises topic performance alongside retention metrics.  This
 module fulfils that commitment by loading the analytics captured in
 ``video_scripts/*/metadata.json`` (populated via ``analytics_ingester.py``) and
-exposing a small Streamlit interface.  The helpers are structured so they can
-be unit-tested without launching Streamlit, keeping CI deterministic.
+exposing a small Streamlit interface.  Daily metrics from the
+:mod:`src.analytics_store` time series, when present, add growth curves aligned
+on publish dates and a daily average-view-duration (retention) series.  The
+helpers are structured so they can be unit-tested without launching Streamlit,
+keeping CI deterministic.
 """
 
 from __future__ import annotations
 
 import json
 import pathlib
-from typing import Iterable
+import sys
+from datetime import date
+from typing import Iterable, Mapping
 
 import pandas as pd
 
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+    from analytics_store import (  # type: ignore[import-not-found]
+        DEFAULT_STORE_PATH,
+        AnalyticsStore,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from .analytics_store import DEFAULT_STORE_PATH, AnalyticsStore
+
 VIDEO_ROOT = pathlib.Path("video_scripts")
 ANALYTICS_FIELDS = [
     "views",
@@ -44,6 +58,7 @@ def load_video_metadata(video_root: pathlib.Path = VIDEO_ROOT) -> list[dict]:
         analytics = data.get("analytics") or {}
         record = {
             "slug": meta_path.parent.name,
+            "youtube_id": str(data.get("youtube_id", "")),
             "title": str(data.get("title", "")),
             "status": str(data.get("status", "")),
             "publish_date": str(data.get("publish_date", "")),
@@ -61,6 +76,7 @@ def build_dataframe(records: Iterable[dict]) -> pd.DataFrame:
     frame = pd.DataFrame(records)
     required_columns = [
         "slug",
+        "youtube_id",
         "title",
         "status",
         "publish_date",
@@ -84,6 +100,42 @@ def build_dataframe(records: Iterable[dict]) -> pd.DataFrame:
     return frame
 
 
+def metadata_fingerprint(
+    video_root: pathlib.Path = VIDEO_ROOT,
+) -> tuple[tuple[str, int, int], ...]:
+    """``(slug, mtime_ns, size)`` per ``metadata.json``, used as a cache key."""
+
+    fingerprint = []
+    for meta_path in sorted(video_root.resolve().glob("*/metadata.json")):
+        try:
+            stat = meta_path.stat()
+        except OSError:
+            continue
+        fingerprint.append((meta_path.parent.name, stat.st_mtime_ns, stat.st_size))
+    return tuple(fingerprint)
+
+
+def load_dashboard_frame(
+    video_root: pathlib.Path = VIDEO_ROOT,
+    fingerprint: tuple[tuple[str, int, int], ...] = (),
+) -> pd.DataFrame:
+    """Return the dashboard dataframe for ``video_root``.
+
+    ``fingerprint`` (see :func:`metadata_fingerprint`) is not read; it only
+    keys the Streamlit cache so edits to any metadata file invalidate it.
+    """
+
+    return build_dataframe(load_video_metadata(video_root))
+
+
+def filter_frame(frame: pd.DataFrame, *, status: str = "All") -> pd.DataFrame:
+    """Rows of ``frame`` matching ``status`` (``"All"`` keeps every row)."""
+
+    if status == "All":
+        return frame
+    return frame.loc[frame["status"] == status].reset_index(drop=True)
+
+
 def summarize_dataframe(frame: pd.DataFrame) -> dict[str, float | int]:
     """Return aggregate metrics for dashboard headline numbers."""
 
@@ -115,7 +167,60 @@ def summarize_dataframe(frame: pd.DataFrame) -> dict[str, float | int]:
     }
 
 
-def render_dashboard(video_root: pathlib.Path = VIDEO_ROOT) -> None:
+def load_daily_metrics(
+    store_path: pathlib.Path = DEFAULT_STORE_PATH,
+    *,
+    start: date | None = None,
+    end: date | None = None,
+    youtube_ids: Iterable[str] | None = None,
+) -> pd.DataFrame:
+    """Return daily metrics in ``start..end`` from the time-series store."""
+
+    columns = ["youtube_id", "day", *ANALYTICS_FIELDS]
+    if not store_path.exists():
+        return pd.DataFrame(columns=columns)
+    with AnalyticsStore(store_path, readonly=True) as store:
+        rows = store.query(start=start, end=end, youtube_ids=youtube_ids)
+    frame = pd.DataFrame(rows, columns=columns)
+    frame["day"] = pd.to_datetime(frame["day"], errors="coerce")
+    for column in ANALYTICS_FIELDS:
+        frame[column] = pd.to_numeric(frame[column], errors="coerce")
+    return frame
+
+
+def growth_curves(
+    daily: pd.DataFrame, publish_dates: Mapping[str, object] | None = None
+) -> pd.DataFrame:
+    """Cumulative views per video indexed by days since publication.
+
+    ``publish_dates`` maps YouTube IDs to publish dates; videos without one
+    start at their first stored day. Totals only cover the rows in ``daily``,
+    so pass daily metrics going back to publication for lifetime curves.
+    """
+
+    if daily.empty:
+        return pd.DataFrame()
+    frame = daily.sort_values(["youtube_id", "day"])
+    first_day = frame.groupby("youtube_id")["day"].transform("min")
+    published = pd.to_datetime(
+        frame["youtube_id"].map(dict(publish_dates or {})), errors="coerce"
+    )
+    frame = frame.assign(
+        days_since_publish=(frame["day"] - published.fillna(first_day)).dt.days,
+        cumulative_views=frame.groupby("youtube_id")["views"].cumsum(),
+    )
+    return frame.loc[frame["days_since_publish"] >= 0].pivot_table(
+        index="days_since_publish",
+        columns="youtube_id",
+        values="cumulative_views",
+        aggfunc="last",
+    )
+
+
+def render_dashboard(
+    video_root: pathlib.Path = VIDEO_ROOT,
+    store_path: pathlib.Path = DEFAULT_STORE_PATH,
+) -> None:
     """Render the Streamlit dashboard for analytics exploration."""
 
     import streamlit as st
@@ -124,15 +229,15 @@ def render_dashboard(video_root: pathlib.Path = VIDEO_ROOT) -> None:
     st.title("Futuroptimist Analytics Dashboard")
     st.caption("Visualise YouTube retention metrics captured by analytics_ingester.py")
 
-    records = load_video_metadata(video_root)
-    statuses = sorted({r["status"] for r in records if r.get("status")})
+    # Streamlit reruns this function on every interaction; the frame is only
+    # rebuilt when a metadata.json file is added, removed or modified.
+    load_frame = st.cache_data(show_spinner=False, max_entries=4)(load_dashboard_frame)
+    all_videos = load_frame(video_root, metadata_fingerprint(video_root))
+    statuses = sorted(status for status in all_videos["status"].unique() if status)
     options = ["All"] + statuses if statuses else ["All"]
     selected_status = st.sidebar.selectbox("Video status", options, index=0)
 
-    if selected_status != "All":
-        records = [r for r in records if r.get("status") == selected_status]
-
-    frame = build_dataframe(records)
+    frame = filter_frame(all_videos, status=selected_status)
     summary = summarize_dataframe(frame)
 
     metric_cols = st.columns(5)
@@ -196,6 +301,68 @@ def render_dashboard(video_root: pathlib.Path = VIDEO_ROOT) -> None:
                 st.subheader("Average view duration")
                 st.bar_chart(chart_data[["average_view_duration_seconds"]])
 
+    if store_path.exists() and not frame.empty:
+        _render_daily_metrics(st, store_path, frame)
+
+
+def _load_daily_snapshot(
+    store_path: pathlib.Path,
+    version: tuple[int, int],
+    start: date | None,
+    end: date | None,
+    youtube_ids: tuple[str, ...],
+) -> pd.DataFrame:
+    # ``version`` (the store's mtime and size) only keys the Streamlit cache.
+    return load_daily_metrics(store_path, start=start, end=end, youtube_ids=youtube_ids)
+
+
+def _render_daily_metrics(st, store_path: pathlib.Path, frame: pd.DataFrame) -> None:
+    window = st.sidebar.date_input("Daily metrics range", value=())
+    if isinstance(window, date):
+        window = (window,)
+    start, end = (window[0], window[-1]) if len(window) else (None, None)
+    ids = tuple(value for value in frame["youtube_id"] if pd.notna(value) and value)
+    publish_dates = {
+        youtube_id: published
+        for youtube_id, published in zip(frame["youtube_id"], frame["publish_date"])
+        if youtube_id and pd.notna(published)
+    }
+    # Growth curves need every day since publication, so the range filter only
+    # trims the daily charts; the query reaches back to the earliest release.
+    query_start = start
+    if start is not None and publish_dates:
+        query_start = min(start, min(publish_dates.values()).date())
+    load_daily = st.cache_data(show_spinner=False, max_entries=16)(_load_daily_snapshot)
+    stat = store_path.stat()
+    daily = load_daily(
+        store_path, (stat.st_mtime_ns, stat.st_size), query_start, end, ids
+    )
+    if daily.empty:
+        return
+    titles = dict(zip(frame["youtube_id"], frame["title"]))
+    in_window = daily
+    if start is not None:
+        in_window = daily.loc[daily["day"] >= pd.Timestamp(start)]
+    in_window = in_window.assign(
+        video=in_window["youtube_id"].map(titles).fillna(in_window["youtube_id"])
+    )
+    if not in_window.empty:
+        st.subheader("Daily views")
+        st.line_chart(
+            in_window.pivot_table(index="day", columns="video", values="views")
+        )
+        if not in_window["average_view_duration_seconds"].dropna().empty:
+            st.subheader("Daily average view duration (s)")
+            st.line_chart(
+                in_window.pivot_table(
+                    index="day",
+                    columns="video",
+                    values="average_view_duration_seconds",
+                )
+            )
+    st.subheader("Growth curves (cumulative views by days since publish)")
+    st.line_chart(growth_curves(daily, publish_dates).rename(columns=titles))
+
 
 def _as_int(value: object) -> int | None:
     try:
@@ -1,4 +1,8 @@
-"""Fetch YouTube Analytics metrics and persist them to metadata files."""
+"""Fetch YouTube Analytics metrics and persist them to metadata files.
+
+Totals for the requested window are merged into each ``metadata.json``; daily
+per-video metrics are appended to the :mod:`src.analytics_store` time series.
+"""
 
 from __future__ import annotations
 
@@ -6,10 +10,23 @@ import argparse
 import json
 import os
 import pathlib
-import urllib.parse
-import urllib.request
-from datetime import datetime, timezone
-from typing import Iterable
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import Iterable, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+    from analytics_store import (  # type: ignore[import-not-found]
+        DEFAULT_STORE_PATH,
+        AnalyticsStore,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from .analytics_store import DEFAULT_STORE_PATH, AnalyticsStore
 
 DEFAULT_METRICS = (
     "views",
@@ -22,6 +39,15 @@ DEFAULT_METRICS = (
 API_URL = "https://youtubeanalytics.googleapis.com/v2/reports"
 TOKEN_ENV = "YOUTUBE_ANALYTICS_TOKEN"
 
+# Videos per report request via the ``video`` dimension; the API caps
+# ``maxResults`` for video reports at 200.
+MAX_VIDEOS_PER_REPORT = 200
+DEFAULT_MAX_WORKERS = 4
+REQUEST_TIMEOUT_SECONDS = 30
+MAX_RETRIES = 4
+RETRY_BACKOFF_SECONDS = 1.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
 
 def _now_iso() -> str:
     return (
@@ -52,27 +78,60 @@ def _iter_metadata_paths(
     return entries
 
 
-def _build_request(
+def _build_params(
+    video_ids: Sequence[str],
+    start_date: str,
+    end_date: str,
+    metrics: Iterable[str] = DEFAULT_METRICS,
+) -> dict[str, str]:
+    names = list(metrics)
+    # Reports on the ``video`` dimension must be sorted by a metric, descending.
+    sort_by = "views" if "views" in names else names[0]
+    return {
+        "ids": "channel==MINE",
+        "filters": f"video=={','.join(video_ids)}",
+        "dimensions": "video",
+        "sort": f"-{sort_by}",
+        "metrics": ",".join(names),
+        "startDate": start_date,
+        "endDate": end_date,
+        "maxResults": str(len(video_ids)),
+    }
+
+
+def _build_daily_params(
     video_id: str,
-    token: str,
     start_date: str,
     end_date: str,
     metrics: Iterable[str] = DEFAULT_METRICS,
-) -> urllib.request.Request:
-    params = {
+) -> dict[str, str]:
+    return {
         "ids": "channel==MINE",
         "filters": f"video=={video_id}",
-        "dimensions": "video",
+        "dimensions": "day",
+        "sort": "day",
         "metrics": ",".join(metrics),
         "startDate": start_date,
         "endDate": end_date,
     }
-    url = f"{API_URL}?{urllib.parse.urlencode(params)}"
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Accept": "application/json",
-    }
-    return urllib.request.Request(url, headers=headers)
+
+
+def build_session(pool_size: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """Pooled session retrying throttled and failed report requests with backoff."""
+
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_SECONDS,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
 
 
 def _column_mapping() -> dict[str, tuple[str, type]]:
@@ -85,44 +144,135 @@ def _column_mapping() -> dict[str, tuple[str, type]]:
     }
 
 
-def fetch_video_metrics(
-    *, video_id: str, token: str, start_date: str, end_date: str
-) -> dict[str, float | int]:
-    """Return analytics metrics for ``video_id``.
+def _parse_row(row: list, name_to_index: dict[str, int]) -> dict[str, float | int]:
+    values: dict[str, float | int] = {}
+    for column, (alias, caster) in _column_mapping().items():
+        position = name_to_index.get(column)
+        if position is None or position >= len(row):
+            continue
+        raw = row[position]
+        try:
+            value = caster(raw)
+        except (TypeError, ValueError):
+            continue
+        values[alias] = value
+    return values
 
-    The YouTube Analytics API requires an OAuth 2 bearer token. The caller is
-    responsible for obtaining it and passing it via ``token``.
-    """
 
-    request = _build_request(video_id, token, start_date, end_date)
-    with urllib.request.urlopen(request) as resp:
-        payload = json.loads(resp.read().decode("utf-8"))
+def _fetch_report(
+    params: dict[str, str], token: str, session: requests.Session | None
+) -> tuple[list[list], dict[str, int]]:
+    """Run one report query; return its rows and column positions by name."""
+
+    owns_session = session is None
+    if session is None:
+        session = build_session(1)
+    try:
+        resp = session.get(
+            API_URL,
+            params=params,
+            headers={
+                "Authorization": f"Bearer {token}",
+                "Accept": "application/json",
+            },
+            timeout=REQUEST_TIMEOUT_SECONDS,
+        )
+        resp.raise_for_status()
+        payload = resp.json()
+    finally:
+        if owns_session:
+            session.close()
 
     headers = payload.get("columnHeaders") or []
     rows = payload.get("rows") or []
     if not headers or not rows:
-        return {}
-
-    mapping = _column_mapping()
+        return [], {}
     name_to_index: dict[str, int] = {}
     for idx, header in enumerate(headers):
         name = header.get("name")
         if isinstance(name, str):
             name_to_index[name] = idx
+    return rows, name_to_index
 
-    values: dict[str, float | int] = {}
-    row = rows[0]
-    for column, (alias, caster) in mapping.items():
-        position = name_to_index.get(column)
-        if position is None or position >= len(row):
+
+def fetch_batch_metrics(
+    *,
+    video_ids: Sequence[str],
+    token: str,
+    start_date: str,
+    end_date: str,
+    session: requests.Session | None = None,
+) -> dict[str, dict[str, float | int]]:
+    """Return analytics metrics keyed by video ID for up to one report's videos.
+
+    One request covers every ID in ``video_ids`` through the ``video``
+    dimension; videos without data are omitted from the result. The YouTube
+    Analytics API requires an OAuth 2 bearer token, passed via ``token``.
+    """
+
+    if not video_ids:
+        return {}
+    rows, name_to_index = _fetch_report(
+        _build_params(video_ids, start_date, end_date), token, session
+    )
+    video_index = name_to_index.get("video")
+    results: dict[str, dict[str, float | int]] = {}
+    for row in rows:
+        if video_index is not None and video_index < len(row):
+            video_id = str(row[video_index])
+        elif len(video_ids) == 1:
+            video_id = video_ids[0]
+        else:
             continue
-        raw = row[position]
-        try:
-            value = caster(raw)
-        except (TypeError, ValueError):
+        values = _parse_row(row, name_to_index)
+        if values:
+            results[video_id] = values
+    return results
+
+
+def fetch_video_metrics(
+    *,
+    video_id: str,
+    token: str,
+    start_date: str,
+    end_date: str,
+    session: requests.Session | None = None,
+) -> dict[str, float | int]:
+    """Return analytics metrics for ``video_id`` (see :func:`fetch_batch_metrics`)."""
+
+    return fetch_batch_metrics(
+        video_ids=[video_id],
+        token=token,
+        start_date=start_date,
+        end_date=end_date,
+        session=session,
+    ).get(video_id, {})
+
+
+def fetch_daily_metrics(
+    *,
+    video_id: str,
+    token: str,
+    start_date: str,
+    end_date: str,
+    session: requests.Session | None = None,
+) -> dict[str, dict[str, float | int]]:
+    """Return metrics for ``video_id`` keyed by ISO day via the ``day`` dimension."""
+
+    rows, name_to_index = _fetch_report(
+        _build_daily_params(video_id, start_date, end_date), token, session
+    )
+    day_index = name_to_index.get("day")
+    if day_index is None:
+        return {}
+    results: dict[str, dict[str, float | int]] = {}
+    for row in rows:
+        if day_index >= len(row):
             continue
-        values[alias] = value
-    return values
+        values = _parse_row(row, name_to_index)
+        if values:
+            results[str(row[day_index])] = values
+    return results
 
 
 def _update_metadata(path: pathlib.Path, metrics: dict[str, float | int]) -> None:
@@ -144,21 +294,53 @@ def ingest(
     slugs: Iterable[str] | None = None,
     token: str | None = None,
     dry_run: bool = False,
+    batch_size: int = MAX_VIDEOS_PER_REPORT,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    session: requests.Session | None = None,
 ) -> list[dict[str, float | int | str]]:
-    """Fetch analytics for metadata files under ``video_root``."""
+    """Fetch analytics for metadata files under ``video_root``.
+
+    Videos are grouped into reports of ``batch_size`` IDs, fetched by up to
+    ``max_workers`` threads over one pooled session. Metadata files are only
+    written once every report has been fetched, so a failed run leaves them
+    untouched.
+    """
 
-    token = (token or os.getenv(TOKEN_ENV, "")).strip()
+    token = (token or os.getenv(TOKEN_ENV) or "").strip()
     if not token:
         raise EnvironmentError(f"{TOKEN_ENV} must be set")
 
+    entries = _iter_metadata_paths(video_root, slugs)
+    video_ids = list(dict.fromkeys(youtube_id for _, _, youtube_id in entries))
+    size = max(1, min(batch_size, MAX_VIDEOS_PER_REPORT))
+    batches = [video_ids[i : i + size] for i in range(0, len(video_ids), size)]
+
+    metrics_by_id: dict[str, dict[str, float | int]] = {}
+    if batches:
+        workers = max(1, min(max_workers, len(batches)))
+        owns_session = session is None
+        if session is None:
+            session = build_session(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                for result in pool.map(
+                    lambda batch: fetch_batch_metrics(
+                        video_ids=batch,
+                        token=token,
+                        start_date=start_date,
+                        end_date=end_date,
+                        session=session,
+                    ),
+                    batches,
+                ):
+                    metrics_by_id.update(result)
+        finally:
+            if owns_session:
+                session.close()
+
     records: list[dict[str, float | int | str]] = []
-    for meta_path, slug, youtube_id in _iter_metadata_paths(video_root, slugs):
-        metrics = fetch_video_metrics(
-            video_id=youtube_id,
-            token=token,
-            start_date=start_date,
-            end_date=end_date,
-        )
+    for meta_path, slug, youtube_id in entries:
+        metrics = metrics_by_id.get(youtube_id)
         if not metrics:
             continue
         if not dry_run:
@@ -169,6 +351,72 @@ def ingest(
     return records
 
 
+def backfill_daily(
+    *,
+    video_root: pathlib.Path,
+    start_date: str,
+    end_date: str,
+    store_path: pathlib.Path = DEFAULT_STORE_PATH,
+    slugs: Iterable[str] | None = None,
+    token: str | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    session: requests.Session | None = None,
+) -> dict[str, int]:
+    """Append daily metrics for ``start_date..end_date`` to the time-series store.
+
+    Only day ranges the store has not covered yet (or fetched too recently to
+    be final) are requested, one report per video and range, concurrently over
+    a pooled session. Returns the number of daily rows stored per video ID.
+    """
+
+    token = (token or os.getenv(TOKEN_ENV) or "").strip()
+    if not token:
+        raise EnvironmentError(f"{TOKEN_ENV} must be set")
+
+    first = date.fromisoformat(start_date)
+    last = date.fromisoformat(end_date)
+    video_ids = list(
+        dict.fromkeys(
+            youtube_id for _, _, youtube_id in _iter_metadata_paths(video_root, slugs)
+        )
+    )
+    stored: dict[str, int] = {}
+    with AnalyticsStore(store_path) as store:
+        tasks = [
+            (video_id, range_start, range_end)
+            for video_id in video_ids
+            for range_start, range_end in store.missing_ranges(video_id, first, last)
+        ]
+        if not tasks:
+            return stored
+        workers = max(1, min(max_workers, len(tasks)))
+        owns_session = session is None
+        if session is None:
+            session = build_session(workers)
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(
+                    pool.map(
+                        lambda task: fetch_daily_metrics(
+                            video_id=task[0],
+                            token=token,
+                            start_date=task[1].isoformat(),
+                            end_date=task[2].isoformat(),
+                            session=session,
+                        ),
+                        tasks,
+                    )
+                )
+        finally:
+            if owns_session:
+                session.close()
+        # SQLite writes stay on this thread, after every report succeeded.
+        for (video_id, range_start, range_end), rows in zip(tasks, results):
+            count = store.record(video_id, range_start, range_end, rows)
+            stored[video_id] = stored.get(video_id, 0) + count
+    return stored
+
+
 def main(argv: list[str] | None = None) -> None:
     parser = argparse.ArgumentParser(
         description="Fetch YouTube Analytics metrics and update metadata files",
@@ -201,10 +449,33 @@ def main(argv: list[str] | None = None) -> None:
         type=pathlib.Path,
         help="Path to write a JSON summary",
     )
+    parser.add_argument(
+        "--batch-size",
+        default=MAX_VIDEOS_PER_REPORT,
+        type=int,
+        help="Videos per Analytics report request",
+    )
+    parser.add_argument(
+        "--max-workers",
+        default=DEFAULT_MAX_WORKERS,
+        type=int,
+        help="Report requests fetched concurrently",
+    )
+    parser.add_argument(
+        "--store",
+        default=DEFAULT_STORE_PATH,
+        type=pathlib.Path,
+        help="SQLite time-series store for daily metrics",
+    )
+    parser.add_argument(
+        "--skip-daily",
+        action="store_true",
+        help="Do not backfill daily metrics into the time-series store",
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Collect metrics without modifying metadata files",
+        help="Collect metrics without modifying metadata files or the store",
     )
     args = parser.parse_args(argv)
 
@@ -215,6 +486,8 @@ def main(argv: list[str] | None = None) -> None:
         end_date=args.end_date,
         slugs=args.slug,
         dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
     )
 
     if args.output:
@@ -230,6 +503,21 @@ def main(argv: list[str] | None = None) -> None:
     )
     print(message)
 
+    if args.dry_run or args.skip_daily:
+        return
+    stored = backfill_daily(
+        video_root=video_root,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        store_path=args.store,
+        slugs=args.slug,
+        max_workers=args.max_workers,
+    )
+    print(
+        f"Stored {sum(stored.values())} daily row(s) for {len(stored)} video(s) "
+        f"in {args.store}"
+    )
+
 
 if __name__ == "__main__":  # pragma: no cover
     main()
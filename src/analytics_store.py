@@ -0,0 +1,177 @@
+"""SQLite time-series store for daily YouTube Analytics metrics.
+
+:mod:`src.analytics_ingester` appends one row per video and day (from reports
+using the ``day`` dimension) to ``analytics/daily_metrics.sqlite`` and
+:mod:`src.analytics_dashboard` reads date ranges back for growth and retention
+curves. Every requested day is recorded as fetched, even when YouTube returns
+no row for it, so backfills only request dates that were never covered. A day
+fetched less than ``REFRESH_DAYS`` after it happened is requested again, since
+YouTube keeps revising recent figures.
+"""
+
+from __future__ import annotations
+
+import pathlib
+import sqlite3
+from datetime import date, timedelta
+from typing import Iterable, Mapping
+
+DEFAULT_STORE_PATH = pathlib.Path("analytics/daily_metrics.sqlite")
+METRIC_COLUMNS = (
+    "views",
+    "watch_time_minutes",
+    "average_view_duration_seconds",
+    "impressions",
+    "impressions_click_through_rate",
+)
+REFRESH_DAYS = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_metrics (
+    youtube_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    views INTEGER,
+    watch_time_minutes REAL,
+    average_view_duration_seconds REAL,
+    impressions INTEGER,
+    impressions_click_through_rate REAL,
+    PRIMARY KEY (youtube_id, day)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS daily_metrics_day ON daily_metrics (day);
+CREATE TABLE IF NOT EXISTS fetched_days (
+    youtube_id TEXT NOT NULL,
+    day TEXT NOT NULL,
+    fetched_on TEXT NOT NULL,
+    PRIMARY KEY (youtube_id, day)
+) WITHOUT ROWID;
+"""
+
+
+def _days(start: date, end: date) -> Iterable[date]:
+    for offset in range((end - start).days + 1):
+        yield start + timedelta(days=offset)
+
+
+class AnalyticsStore:
+    """Daily per-video metrics keyed by ``(youtube_id, day)``."""
+
+    def __init__(
+        self, path: pathlib.Path = DEFAULT_STORE_PATH, *, readonly: bool = False
+    ) -> None:
+        """Open (creating if needed) the store at ``path``.
+
+        With ``readonly`` the existing file is opened without creating it or
+        running the schema, so readers never take a write lock against a
+        running backfill.
+        """
+
+        self.path = path
+        if readonly:
+            uri = f"{path.resolve().as_uri()}?mode=ro"
+            self._conn = sqlite3.connect(uri, uri=True)
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> AnalyticsStore:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def missing_ranges(
+        self,
+        youtube_id: str,
+        start: date,
+        end: date,
+        *,
+        refresh_days: int = REFRESH_DAYS,
+    ) -> list[tuple[date, date]]:
+        """Contiguous ``(first, last)`` day ranges in ``start..end`` to fetch."""
+
+        fetched = {
+            day: fetched_on
+            for day, fetched_on in self._conn.execute(
+                "SELECT day, fetched_on FROM fetched_days "
+                "WHERE youtube_id = ? AND day BETWEEN ? AND ?",
+                (youtube_id, start.isoformat(), end.isoformat()),
+            )
+        }
+        ranges: list[tuple[date, date]] = []
+        for day in _days(start, end):
+            fetched_on = fetched.get(day.isoformat())
+            if fetched_on is not None and date.fromisoformat(
+                fetched_on
+            ) >= day + timedelta(days=refresh_days):
+                continue
+            if ranges and ranges[-1][1] == day - timedelta(days=1):
+                ranges[-1] = (ranges[-1][0], day)
+            else:
+                ranges.append((day, day))
+        return ranges
+
+    def record(
+        self,
+        youtube_id: str,
+        start: date,
+        end: date,
+        rows: Mapping[str, Mapping[str, float | int]],
+        *,
+        fetched_on: date | None = None,
+    ) -> int:
+        """Store ``rows`` (keyed by ISO day) and mark ``start..end`` as fetched."""
+
+        fetched = (fetched_on or date.today()).isoformat()
+        columns = ", ".join(METRIC_COLUMNS)
+        placeholders = ", ".join("?" for _ in METRIC_COLUMNS)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO daily_metrics (youtube_id, day, {columns}) "
+                f"VALUES (?, ?, {placeholders})",
+                [
+                    (youtube_id, day, *(metrics.get(col) for col in METRIC_COLUMNS))
+                    for day, metrics in rows.items()
+                ],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO fetched_days (youtube_id, day, fetched_on) "
+                "VALUES (?, ?, ?)",
+                [(youtube_id, day.isoformat(), fetched) for day in _days(start, end)],
+            )
+        return len(rows)
+
+    def query(
+        self,
+        *,
+        start: date | None = None,
+        end: date | None = None,
+        youtube_ids: Iterable[str] | None = None,
+    ) -> list[dict[str, str | float | int | None]]:
+        """Daily rows in ``start..end`` (inclusive), ordered by video and day."""
+
+        clauses: list[str] = []
+        params: list[str] = []
+        if start is not None:
+            clauses.append("day >= ?")
+            params.append(start.isoformat())
+        if end is not None:
+            clauses.append("day <= ?")
+            params.append(end.isoformat())
+        if youtube_ids is not None:
+            ids = list(youtube_ids)
+            if not ids:
+                return []
+            clauses.append(f"youtube_id IN ({', '.join('?' for _ in ids)})")
+            params.extend(ids)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        names = ("youtube_id", "day", *METRIC_COLUMNS)
+        cursor = self._conn.execute(
+            f"SELECT {', '.join(names)} FROM daily_metrics{where} "
+            "ORDER BY youtube_id, day",
+            params,
+        )
+        return [dict(zip(names, row)) for row in cursor]
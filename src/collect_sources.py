@@ -1,11 +1,36 @@
+"""Download the reference URLs listed in ``sources.txt`` files.
+
+The URLs of every list share one pool (``MAX_WORKERS`` threads, at most
+``MAX_CONNECTIONS_PER_HOST`` at once per host), so a large file for one video
+does not hold up the others, and a URL listed by several videos is fetched
+once per run. Bodies are streamed to a ``.part`` file that is renamed into
+place when complete; the response's validators are saved next to it in a
+``.part.json`` sidecar as soon as the headers arrive, so a transfer that was
+interrupted, even by killing the run, resumes with an HTTP ``Range`` request
+on the next run. Files that are already on disk are revalidated with
+``If-None-Match``/``If-Modified-Since`` and identical content downloaded for
+several videos is hard-linked to one copy.
+Besides the ``sources.json`` URL-to-file mapping, each sources directory gets a
+``manifest.json`` recording status, size, hash, validators and timings per URL.
+"""
+
+import hashlib
+import http.client
+import json
 import os
 import pathlib
-import urllib.request
+import shutil
+import sys
+import threading
+import time
 import urllib.error
 import urllib.parse
-import json
-import sys
-from typing import Iterable
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Iterable, Iterator
 
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
 VIDEO_ROOT = BASE_DIR / "video_scripts"
@@ -15,55 +40,537 @@ SOURCE_URLS_ENV = "FUTUROPTIMIST_SOURCE_URLS_FILE"
 GLOBAL_SOURCES_ENV = "FUTUROPTIMIST_SOURCES_DIR"
 USER_AGENT = "futuroptimist-bot/1.0"
 URL_TIMEOUT = 10
+MAX_WORKERS = 8
+MAX_CONNECTIONS_PER_HOST = 2
+CHUNK_SIZE = 64 * 1024
+PART_SUFFIX = ".part"
+PART_META_SUFFIX = ".part.json"
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass
+class SourceRecord:
+    """Manifest entry describing the last attempt to fetch one URL.
+
+    ``status`` is one of ``downloaded``, ``resumed``, ``not_modified``,
+    ``linked`` (copied from another directory's download of the same URL in
+    this run) or ``failed``. ``partial`` keeps the validators of an
+    interrupted transfer so the next run can resume it with ``If-Range``.
+    """
+
+    url: str
+    filename: str
+    status: str = "failed"
+    size: int = 0
+    transferred: int = 0
+    sha256: str | None = None
+    etag: str | None = None
+    last_modified: str | None = None
+    seconds: float = 0.0
+    fetched_at: str = ""
+    duplicate_of: str | None = None
+    partial: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            key: value for key, value in asdict(self).items() if value not in (None, {})
+        }
+
+
+class HostLimiter:
+    """Per-host semaphores capping concurrent connections to one server."""
+
+    def __init__(self, per_host: int = MAX_CONNECTIONS_PER_HOST) -> None:
+        self.per_host = max(1, per_host)
+        self._semaphores: dict[str, threading.Semaphore] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[None]:
+        host = urllib.parse.urlparse(url).netloc.lower()
+        with self._lock:
+            semaphore = self._semaphores.setdefault(
+                host, threading.Semaphore(self.per_host)
+            )
+        with semaphore:
+            yield
+
+
+class ContentIndex:
+    """Files seen so far in a run keyed by SHA-256, used to dedupe downloads."""
+
+    def __init__(self) -> None:
+        self._paths: dict[str, pathlib.Path] = {}
+        self._lock = threading.Lock()
+
+    def claim(self, digest: str, path: pathlib.Path) -> pathlib.Path | None:
+        """Register ``path``; return an earlier file with the same content."""
+
+        with self._lock:
+            existing = self._paths.get(digest)
+            if existing is not None and existing != path and existing.exists():
+                return existing
+            self._paths[digest] = path
+            return None
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+
+def _read_part_meta(path: pathlib.Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_part_meta(path: pathlib.Path, meta: dict) -> None:
+    path.write_text(json.dumps({k: v for k, v in meta.items() if v is not None}))
+
+
+def _content_range_total(content_range: str) -> int | None:
+    total = content_range.rpartition("/")[2]
+    return int(total) if total.isdigit() else None
+
+
+def _resume_validator(partial: dict) -> str | None:
+    # If-Range needs a strong validator.
+    etag = partial.get("etag")
+    if isinstance(etag, str) and etag and not etag.startswith("W/"):
+        return etag
+    last_modified = partial.get("last_modified")
+    return last_modified if isinstance(last_modified, str) else None
+
+
+def fetch_source(
+    url: str,
+    dest: pathlib.Path,
+    previous: dict | None = None,
+    *,
+    limiter: HostLimiter | None = None,
+) -> SourceRecord:
+    """Fetch ``url`` into ``dest`` and describe the outcome.
+
+    ``previous`` is the URL's entry from the last manifest: its validators
+    make the request conditional when ``dest`` exists, and its ``partial``
+    validators resume a leftover ``.part`` file. Network errors and local
+    ``OSError`` failures are reported on stderr and recorded as ``failed``.
+    """
+
+    previous = previous or {}
+    started = time.monotonic()
+    record = SourceRecord(url=url, filename=dest.name, fetched_at=_now_iso())
+    part = dest.with_name(dest.name + PART_SUFFIX)
+    part_meta = dest.with_name(dest.name + PART_META_SUFFIX)
+    headers = {"User-Agent": USER_AGENT}
+    offset = 0
+    partial = _read_part_meta(part_meta)
+    if partial.get("url") != url:
+        partial = previous.get("partial") or {}
+    resume_from = _resume_validator(partial)
+    if part.exists() and partial:
+        # Without a strong validator the Content-Range checks below decide
+        # whether the server's bytes continue the part file.
+        offset = part.stat().st_size
+        headers["Range"] = f"bytes={offset}-"
+        if resume_from:
+            headers["If-Range"] = resume_from
+    elif dest.exists():
+        if previous.get("etag"):
+            headers["If-None-Match"] = previous["etag"]
+        if previous.get("last_modified"):
+            headers["If-Modified-Since"] = previous["last_modified"]
+
+    restart = False
+    try:
+        with limiter.slot(url) if limiter else nullcontext():
+            req = urllib.request.Request(url, headers=headers)
+            try:
+                resp = urllib.request.urlopen(req, timeout=URL_TIMEOUT)
+            except urllib.error.HTTPError as exc:
+                if exc.code == 304 and dest.exists():
+                    record.status = "not_modified"
+                    record.size = dest.stat().st_size
+                    record.sha256 = previous.get("sha256")
+                    record.etag = exc.headers.get("ETag") or previous.get("etag")
+                    record.last_modified = exc.headers.get(
+                        "Last-Modified"
+                    ) or previous.get("last_modified")
+                    return record
+                if exc.code == 416:
+                    # The leftover part no longer fits the resource; start over.
+                    part.unlink(missing_ok=True)
+                    part_meta.unlink(missing_ok=True)
+                raise
+            with resp:
+                status = getattr(resp, "status", 200)
+                content_range = resp.headers.get("Content-Range") or ""
+                total = _content_range_total(content_range)
+                continues_part = (
+                    "Range" in headers
+                    and content_range.startswith(f"bytes {offset}-")
+                    and (
+                        resume_from is not None
+                        or not partial.get("size")
+                        or total == partial["size"]
+                    )
+                )
+                if status == 206 and not continues_part:
+                    if "Range" not in headers:
+                        raise http.client.HTTPException(
+                            f"unexpected partial response ({content_range!r})"
+                        )
+                    restart = True
+                else:
+                    resumed = status == 206
+                    record.etag = resp.headers.get("ETag")
+                    record.last_modified = resp.headers.get("Last-Modified")
+                    length = resp.headers.get("Content-Length") or ""
+                    _write_part_meta(
+                        part_meta,
+                        {
+                            "url": url,
+                            "etag": record.etag,
+                            "last_modified": record.last_modified,
+                            "size": (
+                                total
+                                if resumed
+                                else int(length) if length.isdigit() else None
+                            ),
+                        },
+                    )
+                    digest = hashlib.sha256()
+                    if resumed:
+                        with part.open("rb") as fh:
+                            while chunk := fh.read(CHUNK_SIZE):
+                                digest.update(chunk)
+                    else:
+                        offset = 0
+                    with part.open("ab" if resumed else "wb") as fh:
+                        while chunk := resp.read(CHUNK_SIZE):
+                            fh.write(chunk)
+                            digest.update(chunk)
+                            record.transferred += len(chunk)
+                    # read() returns b"" when the connection drops early.
+                    if length.isdigit() and record.transferred < int(length):
+                        raise http.client.IncompleteRead(
+                            b"", int(length) - record.transferred
+                        )
+            if not restart:
+                os.replace(part, dest)
+                part_meta.unlink(missing_ok=True)
+    except (urllib.error.URLError, http.client.HTTPException, OSError) as exc:
+        print(f"Failed to download {url}: {exc}", file=sys.stderr)
+        validators = {
+            key: value
+            for key, value in (
+                ("etag", record.etag),
+                ("last_modified", record.last_modified),
+            )
+            if value
+        }
+        record.status = "failed"
+        record.error = str(exc)
+        if part.exists():
+            record.partial = validators or dict(previous.get("partial") or {})
+        record.etag = previous.get("etag")
+        record.last_modified = previous.get("last_modified")
+        record.sha256 = previous.get("sha256")
+        record.size = dest.stat().st_size if dest.exists() else 0
+        return record
+    finally:
+        record.seconds = round(time.monotonic() - started, 3)
+
+    if restart:
+        # The server answered the resume with a range that does not continue
+        # the part file; discard it and fetch the whole body instead.
+        part.unlink(missing_ok=True)
+        part_meta.unlink(missing_ok=True)
+        return fetch_source(url, dest, {**previous, "partial": {}}, limiter=limiter)
+    record.status = "resumed" if offset else "downloaded"
+    record.size = dest.stat().st_size
+    record.sha256 = digest.hexdigest()
+    return record
 
 
 def download_url(url: str, dest: pathlib.Path) -> bool:
     """Download a single URL to ``dest``.
 
     Uses a ``10s`` timeout and returns ``True`` on success, ``False`` on any
-    network ``URLError`` or local ``OSError`` such as a write failure.
+    network ``URLError`` or local ``OSError`` such as a write failure. See
+    :func:`fetch_source` for the manifest record behind the result.
+    """
+    return fetch_source(url, dest).status != "failed"
+
+
+class SourceDownloader:
+    """Concurrent, resumable downloads sharing host limits and a content index."""
+
+    def __init__(
+        self,
+        max_workers: int = MAX_WORKERS,
+        per_host: int = MAX_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.limiter = HostLimiter(per_host)
+        self.content = ContentIndex()
+
+    def _dedupe(self, record: SourceRecord, dest: pathlib.Path) -> None:
+        if record.sha256 is None or not dest.exists():
+            return
+        existing = self.content.claim(record.sha256, dest)
+        if existing is None:
+            return
+        record.duplicate_of = os.path.relpath(existing, dest.parent)
+        if record.status == "not_modified" or os.path.samefile(existing, dest):
+            return
+        _link_or_copy(existing, dest, copy=False)
+
+    def _fetch(
+        self, url: str, dest: pathlib.Path, previous: dict | None, started: float
+    ) -> tuple[SourceRecord, float]:
+        record = fetch_source(url, dest, previous, limiter=self.limiter)
+        self._dedupe(record, dest)
+        return record, time.monotonic() - started
+
+    def _reuse(
+        self,
+        fetched: SourceRecord,
+        source: pathlib.Path,
+        dest: pathlib.Path,
+        previous: dict | None,
+    ) -> SourceRecord:
+        """Record for a URL this run already fetched into ``source``."""
+
+        previous = previous or {}
+        record = SourceRecord(
+            url=fetched.url,
+            filename=dest.name,
+            fetched_at=fetched.fetched_at,
+            etag=fetched.etag,
+            last_modified=fetched.last_modified,
+            sha256=fetched.sha256,
+            duplicate_of=os.path.relpath(source, dest.parent),
+        )
+        if fetched.status == "failed" or not source.exists():
+            record.status = "failed"
+            record.error = fetched.error
+            record.duplicate_of = None
+            record.etag = previous.get("etag")
+            record.last_modified = previous.get("last_modified")
+            record.sha256 = previous.get("sha256")
+        elif dest.exists() and previous.get("sha256") == fetched.sha256:
+            record.status = "not_modified"
+        else:
+            _link_or_copy(source, dest)
+            record.status = "linked"
+        record.size = dest.stat().st_size if dest.exists() else 0
+        return record
+
+    def download_all(
+        self, jobs: list[tuple[list[str], pathlib.Path]]
+    ) -> list[tuple[dict[str, str], list[SourceRecord], float]]:
+        """Fetch every ``(urls, dest_dir)`` job on one shared thread pool.
+
+        Returns the mapping, manifest records and elapsed seconds of each job.
+        A URL listed in several jobs is fetched once, preferring a directory
+        whose manifest already knows its hash so it can be revalidated, and
+        the other directories get a link to that file.
+        """
+
+        started = time.monotonic()
+        plans = []
+        for urls, dest_dir in jobs:
+            dest_dir.mkdir(parents=True, exist_ok=True)
+            previous = _load_manifest(dest_dir)
+            plans.append((urls, dest_dir, previous, _assign_filenames(urls, previous)))
+
+        owners: dict[str, tuple[pathlib.Path, dict | None, bool]] = {}
+        for urls, dest_dir, previous, filenames in plans:
+            for url in urls:
+                dest = dest_dir / filenames[url]
+                entry = previous.get(url)
+                known = bool(entry and entry.get("sha256") and dest.exists())
+                if url not in owners or (known and not owners[url][2]):
+                    owners[url] = (dest, entry, known)
+
+        fetched: dict[str, tuple[SourceRecord, float]] = {}
+        if owners:
+            workers = min(self.max_workers, len(owners))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                futures = {
+                    url: pool.submit(self._fetch, url, dest, entry, started)
+                    for url, (dest, entry, _) in owners.items()
+                }
+                fetched = {url: future.result() for url, future in futures.items()}
+
+        results = []
+        for urls, dest_dir, previous, filenames in plans:
+            records: list[SourceRecord] = []
+            seconds = 0.0
+            for url in urls:
+                dest = dest_dir / filenames[url]
+                record, finished = fetched[url]
+                owner_dest = owners[url][0]
+                if owner_dest != dest:
+                    record = self._reuse(record, owner_dest, dest, previous.get(url))
+                seconds = max(seconds, finished)
+                records.append(record)
+            mapping = {
+                record.url: record.filename
+                for record in records
+                if (dest_dir / record.filename).exists()
+            }
+            results.append((mapping, records, seconds))
+        return results
+
+    def download(
+        self, urls: list[str], dest_dir: pathlib.Path
+    ) -> tuple[dict[str, str], list[SourceRecord]]:
+        """Fetch ``urls`` into ``dest_dir``; return the mapping and manifest records."""
+
+        mapping, records, _ = self.download_all([(urls, dest_dir)])[0]
+        return mapping, records
+
+
+def _link_or_copy(
+    existing: pathlib.Path, dest: pathlib.Path, *, copy: bool = True
+) -> None:
+    """Replace ``dest`` with a hard link to ``existing``.
+
+    Where hard links are unavailable (e.g. across filesystems) ``dest`` gets a
+    copy instead, or is left alone when ``copy`` is false.
     """
+
+    link = dest.with_name(dest.name + ".link")
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-        with urllib.request.urlopen(req, timeout=URL_TIMEOUT) as resp:
-            dest.write_bytes(resp.read())
-        return True
-    except (urllib.error.URLError, OSError) as exc:
-        print(f"Failed to download {url}: {exc}", file=sys.stderr)
-        return False
+        link.unlink(missing_ok=True)
+        try:
+            os.link(existing, link)
+        except OSError:
+            if not copy:
+                raise
+            shutil.copyfile(existing, link)
+        os.replace(link, dest)
+    except OSError:
+        link.unlink(missing_ok=True)
+
+
+def _load_manifest(dest_dir: pathlib.Path) -> dict[str, dict]:
+    """Entries of the previous ``manifest.json`` in ``dest_dir`` keyed by URL."""
+
+    try:
+        data = json.loads((dest_dir / MANIFEST_NAME).read_text())
+        return {
+            entry["url"]: entry
+            for entry in data.get("sources", [])
+            if isinstance(entry, dict) and isinstance(entry.get("url"), str)
+        }
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _write_manifest(
+    dest_dir: pathlib.Path, records: list[SourceRecord], seconds: float
+) -> None:
+    counts: dict[str, int] = {}
+    for record in records:
+        counts[record.status] = counts.get(record.status, 0) + 1
+    manifest = {
+        "updated_at": _now_iso(),
+        "seconds": round(seconds, 3),
+        "counts": counts,
+        "sources": [record.to_dict() for record in records],
+    }
+    tmp_path = dest_dir / (MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2) + "\n")
+    tmp_path.replace(dest_dir / MANIFEST_NAME)
+
+
+def _assign_filenames(urls: list[str], previous: dict[str, dict]) -> dict[str, str]:
+    """Keep each URL's previous file and number new URLs by list position.
+
+    A URL that moved in the list keeps its file, so renumbering never makes
+    one source's file stand in for another's.
+    """
+
+    names: dict[str, str] = {}
+    taken: set[str] = set()
+    for url in urls:
+        filename = (previous.get(url) or {}).get("filename")
+        if isinstance(filename, str) and filename and filename not in taken:
+            names[url] = filename
+            taken.add(filename)
+    for idx, url in enumerate(urls, start=1):
+        if url in names:
+            continue
+        ext = pathlib.Path(urllib.parse.urlparse(url).path).suffix
+        number = idx
+        while f"{number}{ext}" in taken:
+            number += len(urls)
+        names[url] = f"{number}{ext}"
+        taken.add(names[url])
+    return names
+
 
+@dataclass
+class SourceJob:
+    """One URL list with its download directory and ``sources.json`` path."""
 
-def process_video_dir(video_dir: pathlib.Path) -> None:
+    urls: list[str]
+    dest_dir: pathlib.Path
+    mapping_path: pathlib.Path
+
+
+def _video_job(video_dir: pathlib.Path) -> SourceJob | None:
     sources_file = video_dir / "sources.txt"
     if not sources_file.exists():
-        return
-
-    sources_dir = video_dir / "sources"
-    sources_dir.mkdir(exist_ok=True)
+        return None
     urls = _filter_urls(sources_file.read_text().splitlines())
-    mapping = _download_sources(urls, sources_dir)
+    return SourceJob(urls, video_dir / "sources", video_dir / "sources.json")
 
-    (video_dir / "sources.json").write_text(json.dumps(mapping, indent=2) + "\n")
+
+def _run_jobs(
+    jobs: list[SourceJob], downloader: SourceDownloader | None = None
+) -> list[dict[str, str]]:
+    """Download every job on one shared pool, then write manifests and mappings."""
+
+    downloader = downloader or SourceDownloader()
+    results = downloader.download_all([(job.urls, job.dest_dir) for job in jobs])
+    for job, (mapping, records, seconds) in zip(jobs, results, strict=True):
+        _write_manifest(job.dest_dir, records, seconds)
+        job.mapping_path.write_text(json.dumps(mapping, indent=2) + "\n")
+    return [mapping for mapping, _, _ in results]
+
+
+def process_video_dir(
+    video_dir: pathlib.Path, downloader: SourceDownloader | None = None
+) -> None:
+    job = _video_job(video_dir)
+    if job is not None:
+        _run_jobs([job], downloader)
 
 
 def _filter_urls(lines: Iterable[str]) -> list[str]:
-    return [
+    urls = [
         line.strip()
         for line in lines
         if line.strip() and not line.strip().startswith("#")
     ]
+    return list(dict.fromkeys(urls))
 
 
-def _download_sources(urls: Iterable[str], dest_dir: pathlib.Path) -> dict[str, str]:
-    mapping: dict[str, str] = {}
-    dest_dir.mkdir(exist_ok=True)
-    for idx, url in enumerate(urls, start=1):
-        parsed = urllib.parse.urlparse(url)
-        ext = pathlib.Path(parsed.path).suffix
-        filename = f"{idx}{ext}"
-        dest = dest_dir / filename
-        if dest.exists() or download_url(url, dest):
-            mapping[url] = dest.name
+def _download_sources(
+    urls: Iterable[str],
+    dest_dir: pathlib.Path,
+    downloader: SourceDownloader | None = None,
+) -> dict[str, str]:
+    downloader = downloader or SourceDownloader()
+    mapping, records, seconds = downloader.download_all([(list(urls), dest_dir)])[0]
+    _write_manifest(dest_dir, records, seconds)
     return mapping
 
 
@@ -89,26 +596,44 @@ def _resolve_global_sources_dir(dest_dir: pathlib.Path | None = None) -> pathlib
     return GLOBAL_SOURCES_DIR
 
 
+def _global_job(
+    source_file: pathlib.Path | None = None, dest_dir: pathlib.Path | None = None
+) -> SourceJob | None:
+    source_path = _resolve_source_urls_file(source_file)
+    if not source_path.exists():
+        return None
+    urls = _filter_urls(source_path.read_text().splitlines())
+    target_dir = _resolve_global_sources_dir(dest_dir)
+    return SourceJob(urls, target_dir, target_dir / "sources.json")
+
+
 def process_global_sources(
     source_file: pathlib.Path | None = None,
     dest_dir: pathlib.Path | None = None,
+    downloader: SourceDownloader | None = None,
 ) -> dict[str, str]:
-    source_path = _resolve_source_urls_file(source_file)
-    if not source_path.exists():
+    job = _global_job(source_file, dest_dir)
+    if job is None:
         return {}
-    urls = _filter_urls(source_path.read_text().splitlines())
-    target_dir = _resolve_global_sources_dir(dest_dir)
-    mapping = _download_sources(urls, target_dir)
-    output = target_dir / "sources.json"
-    output.write_text(json.dumps(mapping, indent=2) + "\n")
-    return mapping
+    return _run_jobs([job], downloader)[0]
 
 
 def main() -> None:
-    process_global_sources()
-    for path in VIDEO_ROOT.iterdir():
-        if path.is_dir() and path.name != "__pycache__":
-            process_video_dir(path)
+    # Every list shares one pool so a slow download for one video never
+    # delays the others, and host limits and dedup span the whole run.
+    jobs = [
+        job
+        for job in (
+            _global_job(),
+            *(
+                _video_job(path)
+                for path in sorted(VIDEO_ROOT.iterdir())
+                if path.is_dir() and path.name != "__pycache__"
+            ),
+        )
+        if job is not None
+    ]
+    _run_jobs(jobs)
 
 
 if __name__ == "__main__":
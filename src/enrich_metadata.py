@@ -6,19 +6,40 @@ import argparse
 import json
 import os
 import pathlib
-import re
 import sys
 from dataclasses import dataclass
 from datetime import datetime
 from typing import Iterable, Sequence
-import urllib.parse
-import urllib.request
+
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+    from youtube_data_client import (  # type: ignore[import-not-found]  # noqa: F401
+        API_PARTS,
+        CACHE_ENV,
+        DEFAULT_CACHE_PATH,
+        DEFAULT_MAX_WORKERS,
+        QuotaBudget,
+        VideoDetails,
+        VideoResponseCache,
+        YouTubeDataClient,
+        parse_duration,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from .youtube_data_client import (  # noqa: F401
+        API_PARTS,
+        CACHE_ENV,
+        DEFAULT_CACHE_PATH,
+        DEFAULT_MAX_WORKERS,
+        QuotaBudget,
+        VideoDetails,
+        VideoResponseCache,
+        YouTubeDataClient,
+        parse_duration,
+    )
 
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
 VIDEO_ROOT = BASE_DIR / "video_scripts"
 ENV_VAR = "YOUTUBE_API_KEY"
-API_PARTS = ("snippet", "contentDetails", "statistics")
-API_URL = "https://www.googleapis.com/youtube/v3/videos?part={parts}&id={ids}&key={key}"
 
 
 @dataclass(frozen=True)
@@ -32,34 +53,6 @@ class VideoInfo:
     view_count: int
 
 
-_DURATION_RE = re.compile(
-    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
-)
-
-
-def parse_duration(value: str) -> int:
-    """Return the number of seconds represented by an ISO-8601 duration string."""
-
-    if not value:
-        return 0
-    match = _DURATION_RE.match(value)
-    if not match:
-        return 0
-    parts = {name: match.group(name) for name in _DURATION_RE.groupindex}
-    total = 0
-    if parts.get("weeks"):
-        total += int(parts["weeks"]) * 7 * 24 * 3600
-    if parts.get("days"):
-        total += int(parts["days"]) * 24 * 3600
-    if parts.get("hours"):
-        total += int(parts["hours"]) * 3600
-    if parts.get("minutes"):
-        total += int(parts["minutes"]) * 60
-    if parts.get("seconds"):
-        total += int(parts["seconds"])
-    return total
-
-
 def _extract_date(value: str) -> str | None:
     try:
         dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -68,81 +61,36 @@ def _extract_date(value: str) -> str | None:
     return dt.date().isoformat()
 
 
-def _chunked(items: Sequence[str], size: int) -> Iterable[list[str]]:
-    for i in range(0, len(items), size):
-        yield list(items[i : i + size])
+def _video_info(details: VideoDetails) -> VideoInfo:
+    thumbnail = details.thumbnail
+    if thumbnail and not thumbnail.startswith("http"):
+        thumbnail = ""
+    return VideoInfo(
+        title=details.title,
+        publish_date=_extract_date(details.published_at),
+        duration_seconds=details.duration_seconds,
+        thumbnail=thumbnail,
+        view_count=details.view_count,
+    )
 
 
 def fetch_video_metadata(
-    video_ids: Sequence[str], youtube_key: str
+    video_ids: Sequence[str],
+    youtube_key: str,
+    *,
+    cache: VideoResponseCache | None = None,
+    quota: QuotaBudget | None = None,
+    max_workers: int = DEFAULT_MAX_WORKERS,
 ) -> dict[str, VideoInfo]:
     """Fetch metadata for ``video_ids`` using the YouTube Data v3 API."""
 
-    results: dict[str, VideoInfo] = {}
     if not video_ids:
-        return results
-    for batch in _chunked(video_ids, 50):
-        ids = ",".join(batch)
-        url = API_URL.format(
-            parts=",".join(API_PARTS),
-            ids=urllib.parse.quote(ids, safe=","),
-            key=urllib.parse.quote(youtube_key, safe=""),
-        )
-        with urllib.request.urlopen(url) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        for item in data.get("items", []):
-            video_id = item.get("id")
-            if not isinstance(video_id, str):
-                continue
-            snippet = item.get("snippet") or {}
-            content = item.get("contentDetails") or {}
-            statistics = item.get("statistics") or {}
-            title = snippet.get("title") or ""
-            published_at = snippet.get("publishedAt")
-            publish_date = (
-                _extract_date(published_at) if isinstance(published_at, str) else None
-            )
-            duration_seconds = parse_duration(content.get("duration", ""))
-            thumbnails = snippet.get("thumbnails") or {}
-
-            def _select_thumbnail(data: dict) -> str:
-                if not isinstance(data, dict):
-                    return ""
-                preference = ["maxres", "standard", "high", "medium", "default"]
-                for key in preference:
-                    entry = data.get(key)
-                    if isinstance(entry, dict):
-                        url = entry.get("url")
-                        if isinstance(url, str) and url.strip():
-                            return url.strip()
-                    elif isinstance(entry, str) and entry.strip():
-                        return entry.strip()
-                for value in data.values():
-                    if isinstance(value, str) and value.strip():
-                        return value.strip()
-                    if isinstance(value, dict):
-                        url = value.get("url")
-                        if isinstance(url, str) and url.strip():
-                            return url.strip()
-                return ""
-
-            raw_view_count = statistics.get("viewCount", "0")
-            try:
-                view_count = int(str(raw_view_count))
-            except (TypeError, ValueError):
-                view_count = 0
-
-            thumbnail = _select_thumbnail(thumbnails)
-            if thumbnail and not thumbnail.startswith("http"):
-                thumbnail = ""
-            results[video_id] = VideoInfo(
-                title=title,
-                publish_date=publish_date,
-                duration_seconds=duration_seconds,
-                thumbnail=thumbnail,
-                view_count=view_count,
-            )
-    return results
+        return {}
+    with YouTubeDataClient(
+        youtube_key, cache=cache, quota=quota, max_workers=max_workers
+    ) as client:
+        details = client.fetch_videos(video_ids)
+    return {video_id: _video_info(info) for video_id, info in details.items()}
 
 
 def apply_updates(
@@ -230,6 +178,17 @@ def main(argv: Sequence[str] | None = None) -> int:
         action="store_true",
         help="Show which files would change without writing",
     )
+    parser.add_argument(
+        "--cache",
+        default=os.getenv(CACHE_ENV) or str(BASE_DIR / DEFAULT_CACHE_PATH),
+        help=f"ETag cache for API responses (env {CACHE_ENV})",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Concurrent API requests (50 videos each)",
+    )
     args = parser.parse_args(argv)
 
     youtube_key = os.getenv(ENV_VAR)
@@ -243,7 +202,14 @@ def main(argv: Sequence[str] | None = None) -> int:
         print("No metadata files with youtube_id found.")
         return 0
 
-    info_map = fetch_video_metadata(ids, youtube_key)
+    cache = VideoResponseCache(pathlib.Path(args.cache))
+    quota = QuotaBudget()
+    info_map = fetch_video_metadata(
+        ids, youtube_key, cache=cache, quota=quota, max_workers=args.max_workers
+    )
+    if not args.dry_run:
+        cache.save()
+    print(f"YouTube Data API: {quota.summary()}; {cache.summary()}")
     updated = apply_updates(paths, info_map, dry_run=args.dry_run)
 
     if args.dry_run:
@@ -5,11 +5,20 @@ from __future__ import annotations
 import argparse
 import json
 import pathlib
+import sys
 from typing import Any, Iterator
 
-import requests
-
-from . import github_auth
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+    import github_auth  # type: ignore[import-not-found]
+    from github_client import (  # type: ignore[import-not-found]
+        GitHubClient,
+        RateLimitBudget,
+        github_headers,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from . import github_auth
+    from .github_client import GitHubClient, RateLimitBudget, github_headers
 
 API_URL = "https://api.github.com/repos/{repo}/discussions"
 DEFAULT_CATEGORY = "Fact Check"
@@ -23,24 +32,29 @@ def fetch_discussions(
     per_page: int = 30,
     max_pages: int = 5,
     state: str | None = None,
-    timeout: int = 10,
+    timeout: float | None = None,
+    client: GitHubClient | None = None,
 ) -> Iterator[dict[str, Any]]:
-    """Yield discussion payloads from the GitHub REST API."""
-
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
+    """Yield discussion payloads from the GitHub REST API.
+
+    Pass a shared ``client`` to pace the pages by its rate-limit budget.
+    ``timeout`` defaults to 10 seconds, or to the ``client``'s own timeout.
+    """
+
+    headers = github_headers(token)
+    if client is None:
+        client = GitHubClient(timeout=10 if timeout is None else timeout)
+    elif timeout is not None:
+        # Same session, cache and budget; only the timeout differs.
+        client = GitHubClient(
+            client.session, cache=client.cache, budget=client.budget, timeout=timeout
+        )
 
     for page in range(1, max_pages + 1):
         params: dict[str, Any] = {"per_page": per_page, "page": page}
         if state:
             params["state"] = state
-        response = requests.get(
-            API_URL.format(repo=repo),
-            headers=headers,
-            params=params,
-            timeout=timeout,
-        )
+        response = client.get(API_URL.format(repo=repo), headers, params=params)
         response.raise_for_status()
         payload = response.json()
         if not isinstance(payload, list):
@@ -88,6 +102,7 @@ def build_fact_check_index(
     per_page: int = 30,
     max_pages: int = 5,
     output_path: pathlib.Path | None = None,
+    client: GitHubClient | None = None,
 ) -> list[dict[str, Any]]:
     """Return fact-check discussion metadata and optionally write JSON."""
 
@@ -100,6 +115,7 @@ def build_fact_check_index(
         per_page=per_page,
         max_pages=max_pages,
         state=state,
+        client=client,
     ):
         raw_category = (
             (discussion.get("category") or {}).get("name")
@@ -202,6 +218,7 @@ def main(argv: list[str] | None = None) -> int:
     args = parser.parse_args(argv)
 
     token = _resolve_token(args.token)
+    budget = RateLimitBudget()
     records = build_fact_check_index(
         repo=args.repo,
         token=token,
@@ -210,10 +227,12 @@ def main(argv: list[str] | None = None) -> int:
         per_page=args.per_page,
         max_pages=args.max_pages,
         output_path=args.output,
+        client=GitHubClient(budget=budget),
     )
     print(
         f"Fetched {len(records)} fact-check discussion(s) from {args.repo} in the {args.category!r} category"
     )
+    print(f"GitHub rate-limit budget: {budget.summary()}")
     return 0
 
 
@@ -0,0 +1,410 @@
+"""Shared GitHub API client used by the repository dashboards and exporters.
+
+``GitHubClient`` wraps a (optionally pooled) ``requests`` session with two
+optional helpers:
+
+* ``GitHubResponseCache`` replays ETag/Last-Modified validators so unchanged
+  resources come back as ``304 Not Modified``, which GitHub does not count
+  against the rate limit.
+* ``RateLimitBudget`` reads the ``X-RateLimit-*`` and ``Retry-After`` headers
+  of every response, waits for a reset when a bucket is empty, and refuses
+  low-priority calls that would eat into a reserve.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+from urllib.parse import urlencode
+
+import requests
+from requests.adapters import HTTPAdapter
+
+LOGGER = logging.getLogger(__name__)
+
+API_ROOT = "https://api.github.com"
+
+PRIORITY_NORMAL = "normal"
+PRIORITY_LOW = "low"
+
+# Remaining requests per bucket kept back from low-priority calls.
+DEFAULT_LOW_PRIORITY_RESERVE = {"core": 100, "search": 5, "graphql": 100}
+
+
+AdapterFactory = Callable[[int], HTTPAdapter]
+
+
+def _pooled_adapter(pool_size: int) -> HTTPAdapter:
+    return HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+
+# Transport adapter mounted by ``GitHubClient.pooled``; swapped by the offline
+# record/replay benchmark (``src.repo_status_replay``).
+_ADAPTER_FACTORY: ContextVar[AdapterFactory] = ContextVar(
+    "github_adapter_factory", default=_pooled_adapter
+)
+
+
+@contextmanager
+def use_adapter_factory(factory: AdapterFactory) -> Iterator[None]:
+    """Mount adapters built by ``factory`` on pooled clients created in the block."""
+
+    reset = _ADAPTER_FACTORY.set(factory)
+    try:
+        yield
+    finally:
+        _ADAPTER_FACTORY.reset(reset)
+
+
+class RateLimitDeferred(requests.exceptions.RequestException):
+    """A request was not sent because its rate-limit budget is spent."""
+
+
+def github_headers(token: str | None = None) -> dict[str, str]:
+    """Return GitHub REST headers with optional bearer-token auth."""
+
+    headers = {"Accept": "application/vnd.github+json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def rate_limit_resource(url: str) -> str:
+    """Name of the rate-limit bucket GitHub charges a request to."""
+
+    if url.startswith(f"{API_ROOT}/search/"):
+        return "search"
+    if url.startswith(f"{API_ROOT}/graphql"):
+        return "graphql"
+    return "core"
+
+
+@dataclass
+class RateLimitBucket:
+    """Last known state of one rate-limit resource plus this run's usage."""
+
+    limit: int | None = None
+    remaining: int | None = None
+    reset_at: float | None = None
+    requests: int = 0
+    deferred: int = 0
+    first_remaining: int | None = None
+
+
+class RateLimitBudget:
+    """Track GitHub rate-limit budgets from response headers and pace requests.
+
+    Before a request, :meth:`acquire` sleeps until the bucket's reset when it is
+    empty (or until a secondary-limit ``Retry-After`` passes), provided that is
+    at most ``max_wait`` seconds away; otherwise it raises
+    :class:`RateLimitDeferred`. Low-priority requests are also deferred while
+    the bucket is at or below its reserve.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_wait: float = 60.0,
+        low_priority_reserve: dict[str, int] | None = None,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_wait = max_wait
+        self.low_priority_reserve = (
+            DEFAULT_LOW_PRIORITY_RESERVE
+            if low_priority_reserve is None
+            else low_priority_reserve
+        )
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._blocked_until = 0.0
+        self.buckets: dict[str, RateLimitBucket] = {}
+
+    def acquire(self, resource: str, priority: str = PRIORITY_NORMAL) -> float:
+        """Reserve one request from ``resource``; return the seconds slept."""
+
+        with self._lock:
+            now = self._clock()
+            bucket = self.buckets.setdefault(resource, RateLimitBucket())
+            wait = max(0.0, self._blocked_until - now)
+            if bucket.remaining is not None and bucket.reset_at is not None:
+                if bucket.reset_at <= now:
+                    bucket.remaining = bucket.limit
+                elif priority == PRIORITY_LOW and bucket.remaining <= (
+                    self.low_priority_reserve.get(resource, 0)
+                ):
+                    bucket.deferred += 1
+                    raise RateLimitDeferred(
+                        f"GitHub {resource} budget reserved "
+                        f"({bucket.remaining} remaining)"
+                    )
+                elif bucket.remaining <= 0:
+                    wait = max(wait, bucket.reset_at - now)
+                    if wait <= self.max_wait:
+                        # Sleeping until the reset refills the bucket.
+                        bucket.remaining = bucket.limit
+            if wait > self.max_wait:
+                bucket.deferred += 1
+                raise RateLimitDeferred(
+                    f"GitHub {resource} rate limit exhausted for {wait:.0f}s"
+                )
+            if bucket.remaining is not None:
+                bucket.remaining -= 1
+            bucket.requests += 1
+        if wait > 0:
+            LOGGER.info("Waiting %.1fs for the GitHub %s rate limit", wait, resource)
+            self._sleep(wait)
+        return wait
+
+    def record(self, resource: str, response: Any) -> float | None:
+        """Update budgets from ``response``; return its ``Retry-After`` if throttled."""
+
+        headers = getattr(response, "headers", None) or {}
+        status = getattr(response, "status_code", 200)
+        with self._lock:
+            resource = headers.get("X-RateLimit-Resource") or resource
+            bucket = self.buckets.setdefault(resource, RateLimitBucket())
+            remaining = _header_int(headers, "X-RateLimit-Remaining")
+            if remaining is not None:
+                bucket.remaining = remaining
+                bucket.limit = _header_int(headers, "X-RateLimit-Limit")
+                reset = _header_int(headers, "X-RateLimit-Reset")
+                bucket.reset_at = float(reset) if reset is not None else None
+                if bucket.first_remaining is None:
+                    bucket.first_remaining = remaining + 1
+            if status not in (403, 429):
+                return None
+            retry_after = _header_int(headers, "Retry-After")
+            if retry_after is None:
+                return None
+            self._blocked_until = max(self._blocked_until, self._clock() + retry_after)
+            return float(retry_after)
+
+    def summary(self) -> str:
+        with self._lock:
+            parts = []
+            for name, bucket in sorted(self.buckets.items()):
+                part = f"{name}: {bucket.requests} requests"
+                if bucket.remaining is not None:
+                    part += f", {bucket.remaining}/{bucket.limit} remaining"
+                if bucket.first_remaining is not None and bucket.remaining is not None:
+                    part += f", {bucket.first_remaining - bucket.remaining} consumed"
+                if bucket.deferred:
+                    part += f", {bucket.deferred} deferred"
+                parts.append(part)
+        return "; ".join(parts) or "no requests"
+
+
+def _header_int(headers: Any, name: str) -> int | None:
+    value = headers.get(name)
+    try:
+        return int(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+class GitHubResponseCache:
+    """ETag/Last-Modified cache for GitHub GET responses, keyed by URL.
+
+    Cached validators are replayed as ``If-None-Match``/``If-Modified-Since``;
+    a ``304 Not Modified`` answer (which GitHub does not count against the rate
+    limit) is served from the stored body. Only URLs requested during the run
+    are written back by :meth:`save`, so paginated URLs that fall out of use do
+    not accumulate.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, str]] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+        self.stats = {"not_modified": 0, "stored": 0, "uncached": 0}
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable GitHub HTTP cache %s: %s", path, exc)
+            return
+        if isinstance(data, dict):
+            self._entries = {
+                url: entry
+                for url, entry in data.items()
+                if isinstance(entry, dict) and isinstance(entry.get("body"), str)
+            }
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        with self._lock:
+            self._used.add(url)
+            entry = self._entries.get(url)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def not_modified(self, url: str) -> requests.Response | None:
+        """Rebuild the cached response for ``url`` after a 304."""
+
+        with self._lock:
+            entry = self._entries.get(url)
+            if entry is None:
+                return None
+            self.stats["not_modified"] += 1
+        response = requests.Response()
+        response.status_code = 200
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = entry["body"].encode("utf-8")
+        return response
+
+    def store(self, url: str, response: requests.Response) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        with self._lock:
+            if response.status_code != 200 or not (etag or last_modified):
+                self.stats["uncached"] += 1
+                return
+            entry = {"body": response.text}
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["last_modified"] = last_modified
+            self._entries[url] = entry
+            self.stats["stored"] += 1
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                url: self._entries[url]
+                for url in sorted(self._used & set(self._entries))
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def summary(self) -> str:
+        stats = self.stats
+        total = sum(stats.values())
+        return (
+            f"{total} requests: {stats['not_modified']} not modified (304), "
+            f"{stats['stored']} refreshed, {stats['uncached']} uncacheable"
+        )
+
+
+class GitHubClient:
+    """GitHub HTTP client combining a session, response cache and budget.
+
+    Without a session the module-level ``requests`` functions are used, which
+    keeps one-off callers (and tests that patch ``requests.get``) working.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        *,
+        cache: GitHubResponseCache | None = None,
+        budget: RateLimitBudget | None = None,
+        timeout: float = 10,
+    ) -> None:
+        self.session = session
+        self.cache = cache
+        self.budget = budget
+        self.timeout = timeout
+
+    @classmethod
+    def pooled(cls, pool_size: int, **kwargs: Any) -> GitHubClient:
+        """Client with a session whose connection pool fits ``pool_size`` threads."""
+
+        session = requests.Session()
+        session.mount("https://", _ADAPTER_FACTORY.get()(pool_size))
+        return cls(session, **kwargs)
+
+    def close(self) -> None:
+        if self.session is not None:
+            self.session.close()
+
+    def __enter__(self) -> GitHubClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _send(
+        self, method: str, url: str, headers: dict[str, str], **kwargs: Any
+    ) -> requests.Response:
+        sender = self.session if self.session is not None else requests
+        response: requests.Response = getattr(sender, method)(
+            url, headers=headers, timeout=self.timeout, **kwargs
+        )
+        return response
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        priority: str,
+        **kwargs: Any,
+    ) -> requests.Response:
+        resource = rate_limit_resource(url)
+        for attempt in range(2):
+            if self.budget is not None:
+                self.budget.acquire(resource, priority)
+            response = self._send(method, url, headers, **kwargs)
+            if self.budget is None:
+                return response
+            retry_after = self.budget.record(resource, response)
+            # One retry after a secondary-limit Retry-After; acquire() waits.
+            if retry_after is None or attempt:
+                return response
+        return response  # pragma: no cover - loop always returns
+
+    def get(
+        self,
+        url: str,
+        headers: dict[str, str],
+        *,
+        params: dict[str, Any] | None = None,
+        priority: str = PRIORITY_NORMAL,
+    ) -> requests.Response:
+        extra: dict[str, Any] = {} if params is None else {"params": params}
+        if self.cache is None:
+            return self._request("get", url, headers, priority, **extra)
+        key = url
+        if params:
+            key += ("&" if "?" in url else "?") + urlencode(params)
+        conditional = {**headers, **self.cache.conditional_headers(key)}
+        response = self._request("get", url, conditional, priority, **extra)
+        if response.status_code == 304:
+            cached = self.cache.not_modified(key)
+            if cached is not None:
+                return cached
+            response = self._request("get", url, headers, priority, **extra)
+        self.cache.store(key, response)
+        return response
+
+    def post(
+        self,
+        url: str,
+        headers: dict[str, str],
+        payload: dict[str, Any],
+        *,
+        priority: str = PRIORITY_NORMAL,
+    ) -> requests.Response:
+        return self._request("post", url, headers, priority, json=payload)
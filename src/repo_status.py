@@ -8,17 +8,42 @@ completed successfully, failed, or hasn't completed.
 
 from __future__ import annotations
 
+import contextvars
+import json
 import logging
 import os
 import re
-from collections.abc import Iterable
+import sys
+import threading
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field, replace
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from itertools import count
 from pathlib import Path
 
 import requests
 
+if __package__ in {None, ""}:
+    sys.path.append(str(Path(__file__).resolve().parent))
+    from github_client import (  # type: ignore[import-not-found]
+        PRIORITY_LOW,
+        PRIORITY_NORMAL,
+        GitHubClient,
+        GitHubResponseCache,
+        RateLimitBudget,
+        github_headers,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from .github_client import (
+        PRIORITY_LOW,
+        PRIORITY_NORMAL,
+        GitHubClient,
+        GitHubResponseCache,
+        RateLimitBudget,
+        github_headers,
+    )
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -37,6 +62,11 @@ class RepoMetadata:
     default_branch: str | None = None
     stars: int | None = None
     merged_prs: int | None = None
+    # First page of default-branch commits in REST shape, when a batch query
+    # already returned it (see ``fetch_repo_metadata_batch``).
+    head_commits: tuple[dict, ...] | None = field(
+        default=None, compare=False, repr=False
+    )
 
 
 @dataclass(frozen=True)
@@ -98,6 +128,25 @@ SELF_STATUS_WORKFLOW_NAME = "update repo statuses"
 # skipping past skip-worthy (e.g. bot-authored) commits before giving up.
 COMMIT_LOOKBACK_MAX_PAGES = 10
 
+# Repositories refreshed in parallel by ``fetch_repo_statuses``; also the size
+# of the shared connection pool.
+REPO_STATUS_MAX_WORKERS = 8
+
+# Repositories per aliased GraphQL metadata query.
+GRAPHQL_BATCH_SIZE = 25
+GRAPHQL_URL = "https://api.github.com/graphql"
+
+# Conditional-request cache persisted between hourly runs (see ``update_readme``).
+HTTP_CACHE_ENV = "REPO_STATUS_HTTP_CACHE"
+DEFAULT_HTTP_CACHE_PATH = Path(".cache/repo_status/http.json")
+
+# Per-repo fingerprints and rendered statuses from the previous run; repos whose
+# fingerprint is unchanged skip the commit/run walk (see ``RepoStatusState``).
+STATE_ENV = "REPO_STATUS_STATE"
+DEFAULT_STATE_PATH = Path(".cache/repo_status/state.json")
+# Reused statuses older than this are walked again regardless of fingerprint.
+STATE_MAX_AGE = timedelta(hours=24)
+
 
 def _is_self_status_workflow_run(run: dict) -> bool:
     """Return whether ``run`` belongs to this dashboard-updater workflow itself.
@@ -117,6 +166,26 @@ def _is_self_status_workflow_run(run: dict) -> bool:
     return False
 
 
+def _should_skip_commit(commit: dict) -> bool:
+    """Whether ``commit`` is bot-authored or marked skip-worthy for CI lookback."""
+
+    message = commit.get("commit", {}).get("message", "")
+    if SKIP_COMMIT_RE.search(message):
+        return True
+    for key in ("author", "committer"):
+        login = (commit.get(key) or {}).get("login")
+        raw_identity = commit.get("commit", {}).get(key) or {}
+        name = raw_identity.get("name")
+        email = raw_identity.get("email")
+        if isinstance(login, str) and login.endswith("[bot]"):
+            return True
+        if isinstance(name, str) and name.endswith("[bot]"):
+            return True
+        if isinstance(email, str) and email.strip().lower() in BOT_COMMIT_EMAILS:
+            return True
+    return False
+
+
 def status_to_emoji(conclusion: str | None) -> str:
     """Return an emoji representing the run conclusion.
 
@@ -417,21 +486,55 @@ def _latest_completed_runs_by_workflow(runs: Iterable[dict]) -> list[dict]:
 def _github_headers(token: str | None = None) -> dict[str, str]:
     """Return GitHub REST headers with optional bearer-token auth."""
 
-    headers = {"Accept": "application/vnd.github+json"}
-    if token:
-        headers["Authorization"] = f"Bearer {token}"
-    return headers
+    return github_headers(token)
+
+
+@dataclass
+class GitHubTransport:
+    """Shared client and prefetched metadata for one ``fetch_repo_statuses`` batch."""
+
+    client: GitHubClient
+    # Metadata prefetched for the batch by ``fetch_repo_metadata_batch``.
+    metadata: dict[str, RepoMetadata] = field(default_factory=dict)
+
+
+# Transport used by ``_github_get`` while ``fetch_repo_statuses`` runs.
+_ACTIVE_TRANSPORT: contextvars.ContextVar[GitHubTransport | None] = (
+    contextvars.ContextVar("repo_status_transport", default=None)
+)
+
+
+def _github_post(url: str, headers: dict[str, str], payload: dict) -> requests.Response:
+    """POST JSON ``payload`` through the current batch's client, if any."""
+
+    transport = _ACTIVE_TRANSPORT.get()
+    if transport is None:
+        return requests.post(url, headers=headers, json=payload, timeout=10)
+    return transport.client.post(url, headers, payload)
+
+
+def _github_get(
+    url: str, headers: dict[str, str], *, priority: str = PRIORITY_NORMAL
+) -> requests.Response:
+    """GET ``url`` through the current batch's client, if any."""
+
+    transport = _ACTIVE_TRANSPORT.get()
+    if transport is None:
+        return requests.get(url, headers=headers, timeout=10)
+    return transport.client.get(url, headers, priority=priority)
 
 
 def fetch_merged_pr_count(repo: str, token: str | None = None) -> int | None:
     """Fetch the total merged pull request count for ``repo`` without raising."""
 
     try:
-        resp = requests.get(
+        # Search has a 30/min budget; the README keeps its previous count when
+        # this low-priority lookup is deferred.
+        resp = _github_get(
             "https://api.github.com/search/issues?"
             f"q=repo:{repo}+is:pr+is:merged&per_page=1",
-            headers=_github_headers(token),
-            timeout=10,
+            _github_headers(token),
+            priority=PRIORITY_LOW,
         )
         resp.raise_for_status()
         data = resp.json()
@@ -455,15 +558,21 @@ def fetch_merged_pr_count(repo: str, token: str | None = None) -> int | None:
 
 
 def fetch_repo_metadata(repo: str, token: str | None = None) -> RepoMetadata:
-    """Fetch default branch, star count, and merged PR count without raising."""
+    """Fetch default branch, star count, and merged PR count without raising.
+
+    Inside ``fetch_repo_statuses`` the GraphQL batch result is used when it
+    covers ``repo``; otherwise this falls back to the REST and Search APIs.
+    """
+
+    transport = _ACTIVE_TRANSPORT.get()
+    if transport is not None and repo in transport.metadata:
+        return transport.metadata[repo]
 
     headers = _github_headers(token)
     merged_prs = fetch_merged_pr_count(repo, token)
 
     try:
-        repo_resp = requests.get(
-            f"https://api.github.com/repos/{repo}", headers=headers, timeout=10
-        )
+        repo_resp = _github_get(f"https://api.github.com/repos/{repo}", headers)
         repo_resp.raise_for_status()
         repo_data = repo_resp.json()
     except (requests.exceptions.RequestException, ValueError) as exc:
@@ -487,6 +596,119 @@ def fetch_repo_metadata(repo: str, token: str | None = None) -> RepoMetadata:
     )
 
 
+_GRAPHQL_COMMIT_FIELDS = "name email user { login }"
+
+
+def _graphql_repo_query(count: int) -> str:
+    """Aliased query for ``count`` repositories, parameterised by owner/name."""
+
+    params = ", ".join(f"$o{i}: String!, $n{i}: String!" for i in range(count))
+    fields = "\n".join(f"""  r{i}: repository(owner: $o{i}, name: $n{i}) {{
+    stargazerCount
+    pullRequests(states: MERGED) {{ totalCount }}
+    defaultBranchRef {{
+      name
+      target {{
+        ... on Commit {{
+          history(first: 20) {{
+            nodes {{
+              oid
+              message
+              author {{ {_GRAPHQL_COMMIT_FIELDS} }}
+              committer {{ {_GRAPHQL_COMMIT_FIELDS} }}
+            }}
+          }}
+        }}
+      }}
+    }}
+  }}""" for i in range(count))
+    return f"query({params}) {{\n{fields}\n}}"
+
+
+def _rest_commit_from_graphql(node: dict) -> dict:
+    """Reshape a GraphQL commit node like a REST ``/commits`` list item."""
+
+    commit: dict = {"sha": node.get("oid"), "commit": {"message": node.get("message")}}
+    for key in ("author", "committer"):
+        actor = node.get(key) or {}
+        commit["commit"][key] = {"name": actor.get("name"), "email": actor.get("email")}
+        user = actor.get("user")
+        commit[key] = {"login": user.get("login")} if isinstance(user, dict) else None
+    return commit
+
+
+def _metadata_from_graphql(data: dict) -> RepoMetadata | None:
+    branch_ref = data.get("defaultBranchRef")
+    if not isinstance(branch_ref, dict) or not branch_ref.get("name"):
+        return None
+    stars = data.get("stargazerCount")
+    merged = (data.get("pullRequests") or {}).get("totalCount")
+    history = ((branch_ref.get("target") or {}).get("history") or {}).get("nodes")
+    return RepoMetadata(
+        default_branch=branch_ref["name"],
+        stars=stars if type(stars) is int else None,
+        merged_prs=merged if type(merged) is int else None,
+        head_commits=(
+            tuple(_rest_commit_from_graphql(node) for node in history)
+            if isinstance(history, list)
+            else None
+        ),
+    )
+
+
+def fetch_repo_metadata_batch(
+    repos: Sequence[str],
+    token: str | None = None,
+    *,
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+) -> dict[str, RepoMetadata]:
+    """Fetch metadata and head commits for many repos with aliased GraphQL queries.
+
+    One query covers ``batch_size`` repositories, replacing a REST repository
+    call, a Search API merged-PR count and the first commits page per repo.
+    GraphQL needs a token; without one, or for any repo or batch that fails,
+    the result simply omits those repos so callers fall back to REST.
+    """
+
+    if not token:
+        return {}
+    unique = list(dict.fromkeys(repo for repo in repos if repo.count("/") == 1))
+    headers = _github_headers(token)
+    results: dict[str, RepoMetadata] = {}
+    for start in range(0, len(unique), max(1, batch_size)):
+        batch = unique[start : start + max(1, batch_size)]
+        variables: dict[str, str] = {}
+        for index, repo in enumerate(batch):
+            variables[f"o{index}"], variables[f"n{index}"] = repo.split("/")
+        try:
+            resp = _github_post(
+                GRAPHQL_URL,
+                headers,
+                {"query": _graphql_repo_query(len(batch)), "variables": variables},
+            )
+            resp.raise_for_status()
+            payload = resp.json()
+        except (requests.exceptions.RequestException, ValueError) as exc:
+            LOGGER.warning("GraphQL metadata batch failed, using REST: %s", exc)
+            continue
+        data = payload.get("data") if isinstance(payload, dict) else None
+        if not isinstance(data, dict):
+            LOGGER.warning("Unexpected GraphQL metadata payload: %r", payload)
+            continue
+        if payload.get("errors"):
+            LOGGER.warning("GraphQL metadata errors: %s", payload["errors"])
+        for index, repo in enumerate(batch):
+            repo_data = data.get(f"r{index}")
+            metadata = (
+                _metadata_from_graphql(repo_data)
+                if isinstance(repo_data, dict)
+                else None
+            )
+            if metadata is not None:
+                results[repo] = metadata
+    return results
+
+
 def fetch_repo_status_details(
     repo: str,
     token: str | None = None,
@@ -519,11 +741,44 @@ def fetch_repo_status_details(
                 merged_prs=metadata.merged_prs,
             )
 
+    # Batch metadata may already carry page 1 of the default branch's commits.
+    # It stands in for the first attempt only; later attempts re-request the
+    # page so a head that moved in between is not hidden.
+    head_commits = metadata.head_commits if branch == metadata.default_branch else None
+    commits_head = (
+        f"https://api.github.com/repos/{repo}/commits?sha={branch}&per_page=20"
+    )
+
     all_runs_url = f"https://api.github.com/repos/{repo}/actions/runs?per_page=100&status=completed"
     url = all_runs_url
     if branch:
         url += f"&branch={branch}"
 
+    # Responses shared by the consistency-check attempts. The first commits
+    # page and the runs listing heads are volatile, so later attempts
+    # re-request just those; deeper commits and runs pages are reused while
+    # the head they continue from is unchanged.
+    memo: dict[str, requests.Response] = {}
+    volatile_heads = {commits_head, url, all_runs_url}
+
+    def _memo_get(request_url: str) -> requests.Response:
+        if request_url in volatile_heads:
+            resp = _github_get(request_url, headers)
+            resp.raise_for_status()
+            previous = memo.get(request_url)
+            if previous is not None and previous.json() != resp.json():
+                for key in [k for k in memo if k.startswith(f"{request_url}&page=")]:
+                    del memo[key]
+            memo[request_url] = resp
+            return resp
+        cached = memo.get(request_url)
+        if cached is not None:
+            return cached
+        resp = _github_get(request_url, headers)
+        resp.raise_for_status()
+        memo[request_url] = resp
+        return resp
+
     keywords = re.compile(r"(test|lint|build|ci)", re.I)
     failures = {
         "failure",
@@ -540,23 +795,6 @@ def fetch_repo_status_details(
             return ""
         return re.sub(r"[\s-]+", "_", value.strip().lower())
 
-    def _should_skip_commit(commit: dict) -> bool:
-        message = commit.get("commit", {}).get("message", "")
-        if SKIP_COMMIT_RE.search(message):
-            return True
-        for key in ("author", "committer"):
-            login = (commit.get(key) or {}).get("login")
-            raw_identity = commit.get("commit", {}).get(key) or {}
-            name = raw_identity.get("name")
-            email = raw_identity.get("email")
-            if isinstance(login, str) and login.endswith("[bot]"):
-                return True
-            if isinstance(name, str) and name.endswith("[bot]"):
-                return True
-            if isinstance(email, str) and email.strip().lower() in BOT_COMMIT_EMAILS:
-                return True
-        return False
-
     def _failure_url(run: dict) -> str | None:
         html_url = run.get("html_url")
         if isinstance(html_url, str) and html_url:
@@ -665,29 +903,32 @@ def fetch_repo_status_details(
         return None, ()
 
     def _fetch() -> tuple[str | None, tuple[StatusLink, ...]]:
-        try:
-            commits_resp = requests.get(
-                f"https://api.github.com/repos/{repo}/commits?sha={branch}&per_page=20",
-                headers=headers,
-                timeout=10,
-            )
-            commits_resp.raise_for_status()
-            commits_data = commits_resp.json()
-        except (requests.exceptions.RequestException, ValueError) as exc:
-            LOGGER.warning("Unable to fetch commits for %s@%s: %s", repo, branch, exc)
-            return None, ()
-        if not isinstance(commits_data, list):
-            LOGGER.warning(
-                "Unexpected commits payload for %s@%s: %r",
-                repo,
-                branch,
-                type(commits_data),
-            )
-            return None, ()
-        first_page_commits = commits_data
+        nonlocal head_commits
+        if head_commits is not None:
+            first_page_commits = list(head_commits)
+            head_commits = None
+        else:
+            try:
+                commits_resp = _memo_get(commits_head)
+                commits_resp.raise_for_status()
+                commits_data = commits_resp.json()
+            except (requests.exceptions.RequestException, ValueError) as exc:
+                LOGGER.warning(
+                    "Unable to fetch commits for %s@%s: %s", repo, branch, exc
+                )
+                return None, ()
+            if not isinstance(commits_data, list):
+                LOGGER.warning(
+                    "Unexpected commits payload for %s@%s: %r",
+                    repo,
+                    branch,
+                    type(commits_data),
+                )
+                return None, ()
+            first_page_commits = commits_data
 
         try:
-            resp = requests.get(url, headers=headers, timeout=10)
+            resp = _memo_get(url)
             resp.raise_for_status()
             runs_data = resp.json()
         except (requests.exceptions.RequestException, ValueError) as exc:
@@ -751,7 +992,7 @@ def fetch_repo_status_details(
         def _fetch_runs_page(page_number: int) -> list[dict] | None:
             runs_page_url = f"{url}&page={page_number}"
             try:
-                runs_resp = requests.get(runs_page_url, headers=headers, timeout=10)
+                runs_resp = _memo_get(runs_page_url)
                 runs_resp.raise_for_status()
                 runs_page_data = runs_resp.json()
             except (requests.exceptions.RequestException, ValueError) as exc:
@@ -793,9 +1034,7 @@ def fetch_repo_status_details(
                     f"?sha={branch}&per_page=20&page={page}"
                 )
                 try:
-                    commits_resp = requests.get(
-                        commits_url, headers=headers, timeout=10
-                    )
+                    commits_resp = _memo_get(commits_url)
                     commits_resp.raise_for_status()
                     commits_data = commits_resp.json()
                 except (requests.exceptions.RequestException, ValueError) as exc:
@@ -932,7 +1171,7 @@ def fetch_repo_status_details(
         for page in count(1):
             page_url = all_runs_url if page == 1 else f"{all_runs_url}&page={page}"
             try:
-                all_resp = requests.get(page_url, headers=headers, timeout=10)
+                all_resp = _memo_get(page_url)
                 all_resp.raise_for_status()
                 all_runs_data = all_resp.json()
             except (requests.exceptions.RequestException, ValueError) as exc:
@@ -1046,6 +1285,265 @@ def fetch_repo_status_report(
     )
 
 
+@dataclass(frozen=True)
+class RepoFingerprint:
+    """Cheap change signal for one repository, compared between runs."""
+
+    head_sha: str
+    runs: tuple[str, ...]
+
+
+def fetch_repo_fingerprint(
+    repo: str, token: str | None = None, branch: str | None = None
+) -> tuple[RepoMetadata, RepoFingerprint | None]:
+    """Fetch metadata plus the head commit and latest completed runs of ``repo``.
+
+    The head is the newest commit on ``branch`` (the default branch when
+    ``None``) that the lookback walk would not skip, read from the GraphQL batch
+    when it already carries the commits. Runs are the first page of completed
+    runs on any branch, minus this dashboard's own workflow, identified by id,
+    attempt and conclusion. Both URLs are ones the walk requests too, so with
+    the HTTP cache an unchanged repo usually answers ``304 Not Modified``. The
+    fingerprint is ``None`` when a lookup fails.
+    """
+
+    metadata = fetch_repo_metadata(repo, token)
+    branch = branch or metadata.default_branch
+    if branch is None:
+        return metadata, None
+    headers = _github_headers(token)
+    commits: object = None
+    if branch == metadata.default_branch and metadata.head_commits is not None:
+        commits = list(metadata.head_commits)
+    try:
+        if commits is None:
+            commits_resp = _github_get(
+                f"https://api.github.com/repos/{repo}/commits?sha={branch}&per_page=20",
+                headers,
+            )
+            commits_resp.raise_for_status()
+            commits = commits_resp.json()
+        runs_resp = _github_get(
+            f"https://api.github.com/repos/{repo}/actions/runs"
+            "?per_page=100&status=completed",
+            headers,
+        )
+        runs_resp.raise_for_status()
+        runs_data = runs_resp.json()
+    except (requests.exceptions.RequestException, ValueError) as exc:
+        LOGGER.warning("Unable to check %s@%s for changes: %s", repo, branch, exc)
+        return metadata, None
+
+    runs = runs_data.get("workflow_runs") if isinstance(runs_data, dict) else None
+    if not isinstance(commits, list) or not isinstance(runs, list):
+        return metadata, None
+    shas = [
+        commit["sha"]
+        for commit in commits
+        if isinstance(commit, dict) and isinstance(commit.get("sha"), str)
+    ]
+    real_shas = [
+        commit["sha"]
+        for commit in commits
+        if isinstance(commit, dict)
+        and isinstance(commit.get("sha"), str)
+        and not _should_skip_commit(commit)
+    ]
+    if not shas:
+        return metadata, None
+    return metadata, RepoFingerprint(
+        head_sha=(real_shas or shas)[0],
+        runs=tuple(
+            f"{run.get('id')}:{run.get('run_attempt', 1)}:{run.get('conclusion')}"
+            for run in runs
+            if isinstance(run, dict) and not _is_self_status_workflow_run(run)
+        ),
+    )
+
+
+class RepoStatusState:
+    """Per-repo fingerprints and rendered statuses persisted between runs.
+
+    :meth:`lookup` returns the stored ``RepoStatus`` while a repository's
+    fingerprint matches and the entry is younger than ``max_age``; otherwise
+    the caller walks commits and runs and records the result with
+    :meth:`store`. Unresolved (``❓``) statuses are never reused. Like
+    ``GitHubResponseCache``, only entries touched in the run are saved.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        now: datetime | None = None,
+        max_age: timedelta = STATE_MAX_AGE,
+    ) -> None:
+        self.path = path
+        self.now = now or datetime.now(UTC)
+        self.max_age = max_age
+        self._entries: dict[str, dict] = {}
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+        self.stats = {"unchanged": 0, "walked": 0}
+        if path is None or not path.exists():
+            return
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            LOGGER.warning("Ignoring unreadable repo status state %s: %s", path, exc)
+            return
+        repos = data.get("repos") if isinstance(data, dict) else None
+        if isinstance(repos, dict):
+            self._entries = {
+                key: entry for key, entry in repos.items() if isinstance(entry, dict)
+            }
+
+    @staticmethod
+    def key(repo: str, branch: str | None) -> str:
+        return f"{repo}@{branch or ''}"
+
+    def lookup(
+        self, key: str, fingerprint: RepoFingerprint | None
+    ) -> RepoStatus | None:
+        with self._lock:
+            self._used.add(key)
+            entry = self._entries.get(key)
+        if entry is None or fingerprint is None:
+            return None
+        if entry.get("head_sha") != fingerprint.head_sha:
+            return None
+        if tuple(entry.get("runs") or ()) != fingerprint.runs:
+            return None
+        try:
+            walked_at = datetime.fromisoformat(entry["walked_at"])
+            status = entry["status"]
+            links = tuple(StatusLink(label, url) for label, url in status["links"])
+            result = RepoStatus(
+                status["emoji"], links, status.get("stars"), status.get("merged_prs")
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+        if self.now - walked_at > self.max_age:
+            return None
+        with self._lock:
+            self.stats["unchanged"] += 1
+        return result
+
+    def store(
+        self, key: str, fingerprint: RepoFingerprint | None, status: RepoStatus
+    ) -> None:
+        with self._lock:
+            self._used.add(key)
+            self.stats["walked"] += 1
+            if fingerprint is None or status.emoji == status_to_emoji(None):
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = {
+                "head_sha": fingerprint.head_sha,
+                "runs": list(fingerprint.runs),
+                "walked_at": self.now.isoformat(),
+                "status": {
+                    "emoji": status.emoji,
+                    "links": [[link.label, link.url] for link in status.failure_links],
+                    "stars": status.stars,
+                    "merged_prs": status.merged_prs,
+                },
+            }
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            repos = {
+                key: self._entries[key]
+                for key in sorted(self._used & set(self._entries))
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps({"repos": repos}), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def summary(self) -> str:
+        return f"{self.stats['unchanged']} unchanged, " f"{self.stats['walked']} walked"
+
+
+def _fetch_repo_status_incremental(
+    repo: str, token: str | None, branch: str | None, state: RepoStatusState
+) -> RepoStatus:
+    """Reuse the stored status of an unchanged repo, otherwise walk it."""
+
+    metadata, fingerprint = fetch_repo_fingerprint(repo, token, branch)
+    key = state.key(repo, branch)
+    cached = state.lookup(key, fingerprint)
+    if cached is not None:
+        return replace(cached, stars=metadata.stars, merged_prs=metadata.merged_prs)
+    transport = _ACTIVE_TRANSPORT.get()
+    if transport is not None and metadata.default_branch is not None:
+        # Let the walk reuse the metadata (and head commits) just fetched.
+        transport.metadata[repo] = metadata
+    status = fetch_repo_status_details(repo, token, branch)
+    state.store(key, fingerprint, status)
+    return status
+
+
+def fetch_repo_statuses(
+    repos: Sequence[tuple[str, str | None]],
+    token: str | None = None,
+    *,
+    max_workers: int = REPO_STATUS_MAX_WORKERS,
+    http_cache: GitHubResponseCache | None = None,
+    budget: RateLimitBudget | None = None,
+    state: RepoStatusState | None = None,
+) -> list[RepoStatus]:
+    """Fetch ``fetch_repo_status_details`` for many ``(repo, branch)`` pairs.
+
+    Repositories are processed by up to ``max_workers`` threads sharing one
+    pooled ``GitHubClient`` (with ``http_cache`` and the rate-limit ``budget``,
+    when given). Metadata is
+    prefetched with :func:`fetch_repo_metadata_batch` when a token is available,
+    falling back to per-repo REST calls for anything it misses. With ``state``
+    each repo is first checked with :func:`fetch_repo_fingerprint` and only
+    walked when it changed since the stored run. Results come
+    back in input order, and each repository still runs its own multi-attempt
+    consistency check, so a ``RuntimeError`` for one repo propagates exactly as
+    in a sequential loop.
+    """
+
+    if not repos:
+        return []
+    workers = max(1, min(max_workers, len(repos)))
+    with GitHubClient.pooled(workers, cache=http_cache, budget=budget) as client:
+        transport = GitHubTransport(client)
+        reset = _ACTIVE_TRANSPORT.set(transport)
+        try:
+            transport.metadata = fetch_repo_metadata_batch(
+                [repo for repo, _ in repos], token
+            )
+            with ThreadPoolExecutor(
+                max_workers=workers, thread_name_prefix="repo-status"
+            ) as pool:
+                futures = [
+                    pool.submit(
+                        contextvars.copy_context().run,
+                        *(
+                            (fetch_repo_status_details, repo, token, branch)
+                            if state is None
+                            else (
+                                _fetch_repo_status_incremental,
+                                repo,
+                                token,
+                                branch,
+                                state,
+                            )
+                        ),
+                    )
+                    for repo, branch in repos
+                ]
+                return [future.result() for future in futures]
+        finally:
+            _ACTIVE_TRANSPORT.reset(reset)
+
+
 def _escape_markdown_label(label: str) -> str:
     return label.replace("\\", "\\\\").replace("]", r"\]")
 
@@ -1312,11 +1810,23 @@ def _sort_key(item: RelatedProjectItem) -> tuple[int, str]:
     return (-sort_stars, item.name.casefold())
 
 
-def _update_related_section(lines: list[str], token: str | None) -> list[str]:
+def _update_related_section(
+    lines: list[str],
+    token: str | None,
+    http_cache: GitHubResponseCache | None = None,
+    budget: RateLimitBudget | None = None,
+    state: RepoStatusState | None = None,
+) -> list[str]:
     items_by_start: dict[int, RelatedProjectItem] = {}
     project_items = parse_related_project_items(lines)
-    for item in project_items:
-        status = fetch_repo_status_details(item.repo, token, item.branch)
+    statuses = fetch_repo_statuses(
+        [(item.repo, item.branch) for item in project_items],
+        token,
+        http_cache=http_cache,
+        budget=budget,
+        state=state,
+    )
+    for item, status in zip(project_items, statuses, strict=True):
         if status.merged_prs is None and item.existing_merged_prs is not None:
             status = replace(status, merged_prs=item.existing_merged_prs)
         items_by_start[item.start_index] = replace(item, status=status)
@@ -1344,8 +1854,18 @@ def update_readme(
     readme_path: Path,
     token: str | None = None,
     now: datetime | None = None,
+    http_cache_path: Path | None = None,
+    state_path: Path | None = None,
 ) -> None:
-    """Update README with status emojis, failure links, star counts, and a timestamp."""
+    """Update README with status emojis, failure links, star counts, and a timestamp.
+
+    With ``http_cache_path`` GitHub responses are revalidated with conditional
+    requests against the cache stored there. With ``state_path`` repos whose
+    head commit and latest completed runs are unchanged since the previous run
+    reuse its stored status (see :class:`RepoStatusState`). Requests are paced
+    by a :class:`RateLimitBudget`; cache statistics and budget consumption are
+    logged once the run finishes.
+    """
 
     lines = readme_path.read_text(encoding="utf-8").splitlines()
     if now is None:
@@ -1353,6 +1873,11 @@ def update_readme(
     timestamp = now.strftime("%Y-%m-%d %H:%M UTC")
     ts_line = f"_Last updated: {timestamp}; checks hourly_"
 
+    http_cache = (
+        GitHubResponseCache(http_cache_path) if http_cache_path is not None else None
+    )
+    state = RepoStatusState(state_path, now=now) if state_path is not None else None
+    budget = RateLimitBudget()
     output: list[str] = []
     index = 0
     while index < len(lines):
@@ -1370,12 +1895,30 @@ def update_readme(
             if not lines[index].startswith("_Last updated:"):
                 section.append(lines[index])
             index += 1
-        output.extend(_update_related_section(section, token))
+        output.extend(
+            _update_related_section(section, token, http_cache, budget, state)
+        )
+
+    if http_cache is not None:
+        http_cache.save()
+        LOGGER.info("GitHub HTTP cache: %s", http_cache.summary())
+    if state is not None:
+        state.save()
+        LOGGER.info("Repo status state: %s", state.summary())
+    LOGGER.info("GitHub rate-limit budget: %s", budget.summary())
 
     # Ensure output file encoded as UTF-8 so emoji render correctly on Windows
     readme_path.write_text("\n".join(output) + "\n", encoding="utf-8")
 
 
 if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
     token = os.environ.get("GITHUB_TOKEN")
-    update_readme(Path(__file__).resolve().parent.parent / "README.md", token)
+    root = Path(__file__).resolve().parent.parent
+    update_readme(
+        root / "README.md",
+        token,
+        http_cache_path=root
+        / os.environ.get(HTTP_CACHE_ENV, str(DEFAULT_HTTP_CACHE_PATH)),
+        state_path=root / os.environ.get(STATE_ENV, str(DEFAULT_STATE_PATH)),
+    )
@@ -0,0 +1,503 @@
+"""Record GitHub traffic for the repo status dashboard and replay it offline.
+
+``record`` runs :func:`src.repo_status.update_readme` against the live API on a
+copy of the README and stores every response (status, body and the validator
+and paging headers) in a fixture directory, together with the input README and
+the rendered output.
+
+``bench`` starts a local stand-in server that answers from those fixtures,
+points pooled GitHub clients at it, and replays the same update. It reports the
+number of requests per repository, requests that were never recorded, the
+wall-clock time and whether the rendered README still matches the recording.
+Comparing against a saved ``--baseline`` report flags regressions, e.g. when
+``COMMIT_LOOKBACK_MAX_PAGES`` or the run lookback logic changes::
+
+    python -m src.repo_status_replay record
+    python -m src.repo_status_replay bench --output before.json
+    python -m src.repo_status_replay bench --lookback-pages 5 --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+if __package__ in {None, ""}:
+    sys.path.append(str(Path(__file__).resolve().parent))
+    import repo_status  # type: ignore[import-not-found]
+    from github_client import (  # type: ignore[import-not-found]
+        API_ROOT,
+        use_adapter_factory,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from . import repo_status
+    from .github_client import API_ROOT, use_adapter_factory
+
+LOGGER = logging.getLogger(__name__)
+
+DEFAULT_STORE = Path(".cache/repo_status/fixtures")
+DEFAULT_LATENCY_MS = 20.0
+# Wall-clock growth over the baseline reported as a regression.
+DEFAULT_MAX_SLOWDOWN = 0.5
+
+FIXTURES_FILE = "responses.json"
+INPUT_README = "README.input.md"
+EXPECTED_README = "README.expected.md"
+
+# Response headers worth replaying; rate-limit headers are dropped so a replay
+# never waits on a reset that happened during the recording.
+RECORDED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+def request_key(method: str, url: str, body: bytes | str | None = None) -> str:
+    """Fixture key: method and URL, plus a digest of the body for POSTs."""
+
+    key = f"{method.upper()} {url}"
+    if body:
+        raw = body.encode("utf-8") if isinstance(body, str) else body
+        key += f" #{hashlib.sha256(raw).hexdigest()[:16]}"
+    return key
+
+
+def request_repo(url: str) -> str:
+    """Repository a GitHub API URL belongs to, ``graphql`` or ``other``."""
+
+    parts = urlsplit(url)
+    segments = parts.path.strip("/").split("/")
+    if segments[:1] == ["repos"] and len(segments) >= 3:
+        return f"{segments[1]}/{segments[2]}"
+    if segments[:1] == ["graphql"]:
+        return "graphql"
+    if segments[:2] == ["search", "issues"]:
+        for term in parse_qs(parts.query).get("q", [""])[0].split():
+            if term.startswith("repo:"):
+                return term.removeprefix("repo:")
+    return "other"
+
+
+@dataclass
+class FixtureStore:
+    """Recorded responses keyed by :func:`request_key`."""
+
+    responses: dict[str, dict[str, Any]] = field(default_factory=dict)
+    authenticated: bool = False
+    recorded_at: str | None = None
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(
+        self, method: str, url: str, body: bytes | str | None, response: Any
+    ) -> None:
+        headers = {
+            name: response.headers[name]
+            for name in RECORDED_HEADERS
+            if response.headers.get(name)
+        }
+        with self._lock:
+            self.responses[request_key(method, url, body)] = {
+                "status": response.status_code,
+                "headers": headers,
+                "body": response.text,
+            }
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        return self.responses.get(key)
+
+    @classmethod
+    def load(cls, directory: Path) -> FixtureStore:
+        data = json.loads((directory / FIXTURES_FILE).read_text(encoding="utf-8"))
+        return cls(
+            responses=data["responses"],
+            authenticated=bool(data.get("authenticated")),
+            recorded_at=data.get("recorded_at"),
+        )
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            data = {
+                "recorded_at": self.recorded_at,
+                "authenticated": self.authenticated,
+                "responses": dict(sorted(self.responses.items())),
+            }
+        path = directory / FIXTURES_FILE
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        tmp_path.replace(path)
+
+
+class RecordingAdapter(HTTPAdapter):
+    """Transport adapter that copies every response into a :class:`FixtureStore`."""
+
+    def __init__(self, store: FixtureStore, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.store = store
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        response = super().send(request, **kwargs)
+        body = request.body if isinstance(request.body, bytes | str) else None
+        if request.method and request.url:
+            self.store.add(request.method, request.url, body, response)
+        return response
+
+
+class RedirectAdapter(HTTPAdapter):
+    """Transport adapter that sends GitHub API requests to ``base_url`` instead."""
+
+    def __init__(self, base_url: str, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.base_url = base_url.rstrip("/")
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if request.url and request.url.startswith(API_ROOT):
+            request.url = self.base_url + request.url[len(API_ROOT) :]
+        return super().send(request, **kwargs)
+
+
+class ReplayServer:
+    """Local HTTP stand-in for ``api.github.com`` answering from fixtures.
+
+    Each request sleeps ``latency`` seconds to approximate a network round
+    trip, so concurrency and request-count changes show up in wall time.
+    Unrecorded requests get a ``404`` and are counted as misses.
+    """
+
+    def __init__(self, store: FixtureStore, *, latency: float = 0.0) -> None:
+        self.store = store
+        self.latency = latency
+        self.requests: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self._lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="repo-status-replay", daemon=True
+        )
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    def adapter(self, pool_size: int) -> HTTPAdapter:
+        """Adapter factory for :func:`use_adapter_factory`."""
+
+        return RedirectAdapter(
+            self.base_url, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+
+    def _answer(self, method: str, path: str, body: bytes) -> dict[str, Any]:
+        url = API_ROOT + path
+        key = request_key(method, url, body)
+        entry = self.store.get(key)
+        with self._lock:
+            self.requests[request_repo(url)] += 1
+            if entry is None:
+                self.misses[key] += 1
+        if self.latency:
+            time.sleep(self.latency)
+        if entry is None:
+            return {
+                "status": 404,
+                "headers": {"Content-Type": "application/json"},
+                "body": json.dumps({"message": f"Not recorded: {key}"}),
+            }
+        return entry
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep-alive, so pooled sessions reuse connections as with GitHub.
+            protocol_version = "HTTP/1.1"
+
+            def _reply(self, method: str) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                entry = server._answer(method, self.path, body)
+                payload = entry["body"].encode("utf-8")
+                self.send_response(entry["status"])
+                for name, value in entry["headers"].items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:  # noqa: N802 - http.server API
+                self._reply("GET")
+
+            def do_POST(self) -> None:  # noqa: N802 - http.server API
+                self._reply("POST")
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                LOGGER.debug("replay: " + format, *args)
+
+        return Handler
+
+    def __enter__(self) -> ReplayServer:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+
+
+@dataclass
+class BenchReport:
+    """Outcome of one offline replay of ``update_readme``."""
+
+    requests: int
+    seconds: float
+    lookback_pages: int
+    per_repo: dict[str, int]
+    misses: list[str] = field(default_factory=list)
+    output_matches: bool = True
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> BenchReport:
+        return cls(
+            requests=int(data["requests"]),
+            seconds=float(data["seconds"]),
+            lookback_pages=int(data["lookback_pages"]),
+            per_repo={str(k): int(v) for k, v in data.get("per_repo", {}).items()},
+            misses=list(data.get("misses", [])),
+            output_matches=bool(data.get("output_matches", True)),
+        )
+
+
+@contextmanager
+def _lookback_pages(pages: int | None) -> Iterator[int]:
+    original = repo_status.COMMIT_LOOKBACK_MAX_PAGES
+    if pages is not None:
+        repo_status.COMMIT_LOOKBACK_MAX_PAGES = pages
+    try:
+        yield repo_status.COMMIT_LOOKBACK_MAX_PAGES
+    finally:
+        repo_status.COMMIT_LOOKBACK_MAX_PAGES = original
+
+
+def _recorded_now(store: FixtureStore) -> datetime:
+    if store.recorded_at:
+        return datetime.fromisoformat(store.recorded_at)
+    return datetime.now(UTC)
+
+
+def record(
+    readme_path: Path, store_dir: Path, token: str | None = None
+) -> FixtureStore:
+    """Run ``update_readme`` against GitHub and save its traffic to ``store_dir``.
+
+    The run uses no HTTP cache, so every response is recorded in full.
+    """
+
+    store = FixtureStore(
+        authenticated=bool(token),
+        recorded_at=datetime.now(UTC).replace(second=0, microsecond=0).isoformat(),
+    )
+
+    def recording_adapter(pool_size: int) -> HTTPAdapter:
+        return RecordingAdapter(
+            store, pool_connections=pool_size, pool_maxsize=pool_size
+        )
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(readme_path, store_dir / INPUT_README)
+    with tempfile.TemporaryDirectory() as tmp:
+        work = Path(tmp) / "README.md"
+        shutil.copyfile(readme_path, work)
+        with use_adapter_factory(recording_adapter):
+            repo_status.update_readme(work, token, now=_recorded_now(store))
+        shutil.copyfile(work, store_dir / EXPECTED_README)
+    store.save(store_dir)
+    return store
+
+
+def run_benchmark(
+    store_dir: Path,
+    *,
+    latency: float = DEFAULT_LATENCY_MS / 1000,
+    lookback_pages: int | None = None,
+) -> BenchReport:
+    """Replay the recorded ``update_readme`` run against a local stand-in server."""
+
+    store = FixtureStore.load(store_dir)
+    # GraphQL batching only runs with a token; match the recorded code path.
+    token = "replay-token" if store.authenticated else None
+    with (
+        tempfile.TemporaryDirectory() as tmp,
+        ReplayServer(store, latency=latency) as server,
+        use_adapter_factory(server.adapter),
+        _lookback_pages(lookback_pages) as pages,
+    ):
+        work = Path(tmp) / "README.md"
+        shutil.copyfile(store_dir / INPUT_README, work)
+        started = time.perf_counter()
+        repo_status.update_readme(work, token, now=_recorded_now(store))
+        seconds = time.perf_counter() - started
+        rendered = work.read_text(encoding="utf-8")
+    expected = (store_dir / EXPECTED_README).read_text(encoding="utf-8")
+    return BenchReport(
+        requests=sum(server.requests.values()),
+        seconds=round(seconds, 4),
+        lookback_pages=pages,
+        per_repo=dict(sorted(server.requests.items())),
+        misses=sorted(server.misses),
+        output_matches=rendered == expected,
+    )
+
+
+def compare_reports(
+    baseline: BenchReport,
+    current: BenchReport,
+    *,
+    max_slowdown: float = DEFAULT_MAX_SLOWDOWN,
+) -> list[str]:
+    """Describe how ``current`` regressed against ``baseline`` (empty if not)."""
+
+    regressions = []
+    if current.requests > baseline.requests:
+        regressions.append(f"total requests: {baseline.requests} -> {current.requests}")
+    for repo, count in current.per_repo.items():
+        before = baseline.per_repo.get(repo, 0)
+        if count > before:
+            regressions.append(f"{repo}: {before} -> {count} requests")
+    if len(current.misses) > len(baseline.misses):
+        regressions.append(
+            f"unrecorded requests: {len(baseline.misses)} -> {len(current.misses)}"
+        )
+    if baseline.output_matches and not current.output_matches:
+        regressions.append("rendered README no longer matches the recording")
+    if baseline.seconds and current.seconds > baseline.seconds * (1 + max_slowdown):
+        regressions.append(
+            f"wall time: {baseline.seconds:.3f}s -> {current.seconds:.3f}s"
+        )
+    return regressions
+
+
+def format_report(report: BenchReport) -> str:
+    lines = [
+        f"{report.requests} requests in {report.seconds:.3f}s "
+        f"(lookback {report.lookback_pages} pages)"
+    ]
+    lines.extend(
+        f"  {repo}: {count}" for repo, count in sorted(report.per_repo.items())
+    )
+    if report.misses:
+        lines.append(f"{len(report.misses)} unrecorded request(s):")
+        lines.extend(f"  {key}" for key in report.misses)
+    if not report.output_matches:
+        lines.append("Rendered README differs from the recording")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Record GitHub responses for repo_status and replay them offline",
+    )
+    parser.add_argument(
+        "--store",
+        default=DEFAULT_STORE,
+        type=Path,
+        help="Directory holding the recorded fixtures",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+    record_parser = commands.add_parser("record", help="Record live GitHub traffic")
+    record_parser.add_argument(
+        "--readme",
+        default=Path("README.md"),
+        type=Path,
+        help="README whose Related Projects section is recorded",
+    )
+    bench_parser = commands.add_parser("bench", help="Replay the recorded traffic")
+    bench_parser.add_argument(
+        "--latency-ms",
+        default=DEFAULT_LATENCY_MS,
+        type=float,
+        help="Simulated round-trip time per request",
+    )
+    bench_parser.add_argument(
+        "--lookback-pages",
+        default=None,
+        type=int,
+        help="Override COMMIT_LOOKBACK_MAX_PAGES for this replay",
+    )
+    bench_parser.add_argument(
+        "--baseline",
+        default=None,
+        type=Path,
+        help="Earlier JSON report to compare against",
+    )
+    bench_parser.add_argument(
+        "--max-slowdown",
+        default=DEFAULT_MAX_SLOWDOWN,
+        type=float,
+        help="Relative wall-time growth over the baseline reported as a regression",
+    )
+    bench_parser.add_argument(
+        "--output",
+        default=None,
+        type=Path,
+        help="Write the JSON report here",
+    )
+    args = parser.parse_args(argv)
+
+    if args.command == "record":
+        store = record(args.readme, args.store, os.environ.get("GITHUB_TOKEN"))
+        print(f"Recorded {len(store.responses)} responses to {args.store}")
+        return 0
+
+    report = run_benchmark(
+        args.store,
+        latency=args.latency_ms / 1000,
+        lookback_pages=args.lookback_pages,
+    )
+    print(format_report(report))
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(
+            json.dumps(report.to_dict(), indent=2) + "\n", encoding="utf-8"
+        )
+    if args.baseline is None:
+        return 0
+    baseline = BenchReport.from_dict(
+        json.loads(args.baseline.read_text(encoding="utf-8"))
+    )
+    regressions = compare_reports(baseline, report, max_slowdown=args.max_slowdown)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(message)s")
+    raise SystemExit(main())
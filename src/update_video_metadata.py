@@ -6,42 +6,36 @@ import argparse
 import json
 import os
 import pathlib
-import re
-import urllib.error
-import urllib.request
+import sys
 from typing import Iterable
 
+if __package__ in {None, ""}:
+    sys.path.append(str(pathlib.Path(__file__).resolve().parent))
+    from youtube_data_client import (  # type: ignore[import-not-found]  # noqa: F401
+        CACHE_ENV,
+        DEFAULT_CACHE_PATH,
+        DEFAULT_MAX_WORKERS,
+        QuotaBudget,
+        VideoDetails,
+        VideoResponseCache,
+        YouTubeDataClient,
+        parse_duration,
+    )
+else:  # pragma: no cover - exercised via package import in tests
+    from .youtube_data_client import (  # noqa: F401
+        CACHE_ENV,
+        DEFAULT_CACHE_PATH,
+        DEFAULT_MAX_WORKERS,
+        QuotaBudget,
+        VideoDetails,
+        VideoResponseCache,
+        YouTubeDataClient,
+        parse_duration,
+    )
+
 BASE_DIR = pathlib.Path(__file__).resolve().parent.parent
 VIDEO_ROOT = BASE_DIR / "video_scripts"
 YOUTUBE_KEY_ENV = "YOUTUBE_API_KEY"
-API_URL = (
-    "https://www.googleapis.com/youtube/v3/videos"
-    "?part=snippet,contentDetails,statistics&id={video_id}&key={youtube_key}"
-)
-
-_DURATION_RE = re.compile(
-    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
-    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
-)
-
-
-def parse_duration(value: str | None) -> int:
-    """Return total seconds represented by an ISO-8601 duration string."""
-
-    if not value:
-        return 0
-    match = _DURATION_RE.match(value)
-    if not match:
-        return 0
-    parts = {k: int(v) if v else 0 for k, v in match.groupdict().items()}
-    seconds = (
-        parts["weeks"] * 7 * 24 * 3600
-        + parts["days"] * 24 * 3600
-        + parts["hours"] * 3600
-        + parts["minutes"] * 60
-        + parts["seconds"]
-    )
-    return seconds
 
 
 def iter_metadata_files(
@@ -53,64 +47,52 @@ def iter_metadata_files(
         yield meta
 
 
-def fetch_metadata(video_id: str, youtube_key: str, timeout: int = 10) -> dict | None:
-    url = API_URL.format(video_id=video_id, youtube_key=youtube_key)
+def _metadata_updates(details: VideoDetails) -> dict:
+    published = details.published_at
+    return {
+        "title": details.title,
+        "publish_date": published.split("T", 1)[0] if published else "",
+        "duration_seconds": details.duration_seconds,
+        "description": details.description,
+        "keywords": list(details.keywords),
+        "thumbnail": details.thumbnail,
+        "view_count": details.view_count,
+    }
+
+
+def fetch_metadata_batch(
+    video_ids: Iterable[str],
+    youtube_key: str,
+    *,
+    client: YouTubeDataClient | None = None,
+) -> dict[str, dict]:
+    """Return metadata updates keyed by video ID, 50 IDs per API request.
+
+    Batches that fail are reported and skipped, so their videos are simply
+    missing from the result.
+    """
+
+    def _report(batch: list[str], exc: Exception) -> None:
+        print(f"failed to fetch metadata for {', '.join(batch)}: {exc}")
+
+    owns_client = client is None
+    if client is None:
+        client = YouTubeDataClient(youtube_key)
     try:
-        with urllib.request.urlopen(url, timeout=timeout) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except urllib.error.URLError as exc:
-        print(f"failed to fetch metadata for {video_id}: {exc}")
-        return None
-    items = payload.get("items") or []
-    if not items:
+        details = client.fetch_videos(video_ids, on_error=_report)
+    finally:
+        if owns_client:
+            client.close()
+    return {video_id: _metadata_updates(info) for video_id, info in details.items()}
+
+
+def fetch_metadata(video_id: str, youtube_key: str, timeout: int = 10) -> dict | None:
+    with YouTubeDataClient(youtube_key, max_workers=1, timeout=timeout) as client:
+        info = fetch_metadata_batch([video_id], youtube_key, client=client)
+    if video_id not in info:
         print(f"no metadata found for {video_id}")
         return None
-    item = items[0]
-    snippet = item.get("snippet") or {}
-    details = item.get("contentDetails") or {}
-    statistics = item.get("statistics") or {}
-    duration_seconds = parse_duration(details.get("duration"))
-    published = snippet.get("publishedAt", "")
-    publish_date = published.split("T", 1)[0] if published else ""
-    thumbnails = snippet.get("thumbnails") or {}
-
-    def _select_thumbnail(data: dict) -> str:
-        if not isinstance(data, dict):
-            return ""
-        preference = ["maxres", "standard", "high", "medium", "default"]
-        for key in preference:
-            entry = data.get(key)
-            if isinstance(entry, dict):
-                url = entry.get("url")
-                if isinstance(url, str) and url.strip():
-                    return url.strip()
-            elif isinstance(entry, str) and entry.strip():
-                return entry.strip()
-        # Sometimes thumbnails dict is a simple mapping of size->URL string
-        for value in data.values():
-            if isinstance(value, str) and value.strip():
-                return value.strip()
-            if isinstance(value, dict):
-                url = value.get("url")
-                if isinstance(url, str) and url.strip():
-                    return url.strip()
-        return ""
-
-    view_count_raw = statistics.get("viewCount", "0")
-    try:
-        view_count = int(str(view_count_raw))
-    except (TypeError, ValueError):
-        view_count = 0
-
-    return {
-        "title": snippet.get("title", ""),
-        "publish_date": publish_date,
-        "duration_seconds": duration_seconds,
-        "description": snippet.get("description", ""),
-        "keywords": list(snippet.get("tags", []) or []),
-        "thumbnail": _select_thumbnail(thumbnails),
-        "view_count": view_count,
-    }
+    return info[video_id]
 
 
 def update_metadata_file(path: pathlib.Path, updates: dict) -> bool:
@@ -142,6 +124,17 @@ def main(argv: list[str] | None = None) -> int:
         default=None,
         help="Limit updates to specific slug folders",
     )
+    parser.add_argument(
+        "--cache",
+        default=None,
+        help=f"ETag cache for API responses (env {CACHE_ENV})",
+    )
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help="Concurrent API requests (50 videos each)",
+    )
     args = parser.parse_args(argv)
 
     youtube_key = os.getenv(YOUTUBE_KEY_ENV, "").strip()
@@ -150,20 +143,40 @@ def main(argv: list[str] | None = None) -> int:
         return 1
 
     slugs = set(args.slug) if args.slug else None
-    updated = 0
-    failures = 0
+    entries: list[tuple[pathlib.Path, str]] = []
     for meta_path in iter_metadata_files(VIDEO_ROOT, slugs):
         data = json.loads(meta_path.read_text())
         video_id = data.get("youtube_id")
-        if not isinstance(video_id, str) or not video_id:
-            continue
-        info = fetch_metadata(video_id, youtube_key)
+        if isinstance(video_id, str) and video_id:
+            entries.append((meta_path, video_id))
+
+    cache = VideoResponseCache(
+        pathlib.Path(
+            args.cache or os.getenv(CACHE_ENV) or BASE_DIR / DEFAULT_CACHE_PATH
+        )
+    )
+    quota = QuotaBudget()
+    with YouTubeDataClient(
+        youtube_key, cache=cache, quota=quota, max_workers=args.max_workers
+    ) as client:
+        infos = fetch_metadata_batch(
+            [video_id for _, video_id in entries], youtube_key, client=client
+        )
+    cache.save()
+
+    updated = 0
+    failures = 0
+    for meta_path, video_id in entries:
+        info = infos.get(video_id)
         if info is None:
+            print(f"no metadata found for {video_id}")
             failures += 1
             continue
         if update_metadata_file(meta_path, info):
             updated += 1
             print(f"updated {meta_path}")
+    if entries:
+        print(f"YouTube Data API: {quota.summary()}; {cache.summary()}")
     if updated:
         print(f"Updated {updated} metadata file(s)")
     else:
@@ -0,0 +1,438 @@
+"""Shared YouTube Data API v3 client for the metadata refresh scripts.
+
+``src/enrich_metadata.py`` and ``src/update_video_metadata.py`` both look up
+``videos.list`` details through :class:`YouTubeDataClient`, which
+
+* asks for up to 50 IDs per request (the API maximum) and runs the batches
+  concurrently over one pooled, retrying ``requests`` session;
+* charges every call against a :class:`QuotaBudget` (``videos.list`` costs one
+  unit) and stops sending once YouTube reports ``quotaExceeded``;
+* replays ETags from an optional :class:`VideoResponseCache`, serving the
+  stored items when a batch comes back ``304 Not Modified``.
+
+Responses are normalised into :class:`VideoDetails` with a single
+:func:`parse_duration` and :func:`select_thumbnail`.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+LOGGER = logging.getLogger(__name__)
+
+API_URL = "https://www.googleapis.com/youtube/v3/videos"
+API_PARTS = ("snippet", "contentDetails", "statistics")
+CACHE_ENV = "YOUTUBE_DATA_CACHE"
+DEFAULT_CACHE_PATH = Path(".cache/youtube_data/videos.json")
+
+MAX_IDS_PER_REQUEST = 50
+DEFAULT_MAX_WORKERS = 4
+REQUEST_TIMEOUT_SECONDS = 10
+MAX_RETRIES = 3
+RETRY_BACKOFF_SECONDS = 1.0
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+# ``videos.list`` costs one unit per call, whatever the number of IDs or parts.
+VIDEOS_LIST_COST = 1
+DEFAULT_DAILY_QUOTA = 10_000
+THUMBNAIL_PREFERENCE = ("maxres", "standard", "high", "medium", "default")
+
+_DURATION_RE = re.compile(
+    r"^P(?:(?P<weeks>\d+)W)?(?:(?P<days>\d+)D)?"
+    r"(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?$"
+)
+
+
+class YouTubeDataError(RuntimeError):
+    """Raised when a ``videos.list`` batch cannot be fetched."""
+
+
+class QuotaExceeded(YouTubeDataError):
+    """Raised once the daily quota is spent, locally or as reported by YouTube."""
+
+
+def parse_duration(value: str | None) -> int:
+    """Return total seconds represented by an ISO-8601 duration string."""
+
+    if not value:
+        return 0
+    match = _DURATION_RE.match(value)
+    if not match:
+        return 0
+    parts = {k: int(v) if v else 0 for k, v in match.groupdict().items()}
+    return (
+        parts["weeks"] * 7 * 24 * 3600
+        + parts["days"] * 24 * 3600
+        + parts["hours"] * 3600
+        + parts["minutes"] * 60
+        + parts["seconds"]
+    )
+
+
+def select_thumbnail(data: object) -> str:
+    """Return the highest-resolution thumbnail URL from a ``thumbnails`` mapping."""
+
+    if not isinstance(data, dict):
+        return ""
+    ordered = [data.get(key) for key in THUMBNAIL_PREFERENCE]
+    # Sometimes the mapping is a plain size -> URL dict with other keys.
+    for entry in [*ordered, *data.values()]:
+        if isinstance(entry, dict):
+            entry = entry.get("url")
+        if isinstance(entry, str) and entry.strip():
+            return entry.strip()
+    return ""
+
+
+@dataclass(frozen=True)
+class VideoDetails:
+    """Fields of one ``videos.list`` item used by the metadata scripts."""
+
+    video_id: str
+    title: str
+    published_at: str
+    duration_seconds: int
+    description: str
+    keywords: tuple[str, ...]
+    thumbnail: str
+    view_count: int
+
+    @classmethod
+    def from_item(cls, item: dict[str, Any]) -> VideoDetails | None:
+        video_id = item.get("id")
+        if not isinstance(video_id, str):
+            return None
+        snippet = item.get("snippet") or {}
+        details = item.get("contentDetails") or {}
+        statistics = item.get("statistics") or {}
+        published_at = snippet.get("publishedAt")
+        try:
+            view_count = int(str(statistics.get("viewCount", "0")))
+        except (TypeError, ValueError):
+            view_count = 0
+        return cls(
+            video_id=video_id,
+            title=snippet.get("title") or "",
+            published_at=published_at if isinstance(published_at, str) else "",
+            duration_seconds=parse_duration(details.get("duration")),
+            description=snippet.get("description") or "",
+            keywords=tuple(snippet.get("tags") or ()),
+            thumbnail=select_thumbnail(snippet.get("thumbnails")),
+            view_count=view_count,
+        )
+
+
+class QuotaBudget:
+    """Count quota units spent by this process and refuse calls past ``limit``.
+
+    YouTube does not expose the remaining daily quota, so the budget only knows
+    what this run spent; a ``quotaExceeded`` error from the API marks it
+    exhausted so the remaining batches fail fast instead of being sent.
+    """
+
+    def __init__(self, limit: int | None = DEFAULT_DAILY_QUOTA) -> None:
+        self.limit = limit
+        self.used = 0
+        self.requests = 0
+        self.exhausted = False
+        self._lock = threading.Lock()
+
+    def charge(self, units: int = VIDEOS_LIST_COST) -> None:
+        with self._lock:
+            if self.exhausted or (
+                self.limit is not None and self.used + units > self.limit
+            ):
+                raise QuotaExceeded(
+                    f"YouTube Data API quota exhausted ({self.used} units used)"
+                )
+            self.used += units
+            self.requests += 1
+
+    def exhaust(self) -> None:
+        with self._lock:
+            self.exhausted = True
+
+    def summary(self) -> str:
+        limit = "unlimited" if self.limit is None else str(self.limit)
+        return f"{self.requests} requests, {self.used}/{limit} quota units"
+
+
+class VideoResponseCache:
+    """ETag cache of ``videos.list`` items, keyed by the requested parts and IDs.
+
+    Several scripts share one cache file, so :meth:`save` merges this run's
+    batches into whatever is on disk. Entries unused for ``max_age_days`` are
+    dropped, and only the ``max_entries`` most recently used are kept.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        *,
+        max_age_days: float = 30.0,
+        max_entries: int = 1000,
+    ) -> None:
+        self.path = path
+        self.max_age_days = max_age_days
+        self.max_entries = max_entries
+        self._entries = self._read()
+        self._used: set[str] = set()
+        self._lock = threading.Lock()
+        self.stats = {"not_modified": 0, "stored": 0, "uncached": 0}
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as exc:
+            LOGGER.warning(
+                "Ignoring unreadable YouTube data cache %s: %s", self.path, exc
+            )
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        now = time.time()
+        entries: dict[str, dict[str, Any]] = {}
+        for key, entry in data.items():
+            if not (
+                isinstance(entry, dict)
+                and isinstance(entry.get("etag"), str)
+                and isinstance(entry.get("items"), list)
+            ):
+                continue
+            used_at = entry.get("used_at")
+            # Files written before eviction existed have no timestamps.
+            if not isinstance(used_at, int | float):
+                used_at = now
+            entries[key] = {**entry, "used_at": float(used_at)}
+        return entries
+
+    @staticmethod
+    def key(parts: Sequence[str], video_ids: Sequence[str]) -> str:
+        return f"{','.join(parts)}|{','.join(video_ids)}"
+
+    def etag(self, key: str) -> str | None:
+        with self._lock:
+            self._used.add(key)
+            entry = self._entries.get(key)
+            if entry:
+                entry["used_at"] = time.time()
+        return entry["etag"] if entry else None
+
+    def not_modified(self, key: str) -> list[dict[str, Any]] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self.stats["not_modified"] += 1
+            items: list[dict[str, Any]] = entry["items"]
+            return items
+
+    def store(self, key: str, etag: str | None, items: list[dict[str, Any]]) -> None:
+        with self._lock:
+            if not etag:
+                self.stats["uncached"] += 1
+                return
+            self._entries[key] = {"etag": etag, "items": items, "used_at": time.time()}
+            self.stats["stored"] += 1
+
+    def save(self) -> None:
+        """Merge this run's batches into the file and evict stale entries."""
+
+        with self._lock:
+            if self.path is None or not self._used:
+                return
+            ours = {
+                key: self._entries[key] for key in self._used if key in self._entries
+            }
+        merged = {**self._read(), **ours}
+        cutoff = time.time() - self.max_age_days * 24 * 60 * 60
+        recent = sorted(
+            (item for item in merged.items() if item[1]["used_at"] >= cutoff),
+            key=lambda item: item[1]["used_at"],
+            reverse=True,
+        )[: self.max_entries]
+        data = dict(sorted(recent))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text(json.dumps(data), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def summary(self) -> str:
+        stats = self.stats
+        return (
+            f"{sum(stats.values())} batches: {stats['not_modified']} not modified "
+            f"(304), {stats['stored']} refreshed, {stats['uncached']} uncacheable"
+        )
+
+
+def build_session(pool_size: int = DEFAULT_MAX_WORKERS) -> requests.Session:
+    """Pooled session retrying throttled and failed requests with backoff."""
+
+    retry = Retry(
+        total=MAX_RETRIES,
+        backoff_factor=RETRY_BACKOFF_SECONDS,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET"}),
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session
+
+
+def _error_reason(response: requests.Response) -> str:
+    try:
+        errors = response.json()["error"]["errors"]
+        return str(errors[0].get("reason", ""))
+    except (ValueError, KeyError, IndexError, TypeError, AttributeError):
+        return ""
+
+
+def _chunked(items: Sequence[str], size: int) -> Iterable[list[str]]:
+    for i in range(0, len(items), size):
+        yield list(items[i : i + size])
+
+
+BatchErrorHandler = Callable[[list[str], YouTubeDataError], None]
+
+
+class YouTubeDataClient:
+    """Batched, concurrent ``videos.list`` lookups for one API key."""
+
+    def __init__(
+        self,
+        api_key: str,
+        *,
+        session: requests.Session | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache: VideoResponseCache | None = None,
+        quota: QuotaBudget | None = None,
+        parts: Sequence[str] = API_PARTS,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+    ) -> None:
+        self.api_key = api_key
+        self.max_workers = max(1, max_workers)
+        self._owns_session = session is None
+        self.session = session or build_session(self.max_workers)
+        self.cache = cache
+        self.quota = quota or QuotaBudget()
+        self.parts = tuple(parts)
+        self.timeout = timeout
+
+    def close(self) -> None:
+        if self._owns_session:
+            self.session.close()
+
+    def __enter__(self) -> YouTubeDataClient:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def fetch_items(self, video_ids: Sequence[str]) -> list[dict[str, Any]]:
+        """Return the raw ``videos.list`` items for one batch of at most 50 IDs."""
+
+        if len(video_ids) > MAX_IDS_PER_REQUEST:
+            raise ValueError(f"at most {MAX_IDS_PER_REQUEST} IDs per request")
+        key = VideoResponseCache.key(self.parts, video_ids)
+        headers = {"Accept": "application/json"}
+        etag = self.cache.etag(key) if self.cache else None
+        if etag:
+            headers["If-None-Match"] = etag
+        self.quota.charge()
+        try:
+            response = self.session.get(
+                API_URL,
+                params={
+                    "part": ",".join(self.parts),
+                    "id": ",".join(video_ids),
+                    "maxResults": str(MAX_IDS_PER_REQUEST),
+                    "key": self.api_key,
+                },
+                headers=headers,
+                timeout=self.timeout,
+            )
+        except requests.RequestException as exc:
+            raise YouTubeDataError(str(exc)) from exc
+        if response.status_code == 304 and self.cache:
+            items = self.cache.not_modified(key)
+            if items is not None:
+                return items
+        if response.status_code == 403 and _error_reason(response) in {
+            "quotaExceeded",
+            "dailyLimitExceeded",
+        }:
+            self.quota.exhaust()
+            raise QuotaExceeded("YouTube Data API daily quota exceeded")
+        if response.status_code != 200:
+            raise YouTubeDataError(
+                f"videos.list returned HTTP {response.status_code}"
+                f" ({_error_reason(response) or 'no reason given'})"
+            )
+        try:
+            payload = response.json()
+        except ValueError as exc:
+            raise YouTubeDataError(f"invalid JSON from videos.list: {exc}") from exc
+        items = [item for item in payload.get("items") or [] if isinstance(item, dict)]
+        if self.cache:
+            self.cache.store(
+                key, response.headers.get("ETag") or payload.get("etag"), items
+            )
+        return items
+
+    def fetch_videos(
+        self,
+        video_ids: Iterable[str],
+        *,
+        on_error: BatchErrorHandler | None = None,
+    ) -> dict[str, VideoDetails]:
+        """Return details keyed by video ID for every ID YouTube knows about.
+
+        IDs are de-duplicated and sorted, so a batch's cache key does not depend
+        on the order callers list videos in, then split into batches of 50,
+        fetched by up to
+        ``max_workers`` threads. A failing batch raises :class:`YouTubeDataError`
+        unless ``on_error`` is given, in which case it is called with the
+        batch's IDs and the error and the other batches are still returned.
+        """
+
+        ids = sorted({video_id for video_id in video_ids if video_id})
+        batches = list(_chunked(ids, MAX_IDS_PER_REQUEST))
+        if not batches:
+            return {}
+
+        def _fetch(batch: list[str]) -> list[dict[str, Any]]:
+            try:
+                return self.fetch_items(batch)
+            except YouTubeDataError as exc:
+                if on_error is None:
+                    raise
+                on_error(batch, exc)
+                return []
+
+        results: dict[str, VideoDetails] = {}
+        workers = min(self.max_workers, len(batches))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for items in pool.map(_fetch, batches):
+                for item in items:
+                    details = VideoDetails.from_item(item)
+                    if details is not None:
+                        results[details.video_id] = details
+        return results
@@ -136,6 +136,87 @@ def test_summarize_dataframe_empty() -> None:
     }
 
 
+class DummyStreamlit:
+    def __init__(self) -> None:
+        self.metrics: list[tuple[str, object]] = []
+        self.line_chart_data: list[object] = []
+        self.bar_chart_data: list[object] = []
+        self.subheaders: list[str] = []
+        self.dataframes: list[object] = []
+        self.selectboxes: list[tuple[str, list[str], int]] = []
+        self.columns_count: int | None = None
+        # Shared across reruns like Streamlit's cache, keyed by function and args.
+        self.cache: dict[tuple, object] = {}
+        self.cache_misses = 0
+        self.date_window: object = ()
+        self.sidebar = self.Sidebar(self)
+
+    class Sidebar:
+        def __init__(self, parent: "DummyStreamlit") -> None:
+            self._parent = parent
+
+        def selectbox(self, label: str, options: list[str], index: int = 0) -> str:
+            self._parent.selectboxes.append((label, options, index))
+            return options[index]
+
+        def date_input(self, label: str, value: object = ()) -> object:
+            return self._parent.date_window
+
+    class Column:
+        def __init__(self, parent: "DummyStreamlit") -> None:
+            self._parent = parent
+
+        def metric(self, label: str, value: object, *args, **kwargs) -> None:
+            self._parent.metrics.append((label, value))
+
+    @staticmethod
+    def _snapshot(data: object) -> object:
+        if hasattr(data, "copy"):
+            try:
+                return data.copy()  # type: ignore[call-arg]
+            except TypeError:
+                return data
+        return data
+
+    def cache_data(self, **_kwargs):
+        def decorator(func):
+            def wrapper(*args):
+                key = (func.__name__, args)
+                if key not in self.cache:
+                    self.cache_misses += 1
+                    self.cache[key] = func(*args)
+                return self.cache[key]
+
+            return wrapper
+
+        return decorator
+
+    def set_page_config(self, **_kwargs) -> None:  # pragma: no cover - trivial stub
+        return None
+
+    def title(self, _text: str) -> None:  # pragma: no cover - trivial stub
+        return None
+
+    def caption(self, _text: str) -> None:  # pragma: no cover - trivial stub
+        return None
+
+    def columns(self, count: int) -> list["DummyStreamlit.Column"]:
+        self.columns_count = count
+        return [self.Column(self) for _ in range(count)]
+
+    def dataframe(self, data, use_container_width: bool = False) -> None:
+        self.dataframes.append(self._snapshot(data))
+
+    def line_chart(self, data) -> None:
+        self.line_chart_data.append(self._snapshot(data))
+
+    def bar_chart(self, data) -> None:
+        self.bar_chart_data.append(self._snapshot(data))
+
+    def subheader(self, text: str) -> None:
+        self.subheaders.append(text)
+
+
 def test_render_dashboard_displays_watch_time_and_ctr_charts(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
@@ -157,66 +238,6 @@ def test_render_dashboard_displays_watch_time_and_ctr_charts(
     }
     _write_metadata(video_root, "20250201_chart-feature", payload)
 
-    class DummyStreamlit:
-        def __init__(self) -> None:
-            self.metrics: list[tuple[str, object]] = []
-            self.line_chart_data: list[object] = []
-            self.bar_chart_data: list[object] = []
-            self.subheaders: list[str] = []
-            self.dataframes: list[object] = []
-            self.selectboxes: list[tuple[str, list[str], int]] = []
-            self.columns_count: int | None = None
-            self.sidebar = self.Sidebar(self)
-
-        class Sidebar:
-            def __init__(self, parent: "DummyStreamlit") -> None:
-                self._parent = parent
-
-            def selectbox(self, label: str, options: list[str], index: int = 0) -> str:
-                self._parent.selectboxes.append((label, options, index))
-                return options[index]
-
-        class Column:
-            def __init__(self, parent: "DummyStreamlit") -> None:
-                self._parent = parent
-
-            def metric(self, label: str, value: object, *args, **kwargs) -> None:
-                self._parent.metrics.append((label, value))
-
-        @staticmethod
-        def _snapshot(data: object) -> object:
-            if hasattr(data, "copy"):
-                try:
-                    return data.copy()  # type: ignore[call-arg]
-                except TypeError:
-                    return data
-            return data
-
-        def set_page_config(self, **_kwargs) -> None:  # pragma: no cover - trivial stub
-            return None
-
-        def title(self, _text: str) -> None:  # pragma: no cover - trivial stub
-            return None
-
-        def caption(self, _text: str) -> None:  # pragma: no cover - trivial stub
-            return None
-
-        def columns(self, count: int) -> list["DummyStreamlit.Column"]:
-            self.columns_count = count
-            return [self.Column(self) for _ in range(count)]
-
-        def dataframe(self, data, use_container_width: bool = False) -> None:
-            self.dataframes.append(self._snapshot(data))
-
-        def line_chart(self, data) -> None:
-            self.line_chart_data.append(self._snapshot(data))
-
-        def bar_chart(self, data) -> None:
-            self.bar_chart_data.append(self._snapshot(data))
-
-        def subheader(self, text: str) -> None:
-            self.subheaders.append(text)
-
     stub = DummyStreamlit()
     monkeypatch.setitem(sys.modules, "streamlit", stub)
 
@@ -243,3 +264,155 @@ def test_render_dashboard_displays_watch_time_and_ctr_charts(
     assert all(value == pytest.approx(6.5) for value in ctr_values)
     assert "Watch time (minutes)" in stub.subheaders
     assert "Click-through rate (%)" in stub.subheaders
+
+
+def test_load_daily_metrics_builds_growth_curves(tmp_path: Path) -> None:
+    from datetime import date
+
+    from src.analytics_store import AnalyticsStore
+
+    store_path = tmp_path / "daily.sqlite"
+    with AnalyticsStore(store_path) as store:
+        store.record(
+            "a",
+            date(2025, 1, 1),
+            date(2025, 1, 3),
+            {"2025-01-01": {"views": 5}, "2025-01-03": {"views": 2}},
+        )
+        store.record(
+            "b", date(2025, 1, 2), date(2025, 1, 3), {"2025-01-02": {"views": 4}}
+        )
+
+    daily = dashboard.load_daily_metrics(store_path, start=date(2025, 1, 1))
+    curves = dashboard.growth_curves(daily)
+
+    assert pd.api.types.is_datetime64_any_dtype(daily["day"])
+    assert list(daily["youtube_id"]) == ["a", "a", "b"]
+    assert curves["a"].dropna().to_dict() == {0: 5, 2: 7}
+    assert curves["b"].dropna().to_dict() == {0: 4}
+    assert dashboard.load_daily_metrics(tmp_path / "missing.sqlite").empty
+
+    aligned = dashboard.growth_curves(daily, {"a": pd.Timestamp("2024-12-30")})
+    assert aligned["a"].dropna().to_dict() == {2: 5, 4: 7}
+    assert aligned["b"].dropna().to_dict() == {0: 4}
+
+
+def test_render_daily_metrics_aligns_growth_on_publish_date(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import date
+
+    from src.analytics_store import AnalyticsStore
+
+    video_root = tmp_path / "video_scripts"
+    video_root.mkdir()
+    _write_metadata(
+        video_root,
+        "20250101_old",
+        {"youtube_id": "old", "title": "Old", "publish_date": "2025-01-01"},
+    )
+    store_path = tmp_path / "daily.sqlite"
+    with AnalyticsStore(store_path) as store:
+        store.record(
+            "old",
+            date(2025, 1, 1),
+            date(2025, 1, 4),
+            {
+                f"2025-01-0{day}": {"views": 10, "average_view_duration_seconds": day}
+                for day in (1, 2, 3, 4)
+            },
+        )
+    stub = DummyStreamlit()
+    stub.date_window = (date(2025, 1, 3), date(2025, 1, 4))
+    monkeypatch.setitem(sys.modules, "streamlit", stub)
+
+    dashboard.render_dashboard(video_root=video_root, store_path=store_path)
+
+    daily_views, retention, growth = stub.line_chart_data[-3:]
+    assert list(daily_views.index.day) == [3, 4]
+    assert retention["Old"].tolist() == [3, 4]
+    assert "Daily average view duration (s)" in stub.subheaders
+    # The range filter trims the daily charts, not the lifetime growth curve.
+    assert growth["Old"].to_dict() == {0: 10, 1: 20, 2: 30, 3: 40}
+
+
+def test_render_dashboard_with_store_but_no_metadata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    from datetime import date
+
+    from src.analytics_store import AnalyticsStore
+
+    video_root = tmp_path / "video_scripts"
+    video_root.mkdir()
+    store_path = tmp_path / "daily.sqlite"
+    with AnalyticsStore(store_path) as store:
+        store.record(
+            "old", date(2025, 1, 1), date(2025, 1, 1), {"2025-01-01": {"views": 1}}
+        )
+    stub = DummyStreamlit()
+    monkeypatch.setitem(sys.modules, "streamlit", stub)
+
+    dashboard.render_dashboard(video_root=video_root, store_path=store_path)
+
+    assert "Daily views" not in stub.subheaders
+    assert "youtube_id" in dashboard.build_dataframe([]).columns
+
+
+def test_render_dashboard_reuses_cached_frame_until_metadata_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    import os
+
+    video_root = tmp_path / "video_scripts"
+    video_root.mkdir()
+    live = _write_metadata(
+        video_root,
+        "20250101_live",
+        {"title": "Live", "status": "live", "analytics": {"views": 10}},
+    )
+    _write_metadata(
+        video_root,
+        "20250102_draft",
+        {"title": "Draft", "status": "draft", "analytics": {"views": 5}},
+    )
+    loads: list[Path] = []
+    original_load = dashboard.load_video_metadata
+
+    def counting_load(root: Path) -> list[dict]:
+        loads.append(root)
+        return original_load(root)
+
+    monkeypatch.setattr(dashboard, "load_video_metadata", counting_load)
+    stub = DummyStreamlit()
+    stub.sidebar.selectbox = lambda label, options, index=0: "live"
+    monkeypatch.setitem(sys.modules, "streamlit", stub)
+
+    dashboard.render_dashboard(video_root=video_root, store_path=tmp_path / "none")
+    dashboard.render_dashboard(video_root=video_root, store_path=tmp_path / "none")
+
+    assert len(loads) == 1
+    assert list(stub.dataframes[-1]["title"]) == ["Live"]
+    assert ("Videos", 1) in stub.metrics
+
+    live.write_text(json.dumps({"title": "Live v2", "status": "live"}))
+    stat = live.stat()
+    os.utime(live, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    dashboard.render_dashboard(video_root=video_root, store_path=tmp_path / "none")
+
+    assert len(loads) == 2
+    assert list(stub.dataframes[-1]["title"]) == ["Live v2"]
+
+
+def test_filter_frame_selects_status_without_rebuilding() -> None:
+    frame = dashboard.build_dataframe(
+        [
+            {"slug": "a", "status": "live", "publish_date": "2025-01-01"},
+            {"slug": "b", "status": "draft", "publish_date": "2025-01-02"},
+        ]
+    )
+
+    assert dashboard.filter_frame(frame) is frame
+    live = dashboard.filter_frame(frame, status="live")
+    assert list(live["slug"]) == ["a"]
+    assert list(live.index) == [0]
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import io
 import json
 from datetime import UTC, datetime
 from pathlib import Path
@@ -11,16 +10,15 @@ import pytest
 import src.analytics_ingester as ai
 
 
-class DummyResponse(io.BytesIO):
+class DummyResponse:
     def __init__(self, payload: dict[str, Any]):
-        data = json.dumps(payload).encode("utf-8")
-        super().__init__(data)
+        self._payload = payload
 
-    def __enter__(self) -> DummyResponse:
-        return self
+    def raise_for_status(self) -> None:
+        pass
 
-    def __exit__(self, exc_type, exc, tb) -> None:
-        return False
+    def json(self) -> dict[str, Any]:
+        return self._payload
 
 
 def _write_metadata(base: Path, slug: str, youtube_id: str) -> Path:
@@ -69,12 +67,13 @@ def test_fetch_video_metrics_maps_known_columns(
     video_id = "abc123"
     payload = _sample_payload()
 
-    def fake_urlopen(request: Any) -> DummyResponse:
-        assert video_id in request.full_url
-        assert request.headers["Authorization"] == f"Bearer {token}"
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        assert params["filters"] == f"video=={video_id}"
+        assert headers["Authorization"] == f"Bearer {token}"
+        assert timeout == ai.REQUEST_TIMEOUT_SECONDS
         return DummyResponse(payload)
 
-    monkeypatch.setattr(ai.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(ai.requests.Session, "get", fake_get)
 
     metrics = ai.fetch_video_metrics(
         video_id=video_id,
@@ -101,11 +100,11 @@ def test_ingest_updates_metadata_and_summary(
 
     calls: list[str] = []
 
-    def fake_urlopen(request: Any) -> DummyResponse:
-        calls.append(request.full_url)
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        calls.append(params["filters"])
         return DummyResponse(payload)
 
-    monkeypatch.setattr(ai.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(ai.requests.Session, "get", fake_get)
     monkeypatch.setenv("YOUTUBE_ANALYTICS_TOKEN", "secret-token")
     summary = ai.ingest(
         video_root=repo / "video_scripts",
@@ -146,10 +145,10 @@ def test_main_writes_summary_file(
     _write_metadata(repo, "20250101_demo", "abc123")
     payload = _sample_payload()
 
-    def fake_urlopen(request: Any) -> DummyResponse:
+    def fake_get(self, url: str, **kwargs: Any) -> DummyResponse:
         return DummyResponse(payload)
 
-    monkeypatch.setattr(ai.urllib.request, "urlopen", fake_urlopen)
+    monkeypatch.setattr(ai.requests.Session, "get", fake_get)
     monkeypatch.chdir(repo)
     monkeypatch.setenv("YOUTUBE_ANALYTICS_TOKEN", "tkn")
 
@@ -168,3 +167,99 @@ def test_main_writes_summary_file(
     assert out.exists()
     content = json.loads(out.read_text())
     assert content[0]["slug"] == "20250101_demo"
+
+
+def test_ingest_batches_videos_per_report_and_writes_after_fetching(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    paths = {
+        video_id: _write_metadata(tmp_path, f"2025010{index}_demo", video_id)
+        for index, video_id in enumerate(["vid0", "vid1", "vid2"])
+    }
+    header = _sample_payload()["columnHeaders"]
+    filters: list[str] = []
+
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        filters.append(params["filters"])
+        ids = params["filters"].removeprefix("video==").split(",")
+        assert params["maxResults"] == str(len(ids))
+        assert params["sort"] == "-views"
+        # Metadata is only written once every report has come back.
+        assert all("analytics" not in json.loads(p.read_text()) for p in paths.values())
+        rows = [
+            [video_id, 100 + int(video_id[-1]), 1.0, 2.0, 3, 0.1]
+            for video_id in ids
+            if video_id != "vid1"
+        ]
+        return DummyResponse(
+            {"columnHeaders": [{"name": "video"}, *header], "rows": rows}
+        )
+
+    monkeypatch.setattr(ai.requests.Session, "get", fake_get)
+
+    summary = ai.ingest(
+        video_root=tmp_path / "video_scripts",
+        start_date="2025-01-01",
+        end_date="2025-12-31",
+        token="tkn",
+        batch_size=2,
+    )
+
+    assert sorted(filters) == ["video==vid0,vid1", "video==vid2"]
+    assert [(entry["youtube_id"], entry["views"]) for entry in summary] == [
+        ("vid0", 100),
+        ("vid2", 102),
+    ]
+    assert "analytics" not in json.loads(paths["vid1"].read_text())
+    assert json.loads(paths["vid2"].read_text())["analytics"]["views"] == 102
+
+
+def test_build_session_retries_throttled_requests_with_backoff() -> None:
+    session = ai.build_session(3)
+    adapter = session.get_adapter(ai.API_URL)
+
+    assert adapter._pool_maxsize == 3
+    assert adapter.max_retries.total == ai.MAX_RETRIES
+    assert adapter.max_retries.backoff_factor == ai.RETRY_BACKOFF_SECONDS
+    assert 429 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.respect_retry_after_header
+
+
+def test_backfill_daily_only_requests_missing_days(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_metadata(tmp_path, "20250101_demo", "abc123")
+    header = _sample_payload()["columnHeaders"]
+    windows: list[tuple[str, str]] = []
+
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        assert params["dimensions"] == "day"
+        windows.append((params["startDate"], params["endDate"]))
+        rows = [[params["startDate"], 10, 1.0, 2.0, 3, 0.1]]
+        return DummyResponse(
+            {"columnHeaders": [{"name": "day"}, *header], "rows": rows}
+        )
+
+    monkeypatch.setattr(ai.requests.Session, "get", fake_get)
+    store_path = tmp_path / "analytics" / "daily.sqlite"
+
+    def backfill(start: str, end: str) -> dict[str, int]:
+        return ai.backfill_daily(
+            video_root=tmp_path / "video_scripts",
+            start_date=start,
+            end_date=end,
+            store_path=store_path,
+            token="tkn",
+        )
+
+    assert backfill("2020-01-01", "2020-01-10") == {"abc123": 1}
+    assert backfill("2020-01-05", "2020-01-12") == {"abc123": 1}
+    assert backfill("2020-01-01", "2020-01-12") == {}
+    assert windows == [("2020-01-01", "2020-01-10"), ("2020-01-11", "2020-01-12")]
+
+    with ai.AnalyticsStore(store_path) as store:
+        rows = store.query(youtube_ids=["abc123"])
+    assert [(row["day"], row["views"]) for row in rows] == [
+        ("2020-01-01", 10),
+        ("2020-01-11", 10),
+    ]
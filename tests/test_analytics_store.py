@@ -0,0 +1,73 @@
+import sqlite3
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+from src.analytics_store import AnalyticsStore
+
+
+def test_missing_ranges_skip_final_days_and_refetch_recent_ones(tmp_path: Path) -> None:
+    with AnalyticsStore(tmp_path / "daily.sqlite") as store:
+        assert store.missing_ranges("vid", date(2025, 1, 1), date(2025, 1, 3)) == [
+            (date(2025, 1, 1), date(2025, 1, 3))
+        ]
+
+        store.record(
+            "vid",
+            date(2025, 1, 2),
+            date(2025, 1, 5),
+            {"2025-01-02": {"views": 10}},
+            fetched_on=date(2025, 1, 6),
+        )
+
+        # Jan 4 and 5 were fetched under REFRESH_DAYS after they happened.
+        assert store.missing_ranges("vid", date(2025, 1, 1), date(2025, 1, 8)) == [
+            (date(2025, 1, 1), date(2025, 1, 1)),
+            (date(2025, 1, 4), date(2025, 1, 8)),
+        ]
+        assert store.missing_ranges("other", date(2025, 1, 2), date(2025, 1, 2)) == [
+            (date(2025, 1, 2), date(2025, 1, 2))
+        ]
+
+
+def test_query_filters_by_range_and_video(tmp_path: Path) -> None:
+    path = tmp_path / "daily.sqlite"
+    with AnalyticsStore(path) as store:
+        for video_id, views in (("a", 1), ("b", 5)):
+            store.record(
+                video_id,
+                date(2025, 1, 1),
+                date(2025, 1, 3),
+                {f"2025-01-0{day}": {"views": views * day} for day in (1, 2, 3)},
+            )
+        # Re-fetching a day replaces its row instead of duplicating it.
+        store.record(
+            "a", date(2025, 1, 2), date(2025, 1, 2), {"2025-01-02": {"views": 7}}
+        )
+
+    with AnalyticsStore(path) as store:
+        rows = store.query(start=date(2025, 1, 2), youtube_ids=["a"])
+        assert [(row["day"], row["views"]) for row in rows] == [
+            ("2025-01-02", 7),
+            ("2025-01-03", 3),
+        ]
+        assert len(store.query(end=date(2025, 1, 1))) == 2
+        assert store.query(youtube_ids=[]) == []
+
+
+def test_readonly_store_queries_without_schema_writes(tmp_path: Path) -> None:
+    path = tmp_path / "daily.sqlite"
+    with AnalyticsStore(path) as store:
+        store.record(
+            "a", date(2025, 1, 1), date(2025, 1, 1), {"2025-01-01": {"views": 3}}
+        )
+
+    with AnalyticsStore(path, readonly=True) as reader:
+        assert [row["views"] for row in reader.query()] == [3]
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            reader.record("a", date(2025, 1, 2), date(2025, 1, 2), {})
+
+    with pytest.raises(sqlite3.OperationalError):
+        AnalyticsStore(tmp_path / "missing" / "daily.sqlite", readonly=True)
+    assert not (tmp_path / "missing").exists()
@@ -1,6 +1,16 @@
+import json
+import sqlite3
+import threading
+import time
 from pathlib import Path
 
-from tools.youtube_mcp.cache import TranscriptCache
+from tools.youtube_mcp.cache import (
+    _MAX_IDLE_READERS,
+    SCHEMA_VERSION,
+    TranscriptCache,
+    decode_value,
+    encode_value,
+)
 
 
 def test_cache_roundtrip(tmp_path: Path):
@@ -37,3 +47,260 @@ def test_cache_clear_expired(tmp_path: Path):
     cache.set("will_expire", {"value": 1}, ttl_days=-1)
     cache.clear_expired()
     assert cache.get("will_expire") is None
+
+
+def _transcript_payload(count: int) -> dict:
+    from tools.youtube_mcp.chunking import chunk_segments
+    from tools.youtube_mcp.models import Segment
+
+    video_id = "vid123abcde"
+    segments = [
+        Segment(
+            id=f"{video_id}:{idx}",
+            text=f"caption line {idx}",
+            start=idx * 1.5,
+            dur=1.5,
+        )
+        for idx in range(count)
+    ]
+    chunks = chunk_segments(video_id, segments, target_chars=80, overlap_chars=20)
+    return {
+        "video": {"id": video_id, "url": f"https://www.youtube.com/watch?v={video_id}"},
+        "captions": {"lang": "en", "is_auto": False, "track_name": None},
+        "segments": [segment.model_dump() for segment in segments],
+        "chunks": [chunk.model_dump() for chunk in chunks],
+        "hash": "abc",
+    }
+
+
+def test_cache_transcript_roundtrip_is_compact(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    payload = _transcript_payload(200)
+    cache.set("transcript", payload, ttl_days=1)
+    assert cache.get("transcript") == payload
+
+    (stored,) = cache._conn.execute(
+        "SELECT value FROM cache_entries WHERE cache_key = ?", ("transcript",)
+    ).fetchone()
+    assert isinstance(stored, bytes)
+    assert len(stored) * 5 < len(json.dumps(payload))
+
+
+def test_cache_get_lazy_builds_transcript_items_on_demand(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    payload = _transcript_payload(20)
+    cache.set("transcript", payload, ttl_days=1)
+
+    lazy = cache.get("transcript", lazy=True)
+    assert not isinstance(lazy["segments"], list)
+    assert not isinstance(lazy["chunks"], list)
+    assert next(lazy["segments"]) == payload["segments"][0]
+    assert list(lazy["chunks"]) == payload["chunks"]
+    assert list(lazy["segments"]) == payload["segments"][1:]
+
+
+def test_encode_value_keeps_unrebuildable_chunks():
+    payload = _transcript_payload(5)
+    payload["chunks"][0]["text"] = "edited by hand"
+    assert decode_value(encode_value(payload)) == payload
+
+
+def test_cache_migrates_legacy_json_rows(tmp_path: Path):
+    legacy = _transcript_payload(3)
+    conn = sqlite3.connect(tmp_path / "cache.sqlite")
+    conn.execute("""
+        CREATE TABLE cache_entries (
+            cache_key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            schema_version INTEGER NOT NULL
+        )
+        """)
+    conn.execute(
+        "INSERT INTO cache_entries VALUES (?, ?, ?, ?)",
+        ("old", json.dumps(legacy), time.time() + 60, 1),
+    )
+    conn.commit()
+    conn.close()
+
+    cache = TranscriptCache(tmp_path)
+    stored, version = cache._conn.execute(
+        "SELECT value, schema_version FROM cache_entries WHERE cache_key = 'old'"
+    ).fetchone()
+    assert isinstance(stored, bytes)
+    assert version == SCHEMA_VERSION
+    assert cache.get("old") == legacy
+
+
+def test_cache_has_expiry_index(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    indexes = {
+        row[1] for row in cache._conn.execute("PRAGMA index_list(cache_entries)")
+    }
+    assert "idx_cache_entries_expires_at" in indexes
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = TranscriptCache(tmp_path, max_entries=2)
+    cache.set("a", {"value": 1}, ttl_days=1)
+    cache.set("b", {"value": 2}, ttl_days=1)
+    assert cache.get("a") == {"value": 1}
+    cache.set("c", {"value": 3}, ttl_days=1)
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("c") == {"value": 3}
+
+
+def test_cache_evict_by_bytes(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    for idx in range(5):
+        cache.set(f"k{idx}", {"value": idx}, ttl_days=1)
+    per_entry = cache.stats()["total_bytes"] // 5
+    assert cache.evict(max_bytes=per_entry * 2) == 3
+    assert cache.stats()["entries"] == 2
+    assert cache.get("k4") == {"value": 4}
+
+
+def test_cache_prune_stats_and_vacuum(tmp_path: Path):
+    cache = TranscriptCache(tmp_path, max_entries=2)
+    cache.set("old", {"value": 1}, ttl_days=-1)
+    cache.set("fresh", {"value": 2}, ttl_days=1)
+    assert cache.prune() == {"expired": 1, "evicted": 0}
+    cache.vacuum()
+    stats = cache.stats()
+    assert stats["entries"] == 1
+    assert stats["expired"] == 0
+    assert stats["max_entries"] == 2
+    assert stats["file_bytes"] > 0
+
+
+def test_cache_adds_maintenance_columns_to_existing_tables(tmp_path: Path):
+    conn = sqlite3.connect(tmp_path / "cache.sqlite")
+    conn.execute("""
+        CREATE TABLE cache_entries (
+            cache_key TEXT PRIMARY KEY,
+            value TEXT NOT NULL,
+            expires_at REAL NOT NULL,
+            schema_version INTEGER NOT NULL
+        )
+        """)
+    conn.commit()
+    conn.close()
+
+    cache = TranscriptCache(tmp_path, max_entries=5)
+    cache.set("key", {"value": 1}, ttl_days=1)
+    assert cache.get("key") == {"value": 1}
+    assert cache.stats()["total_bytes"] > 0
+
+
+def test_cache_reads_do_not_wait_for_writer(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set("key", {"value": 1}, ttl_days=1)
+    results: list = []
+    with cache._lock:
+        reader = threading.Thread(target=lambda: results.append(cache.get("key")))
+        reader.start()
+        reader.join(timeout=5)
+        assert not reader.is_alive()
+    assert results == [{"value": 1}]
+
+
+def test_cache_concurrent_reads_overlap_while_writer_holds_lock(
+    tmp_path: Path, monkeypatch
+):
+    readers, read_seconds = 4, 0.3
+    cache = TranscriptCache(tmp_path)
+    cache.set("key", {"value": 1}, ttl_days=1)
+    # Every read blocks until all readers are decoding at once, so serialised
+    # reads would break the barrier instead of passing it.
+    overlap = threading.Barrier(readers, timeout=5)
+
+    def slow_decode(raw, **kwargs):
+        overlap.wait()
+        time.sleep(read_seconds)
+        return decode_value(raw, **kwargs)
+
+    monkeypatch.setattr("tools.youtube_mcp.cache.decode_value", slow_decode)
+    results: list = []
+    errors: list = []
+
+    def read() -> None:
+        try:
+            results.append(cache.get("key"))
+        except Exception as exc:  # pragma: no cover - surfaced by the assert
+            errors.append(exc)
+
+    with cache._lock:
+        cache._conn.execute("BEGIN IMMEDIATE")
+        cache._conn.execute("UPDATE cache_entries SET expires_at = expires_at + 1")
+        threads = [threading.Thread(target=read) for _ in range(readers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=10)
+        elapsed = time.perf_counter() - started
+        cache._conn.rollback()
+
+    assert errors == []
+    assert results == [{"value": 1}] * readers
+    assert elapsed < read_seconds * 2
+    cache.close()
+
+
+def test_cache_reader_pool_stays_bounded_across_short_lived_threads(
+    tmp_path: Path,
+):
+    cache = TranscriptCache(tmp_path)
+    cache.set("key", {"value": 1}, ttl_days=1)
+    for _ in range(10):
+        threads = [threading.Thread(target=lambda: cache.get("key")) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=5)
+    assert 1 <= len(cache._readers) <= _MAX_IDLE_READERS
+    cache.close()
+    assert cache._readers == []
+
+
+def test_cache_flushes_buffered_access_times(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set("key", {"value": 1}, ttl_days=1)
+    (before,) = cache._conn.execute("SELECT last_access FROM cache_entries").fetchone()
+    time.sleep(0.01)
+    cache.get("key")
+    cache.flush_access()
+    (after,) = cache._conn.execute("SELECT last_access FROM cache_entries").fetchone()
+    assert after > before
+    cache.close()
+
+
+def test_cache_read_benchmark_smoke(tmp_path: Path):
+    from tools.youtube_mcp.benchmarks import bench_cache_reads
+
+    results = bench_cache_reads(
+        tmp_path, thread_counts=[1, 2], entries=4, segments=3, reads_per_thread=10
+    )
+    assert [row["threads"] for row in results] == [1, 2]
+    assert all(row["reads_per_second"] > 0 for row in results)
+
+
+def test_chunking_benchmark_smoke():
+    from tools.youtube_mcp.benchmarks import bench_chunking
+
+    results = bench_chunking(segments=500, repeats=1)
+    assert {row["profile"] for row in results} >= {"default", "words-200"}
+    assert all(row["chunks"] for row in results)
+
+
+def test_cache_keeps_expired_entries_for_stale_window(tmp_path: Path):
+    cache = TranscriptCache(tmp_path, max_stale_seconds=3600)
+    cache.set("recent", {"value": 1}, ttl_days=-0.01)
+    cache.set("ancient", {"value": 2}, ttl_days=-1)
+    assert cache.get("recent") is None
+    assert cache.get_stale("recent") == {"value": 1}
+    assert cache.get_stale("ancient") is None
+    assert cache.clear_expired() == 1
+    assert cache.stats()["entries"] == 1
+    cache.close()
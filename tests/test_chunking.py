@@ -1,4 +1,15 @@
-from tools.youtube_mcp.chunking import chunk_segments
+import pytest
+
+from tools.youtube_mcp.chunking import (
+    CHUNK_PROFILES,
+    ChunkProfile,
+    chunk_payload_segments,
+    chunk_segments,
+    get_chunk_profile,
+    get_tokenizer,
+    register_tokenizer,
+)
+from tools.youtube_mcp.errors import InvalidArgument
 from tools.youtube_mcp.models import Segment
 
 
@@ -39,3 +50,68 @@ def test_chunk_segments_large_overlap_keeps_all_segments():
     chunks = chunk_segments("vid", segments, target_chars=3, overlap_chars=100)
     assert len(chunks) == 2
     assert chunks[1].segment_ids == [segments[0].id, segments[1].id]
+
+
+def test_word_profile_measures_words_not_characters():
+    segments = [
+        build_segment(idx, "alpha beta gamma delta", float(idx), 1.0)
+        for idx in range(6)
+    ]
+    profile = ChunkProfile(name="w", target=8, overlap=0, tokenizer="words")
+    chunks = chunk_segments("vid", segments, profile=profile)
+    assert [len(chunk.segment_ids) for chunk in chunks] == [2, 2, 2]
+
+
+def test_sentence_boundaries_prefer_closing_segment():
+    segments = [
+        build_segment(0, "first part of a sentence.", 0.0, 1.0),
+        build_segment(1, "second sentence keeps", 1.0, 1.0),
+        build_segment(2, "going on and on", 2.0, 1.0),
+        build_segment(3, "until here.", 3.0, 1.0),
+    ]
+    plain = ChunkProfile(name="p", target=48, overlap=0)
+    sentences = ChunkProfile(name="s", target=48, overlap=0, sentence_boundaries=True)
+    assert chunk_segments("vid", segments, profile=plain)[0].segment_ids == [
+        "vid:0",
+        "vid:1",
+    ]
+    first = chunk_segments("vid", segments, profile=sentences)[0]
+    assert first.segment_ids == ["vid:0"]
+    assert first.text.endswith(".")
+
+
+def test_payload_chunking_matches_model_chunking():
+    segments = [
+        build_segment(idx, f"caption number {idx}.", float(idx), 1.5)
+        for idx in range(200)
+    ]
+    dicts = [segment.model_dump() for segment in segments]
+    for profile in CHUNK_PROFILES.values():
+        expected = [
+            chunk.model_dump()
+            for chunk in chunk_segments("vid", segments, profile=profile)
+        ]
+        assert chunk_payload_segments("vid", dicts, profile) == expected
+
+
+def test_chunking_scales_linearly_with_large_overlap():
+    calls = {"count": 0}
+
+    def counting(text: str) -> int:
+        calls["count"] += 1
+        return len(text)
+
+    register_tokenizer("counting", counting)
+    segments = [build_segment(idx, "x" * 10, float(idx), 1.0) for idx in range(5_000)]
+    profile = ChunkProfile(name="c", target=1000, overlap=900, tokenizer="counting")
+    chunks = chunk_segments("vid", segments, profile=profile)
+    assert calls["count"] == len(segments)
+    assert chunks[-1].segment_ids[-1] == "vid:4999"
+
+
+def test_unknown_profile_and_tokenizer_rejected():
+    assert get_chunk_profile(None) is CHUNK_PROFILES["default"]
+    with pytest.raises(InvalidArgument):
+        get_chunk_profile("paragraphs")
+    with pytest.raises(InvalidArgument):
+        get_tokenizer("bytes")
@@ -58,7 +58,7 @@ class ErrorService(StubService):
 
 @pytest.fixture(autouse=True)
 def patch_service(monkeypatch):
-    monkeypatch.setattr(cli, "YouTubeTranscriptService", StubService)
+    monkeypatch.setattr(cli, "create_service", StubService)
 
 
 def test_cli_transcript_success(monkeypatch, capsys):
@@ -82,8 +82,134 @@ def test_cli_tracks(monkeypatch, capsys):
 
 
 def test_cli_error(monkeypatch, capsys):
-    monkeypatch.setattr(cli, "YouTubeTranscriptService", ErrorService)
+    monkeypatch.setattr(cli, "create_service", ErrorService)
     exit_code = cli.main(["transcript", "--url", "bad"])
     captured = capsys.readouterr()
     assert exit_code == 1
     assert "InvalidArgument" in captured.err
+
+
+def test_cli_cache_commands(monkeypatch, capsys, tmp_path):
+    monkeypatch.setenv("YTMCP_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("YTMCP_CACHE_MAX_ENTRIES", "10")
+
+    assert cli.main(["cache", "stats"]) == 0
+    stats = json.loads(capsys.readouterr().out)
+    assert stats["entries"] == 0
+    assert stats["max_entries"] == 10
+
+    assert cli.main(["cache", "prune"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"expired": 0, "evicted": 0}
+
+    assert cli.main(["cache", "vacuum"]) == 0
+    assert "file_bytes" in json.loads(capsys.readouterr().out)
+
+
+def test_cli_warm(monkeypatch, capsys, tmp_path):
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("KJVz2f4Fn_U\nRDEKyxDIuLQ\n")
+    warmed: list[str] = []
+
+    class WarmService(StubService):
+        def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str:
+            warmed.append(url)
+            assert refresh_before_seconds == 86400
+            return "fetched"
+
+    monkeypatch.setattr(cli, "create_service", WarmService)
+    exit_code = cli.main(
+        [
+            "warm",
+            "--ids-file",
+            str(ids_file),
+            "--scripts-root",
+            str(tmp_path / "none"),
+            "--refresh-before-days",
+            "1",
+        ]
+    )
+    assert exit_code == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["fetched"] == 2
+    assert len(warmed) == 2
+
+
+def test_cli_transcript_window(monkeypatch, capsys):
+    captured: dict = {}
+
+    class WindowService(StubService):
+        def get_transcript(self, url: str, **kwargs) -> TranscriptResponse:
+            captured.update(kwargs)
+            return super().get_transcript(url)
+
+    monkeypatch.setattr(cli, "create_service", WindowService)
+    exit_code = cli.main(
+        ["transcript", "--url", "abc", "--start", "720", "--offset", "2"]
+    )
+    assert exit_code == 0
+    assert captured == {
+        "lang": None,
+        "prefer_auto": False,
+        "start": 720.0,
+        "offset": 2,
+    }
+
+
+def test_cli_search_reads_cache_only(monkeypatch, capsys, tmp_path):
+    from tools.youtube_mcp.cache import TranscriptCache
+
+    monkeypatch.setenv("YTMCP_CACHE_DIR", str(tmp_path))
+    cache = TranscriptCache(tmp_path)
+    cache.set(
+        "key",
+        {
+            "video": {"id": "KJVz2f4Fn_U", "url": "u", "title": "Example"},
+            "captions": {"lang": "en", "is_auto": False, "track_name": None},
+            "segments": [],
+            "chunks": [
+                {
+                    "id": "KJVz2f4Fn_U:chunk:0",
+                    "text": "starship refuelling demo",
+                    "start": 42.0,
+                    "end": 50.0,
+                    "segment_ids": [],
+                    "cite_url": "https://www.youtube.com/watch?v=KJVz2f4Fn_U&t=42s",
+                }
+            ],
+            "hash": "h",
+        },
+        ttl_days=1,
+    )
+    cache.close()
+
+    def no_service(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("search must not build the YouTube service")
+
+    monkeypatch.setattr(cli, "create_service", no_service)
+    assert cli.main(["search", "refuelling", "--limit", "5"]) == 0
+    hits = json.loads(capsys.readouterr().out)["hits"]
+    assert [hit["cite_url"] for hit in hits] == [
+        "https://www.youtube.com/watch?v=KJVz2f4Fn_U&t=42s"
+    ]
+
+    assert cli.main(["search", "??"]) == 1
+    assert "InvalidArgument" in capsys.readouterr().err
+
+
+def test_cli_import_skips_heavy_dependencies():
+    from tools.youtube_mcp.benchmarks import bench_import_time
+
+    result = bench_import_time("tools.youtube_mcp.cli", repeats=1)
+    assert result["heavy"] == []
+    # Generous ceiling: catches an eager FastAPI/YouTube client import
+    # without being sensitive to slow CI machines.
+    assert result["seconds"] < 2.0
+
+
+def test_package_exports_resolve_lazily():
+    import tools.youtube_mcp as package
+
+    assert package.Settings is cli.Settings
+    assert "YouTubeTranscriptService" in dir(package)
+    with pytest.raises(AttributeError):
+        package.DoesNotExist  # noqa: B018
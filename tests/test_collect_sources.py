@@ -1,10 +1,29 @@
+import hashlib
+import io
 import json
 import pathlib
+import threading
 import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+
+import pytest
 
 import src.collect_sources as cs
 
 
+def _fake_fetch(write, written=None):
+    """``fetch_source`` stub that writes ``write(url)`` to the destination."""
+
+    def fake(url, dest, previous=None, *, limiter=None):
+        dest.write_text(write(url))
+        if written is not None:
+            written[url] = dest
+        return cs.SourceRecord(url=url, filename=dest.name, status="downloaded")
+
+    return fake
+
+
 def test_download_url_handles_error(monkeypatch, tmp_path):
     seen = {}
 
@@ -22,53 +41,36 @@ def test_download_url_handles_error(monkeypatch, tmp_path):
     assert seen["timeout"] == cs.URL_TIMEOUT
 
 
-def test_download_url_success(monkeypatch, tmp_path):
-    class DummyResponse:
-        def __init__(self, data=b"hi"):
-            self.data = data
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            pass
+class DummyResponse(io.BytesIO):
+    status = 200
+    headers: ClassVar[dict[str, str]] = {}
 
-        def read(self):
-            return self.data
 
+def test_download_url_success(monkeypatch, tmp_path):
     def fake_urlopen(req, *, timeout=None):
         assert timeout == cs.URL_TIMEOUT
         assert req.get_header("User-agent") == cs.USER_AGENT
-        return DummyResponse()
+        return DummyResponse(b"hi")
 
     monkeypatch.setattr(cs.urllib.request, "urlopen", fake_urlopen)
     dest = tmp_path / "out.txt"
     result = cs.download_url("http://example.com/out.txt", dest)
     assert result is True
     assert dest.read_bytes() == b"hi"
+    assert not (tmp_path / "out.txt.part").exists()
 
 
 def test_download_url_write_error(monkeypatch, tmp_path):
-    class DummyResponse:
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            pass
-
-        def read(self):
-            return b"data"
-
     def fake_urlopen(req, *, timeout=None):
-        return DummyResponse()
+        return DummyResponse(b"data")
 
     dest = tmp_path / "out.txt"
 
-    def fail_write(self, _data):
+    def fail_open(self, *args, **kwargs):
         raise OSError("disk full")
 
     monkeypatch.setattr(cs.urllib.request, "urlopen", fake_urlopen)
-    monkeypatch.setattr(pathlib.Path, "write_bytes", fail_write)
+    monkeypatch.setattr(pathlib.Path, "open", fail_open)
     result = cs.download_url("http://example.com/out.txt", dest)
     assert result is False
     assert not dest.exists()
@@ -84,11 +86,7 @@ def test_process_video_dir_and_main(monkeypatch, tmp_path):
     urls_file = tmp_path / "source_urls.txt"
     urls_file.write_text("http://example.com/global.txt\n")
 
-    def fake_download(url, dest):
-        dest.write_text(f"data for {url}")
-        return True
-
-    monkeypatch.setattr(cs, "download_url", fake_download)
+    monkeypatch.setattr(cs, "fetch_source", _fake_fetch(lambda url: f"data for {url}"))
     monkeypatch.setattr(cs, "VIDEO_ROOT", tmp_path)
     global_dir = tmp_path / "sources"
     monkeypatch.setenv(cs.SOURCE_URLS_ENV, str(urls_file))
@@ -118,7 +116,7 @@ def test_cli_entrypoint(monkeypatch, tmp_path):
     monkeypatch.setattr(cs, "VIDEO_ROOT", tmp_path)
     called = []
 
-    def fake_process(path):
+    def fake_process(path, downloader=None):
         called.append(path)
 
     monkeypatch.setattr(cs, "process_video_dir", fake_process)
@@ -150,11 +148,7 @@ def test_sources_json_has_trailing_newline(monkeypatch, tmp_path):
     vid_dir.mkdir()
     (vid_dir / "sources.txt").write_text("http://example.com/a.txt\n")
 
-    def fake_download(url, dest):
-        dest.write_text("data")
-        return True
-
-    monkeypatch.setattr(cs, "download_url", fake_download)
+    monkeypatch.setattr(cs, "fetch_source", _fake_fetch(lambda url: "data"))
     cs.process_video_dir(vid_dir)
 
     content = (vid_dir / "sources.json").read_text()
@@ -168,13 +162,7 @@ def test_process_global_sources(monkeypatch, tmp_path):
     )
 
     written: dict[str, pathlib.Path] = {}
-
-    def fake_download(url, dest):
-        dest.write_text("data")
-        written[url] = dest
-        return True
-
-    monkeypatch.setattr(cs, "download_url", fake_download)
+    monkeypatch.setattr(cs, "fetch_source", _fake_fetch(lambda url: "data", written))
     global_dir = tmp_path / "sources"
 
     mapping = cs.process_global_sources(source_file=urls_file, dest_dir=global_dir)
@@ -210,3 +198,223 @@ def test_resolve_global_sources_dir_expands_env_and_user(monkeypatch, tmp_path):
     resolved = cs._resolve_global_sources_dir()
 
     assert resolved == tmp_path / "cache" / "downloads"
+
+
+class _SourceHandler(BaseHTTPRequestHandler):
+    """Serves ``bodies`` with strong ETags, ``If-None-Match`` and ``Range``."""
+
+    bodies: ClassVar[dict[str, bytes]] = {}
+    seen: ClassVar[list[dict[str, str]]] = []
+    shifted: ClassVar[set[str]] = set()
+    # Paths served without validators, whose ranges are honoured regardless.
+    bare: ClassVar[set[str]] = set()
+    # Paths whose full-body responses stop after this many bytes.
+    truncated: ClassVar[dict[str, int]] = {}
+    # Paths that wait for an event before answering.
+    gates: ClassVar[dict[str, threading.Event]] = {}
+    finished: ClassVar[list[str]] = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self._serve()
+        self.finished.append(self.path)
+
+    def _serve(self):
+        body = self.bodies[self.path]
+        etag = '"' + hashlib.sha256(body).hexdigest()[:8] + '"'
+        self.seen.append(dict(self.headers))
+        if self.path in self.gates:
+            self.gates[self.path].wait(5)
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        start = 0
+        range_header = self.headers.get("Range", "")
+        if range_header and self.path in self.shifted:
+            # Misbehaving server: answer any range with one that starts at 5.
+            start = 5
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}")
+        elif range_header and (
+            self.path in self.bare or self.headers.get("If-Range") == etag
+        ):
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}"
+            )
+        else:
+            self.send_response(200)
+        if self.path not in self.bare:
+            self.send_header("ETag", etag)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if start == 0 and self.path in self.truncated:
+            self.wfile.write(body[: self.truncated.pop(self.path)])
+            return
+        self.wfile.write(body[start:])
+
+
+@pytest.fixture
+def source_server():
+    _SourceHandler.bodies = {}
+    _SourceHandler.seen = []
+    _SourceHandler.shifted = set()
+    _SourceHandler.bare = set()
+    _SourceHandler.truncated = {}
+    _SourceHandler.gates = {}
+    _SourceHandler.finished = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SourceHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", _SourceHandler
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_source_resumes_then_revalidates(tmp_path, source_server):
+    base, handler = source_server
+    body = bytes(range(256)) * 1000
+    handler.bodies["/paper.pdf"] = body
+    etag = '"' + hashlib.sha256(body).hexdigest()[:8] + '"'
+    dest = tmp_path / "1.pdf"
+    (tmp_path / "1.pdf.part").write_bytes(body[:1000])
+
+    record = cs.fetch_source(f"{base}/paper.pdf", dest, {"partial": {"etag": etag}})
+
+    assert record.status == "resumed"
+    assert record.transferred == len(body) - 1000
+    assert dest.read_bytes() == body
+    assert record.sha256 == hashlib.sha256(body).hexdigest()
+    assert not (tmp_path / "1.pdf.part").exists()
+
+    again = cs.fetch_source(f"{base}/paper.pdf", dest, record.to_dict())
+
+    assert again.status == "not_modified"
+    assert again.transferred == 0
+    assert again.sha256 == record.sha256
+    assert handler.seen[-1]["If-None-Match"] == etag
+
+
+def test_fetch_source_restarts_when_range_does_not_continue_part(
+    tmp_path, source_server
+):
+    base, handler = source_server
+    body = b"0123456789" * 100
+    handler.bodies["/shifted.bin"] = body
+    handler.shifted.add("/shifted.bin")
+    dest = tmp_path / "1.bin"
+    (tmp_path / "1.bin.part").write_bytes(body[:3])
+
+    record = cs.fetch_source(f"{base}/shifted.bin", dest, {"partial": {"etag": '"x"'}})
+
+    assert record.status == "downloaded"
+    assert dest.read_bytes() == body
+    assert record.sha256 == hashlib.sha256(body).hexdigest()
+    assert [headers.get("Range") for headers in handler.seen] == ["bytes=3-", None]
+
+
+@pytest.mark.parametrize("path", ["/tagged.bin", "/bare.bin"])
+def test_fetch_source_resumes_from_sidecar_without_manifest(
+    tmp_path, source_server, path
+):
+    base, handler = source_server
+    body = bytes(range(256)) * 100
+    handler.bodies[path] = body
+    handler.truncated[path] = 1000
+    if path == "/bare.bin":
+        handler.bare.add(path)
+    dest = tmp_path / "1.bin"
+
+    failed = cs.fetch_source(f"{base}{path}", dest)
+    assert failed.status == "failed"
+    assert (tmp_path / "1.bin.part").stat().st_size == 1000
+
+    # A killed run writes no manifest; the sidecar alone drives the resume.
+    record = cs.fetch_source(f"{base}{path}", dest)
+
+    assert record.status == "resumed"
+    assert record.transferred == len(body) - 1000
+    assert dest.read_bytes() == body
+    assert record.sha256 == hashlib.sha256(body).hexdigest()
+    assert handler.seen[-1]["Range"] == "bytes=1000-"
+    assert ("If-Range" in handler.seen[-1]) is (path == "/tagged.bin")
+    assert not (tmp_path / "1.bin.part").exists()
+    assert not (tmp_path / "1.bin.part.json").exists()
+
+
+def test_main_shares_one_pool_and_fetches_each_url_once(
+    monkeypatch, tmp_path, source_server
+):
+    base, handler = source_server
+    handler.bodies = {"/slow.pdf": b"slow", "/fast.txt": b"fast", "/both.txt": b"b"}
+    # /slow.pdf only answers once /fast.txt, listed by a later video, is done.
+    handler.gates["/slow.pdf"] = threading.Event()
+    fast_done = handler.gates["/slow.pdf"]
+    original = cs.fetch_source
+
+    def fetch(url, dest, previous=None, *, limiter=None):
+        record = original(url, dest, previous, limiter=limiter)
+        if url.endswith("/fast.txt"):
+            fast_done.set()
+        return record
+
+    monkeypatch.setattr(cs, "fetch_source", fetch)
+    monkeypatch.setattr(cs, "VIDEO_ROOT", tmp_path)
+    monkeypatch.setenv(cs.SOURCE_URLS_ENV, str(tmp_path / "missing.txt"))
+    first = tmp_path / "20250101_first"
+    second = tmp_path / "20250102_second"
+    first.mkdir()
+    second.mkdir()
+    (first / "sources.txt").write_text(f"{base}/slow.pdf\n{base}/both.txt\n")
+    (second / "sources.txt").write_text(f"{base}/fast.txt\n{base}/both.txt\n")
+
+    cs.main()
+
+    assert handler.finished.index("/fast.txt") < handler.finished.index("/slow.pdf")
+    assert handler.finished.count("/both.txt") == 1
+    assert (second / "sources" / "2.txt").samefile(first / "sources" / "2.txt")
+    manifest = json.loads((second / "sources" / "manifest.json").read_text())
+    statuses = {entry["url"]: entry["status"] for entry in manifest["sources"]}
+    assert statuses == {f"{base}/fast.txt": "downloaded", f"{base}/both.txt": "linked"}
+    assert json.loads((second / "sources.json").read_text()) == {
+        f"{base}/fast.txt": "1.txt",
+        f"{base}/both.txt": "2.txt",
+    }
+
+
+def test_downloads_dedupe_across_videos_and_keep_files_when_renumbered(
+    tmp_path, source_server
+):
+    base, handler = source_server
+    handler.bodies = {"/a.txt": b"shared", "/mirror.txt": b"shared", "/b.txt": b"b"}
+    downloader = cs.SourceDownloader(max_workers=4, per_host=1)
+    first = tmp_path / "first"
+    second = tmp_path / "second"
+
+    cs._download_sources([f"{base}/a.txt", f"{base}/b.txt"], first, downloader)
+    mapping = cs._download_sources(
+        [f"{base}/b.txt", f"{base}/mirror.txt"], second, downloader
+    )
+
+    assert mapping == {f"{base}/b.txt": "1.txt", f"{base}/mirror.txt": "2.txt"}
+    assert (second / "2.txt").samefile(first / "1.txt")
+    manifest = json.loads((second / "manifest.json").read_text())
+    assert manifest["counts"] == {"downloaded": 2}
+    entries = {entry["url"]: entry for entry in manifest["sources"]}
+    assert entries[f"{base}/mirror.txt"]["duplicate_of"] == str(
+        pathlib.Path("..", "first", "1.txt")
+    )
+    assert entries[f"{base}/b.txt"]["size"] == 1
+
+    # Reordering the list keeps each URL's file and only revalidates.
+    mapping = cs._download_sources([f"{base}/b.txt", f"{base}/a.txt"], first)
+
+    assert mapping == {f"{base}/b.txt": "2.txt", f"{base}/a.txt": "1.txt"}
+    assert (first / "1.txt").read_bytes() == b"shared"
+    manifest = json.loads((first / "manifest.json").read_text())
+    assert manifest["counts"] == {"not_modified": 2}
@@ -2,26 +2,16 @@
 
 from __future__ import annotations
 
-import io
 import json
 from collections.abc import Iterator
 from pathlib import Path
 
 import pytest
+import requests
 
 import src.enrich_metadata as em
 
 
-class DummyResponse(io.BytesIO):
-    """Simple context manager wrapper for urlopen stubs."""
-
-    def __enter__(self) -> DummyResponse:
-        return self
-
-    def __exit__(self, *exc_info) -> bool:
-        return False
-
-
 def _build_api_payload(video_ids: Iterator[str]) -> bytes:
     items = []
     for idx, video_id in enumerate(video_ids, start=1):
@@ -66,16 +56,18 @@ def test_parse_duration_various_cases(value: str, expected: int) -> None:
 
 
 def test_fetch_video_metadata_batches_requests(monkeypatch: pytest.MonkeyPatch) -> None:
-    calls: list[str] = []
-
-    def fake_urlopen(url: str):
-        calls.append(url)
-        query = dict(part.split("=", 1) for part in url.split("?")[1].split("&"))
-        assert query["part"] == ",".join(em.API_PARTS)
-        ids = query["id"].split(",")
-        return DummyResponse(_build_api_payload(ids))
-
-    monkeypatch.setattr(em.urllib.request, "urlopen", fake_urlopen)
+    calls: list[dict[str, str]] = []
+
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        calls.append(params)
+        assert params["part"] == ",".join(em.API_PARTS)
+        assert timeout
+        response = requests.Response()
+        response.status_code = 200
+        response._content = _build_api_payload(params["id"].split(","))
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
     ids = [f"vid{i}" for i in range(55)]  # force two batches (50 + 5)
     info_map = em.fetch_video_metadata(ids, "token")
 
@@ -156,7 +148,7 @@ def test_main_dry_run_and_update(
     monkeypatch.setenv(em.ENV_VAR, "token")
     monkeypatch.setattr(em, "VIDEO_ROOT", repo / "video_scripts")
 
-    def fake_fetch(ids: list[str], youtube_key: str):
+    def fake_fetch(ids: list[str], youtube_key: str, **kwargs):
         assert youtube_key == "token"
         assert ids == ["abc"]
         return {
@@ -189,3 +181,29 @@ def test_main_dry_run_and_update(
     assert data["view_count"] == 321
     full_output = capsys.readouterr().out
     assert "Updated" in full_output
+
+
+def test_dry_run_leaves_response_cache_untouched(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    scripts = tmp_path / "video_scripts" / "slug"
+    scripts.mkdir(parents=True)
+    (scripts / "metadata.json").write_text(json.dumps({"youtube_id": "abc"}) + "\n")
+    cache_path = tmp_path / "cache" / "videos.json"
+
+    def fake_get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["ETag"] = '"v1"'
+        response._content = _build_api_payload(params["id"].split(","))
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
+    monkeypatch.setenv(em.ENV_VAR, "token")
+    root = str(tmp_path / "video_scripts")
+
+    assert em.main(["--video-root", root, "--cache", str(cache_path), "--dry-run"]) == 0
+    assert not cache_path.exists()
+
+    assert em.main(["--video-root", root, "--cache", str(cache_path)]) == 0
+    assert json.loads(cache_path.read_text())
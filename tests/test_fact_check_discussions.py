@@ -199,3 +199,45 @@ def test_fetch_discussions_raises_for_http_error(
                 max_pages=1,
             )
         )
+
+
+def test_fetch_discussions_applies_timeout_to_shared_client(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src import fact_check_discussions
+    from src.github_client import GitHubClient, RateLimitBudget
+
+    timeouts: list[float] = []
+
+    def fake_get(*args: Any, timeout: float, **kwargs: Any) -> DummyResponse:
+        timeouts.append(timeout)
+        return DummyResponse([])
+
+    monkeypatch.setattr("requests.get", fake_get)
+    client = GitHubClient(budget=RateLimitBudget(), timeout=30)
+    for timeout in (None, 5):
+        list(
+            fact_check_discussions.fetch_discussions(
+                repo="futuroptimist/futuroptimist",
+                token=None,
+                timeout=timeout,
+                client=client,
+            )
+        )
+
+    assert timeouts == [30, 5]
+    assert client.timeout == 30
+
+
+def test_main_prints_rate_limit_budget(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    from src import fact_check_discussions
+
+    monkeypatch.setattr(
+        fact_check_discussions, "build_fact_check_index", lambda **kwargs: []
+    )
+
+    assert fact_check_discussions.main(["--token", "TOKEN"]) == 0
+
+    assert "GitHub rate-limit budget:" in capsys.readouterr().out
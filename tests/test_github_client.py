@@ -0,0 +1,176 @@
+"""Tests for the shared GitHub client and rate-limit budget."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+from src import github_client
+from src.github_client import (
+    PRIORITY_LOW,
+    GitHubClient,
+    RateLimitBudget,
+    RateLimitDeferred,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_000.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class Resp:
+    def __init__(self, status_code: int = 200, headers: dict | None = None) -> None:
+        self.status_code = status_code
+        self.headers = headers or {}
+
+    def json(self) -> Any:
+        return {}
+
+
+def _limits(remaining: int, reset: float, limit: int = 5000, **extra: str) -> dict:
+    return {
+        "X-RateLimit-Limit": str(limit),
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(int(reset)),
+        **extra,
+    }
+
+
+def test_rate_limit_resource() -> None:
+    resource = github_client.rate_limit_resource
+    assert resource("https://api.github.com/search/issues?q=x") == "search"
+    assert resource("https://api.github.com/graphql") == "graphql"
+    assert resource("https://api.github.com/repos/a/b") == "core"
+
+
+def test_budget_waits_for_reset_when_bucket_is_empty() -> None:
+    clock = FakeClock()
+    budget = RateLimitBudget(clock=clock, sleep=clock.sleep)
+
+    assert budget.acquire("core") == 0
+    budget.record("core", Resp(headers=_limits(0, clock.now + 30)))
+
+    assert budget.acquire("core") == 30
+    assert clock.sleeps == [30]
+    # After the reset the bucket is assumed full again.
+    assert budget.buckets["core"].remaining == 4999
+
+
+def test_budget_defers_low_priority_calls_within_reserve() -> None:
+    clock = FakeClock()
+    budget = RateLimitBudget(
+        clock=clock, sleep=clock.sleep, low_priority_reserve={"search": 5}
+    )
+    budget.record(
+        "search",
+        Resp(
+            headers=_limits(
+                5, clock.now + 60, limit=30, **{"X-RateLimit-Resource": "search"}
+            )
+        ),
+    )
+
+    with pytest.raises(RateLimitDeferred):
+        budget.acquire("search", PRIORITY_LOW)
+    assert budget.acquire("search") == 0
+    assert budget.buckets["search"].deferred == 1
+    assert budget.summary() == (
+        "search: 1 requests, 4/30 remaining, 2 consumed, 1 deferred"
+    )
+
+
+def test_budget_defers_when_reset_is_too_far_away() -> None:
+    clock = FakeClock()
+    budget = RateLimitBudget(max_wait=10, clock=clock, sleep=clock.sleep)
+    budget.record("core", Resp(headers=_limits(0, clock.now + 600)))
+
+    with pytest.raises(RateLimitDeferred, match="exhausted"):
+        budget.acquire("core")
+    assert clock.sleeps == []
+
+
+def test_client_retries_once_after_secondary_rate_limit(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    clock = FakeClock()
+    budget = RateLimitBudget(clock=clock, sleep=clock.sleep)
+    responses = [Resp(403, {"Retry-After": "7"}), Resp(200, _limits(4990, 2_000))]
+    calls: list[dict] = []
+
+    def fake_get(url: str, *, headers: dict, timeout: float, params: dict) -> Resp:
+        calls.append(params)
+        return responses.pop(0)
+
+    monkeypatch.setattr(github_client.requests, "get", fake_get)
+    client = GitHubClient(budget=budget)
+
+    response = client.get(
+        "https://api.github.com/repos/a/b/discussions", {}, params={"page": 1}
+    )
+
+    assert response.status_code == 200
+    assert calls == [{"page": 1}, {"page": 1}]
+    assert clock.sleeps == [7]
+    assert budget.buckets["core"].requests == 2
+
+
+def test_repo_status_defers_merged_pr_count_when_search_budget_is_low(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    from src import repo_status
+
+    urls: list[str] = []
+
+    class DummyResp(Resp):
+        def __init__(self, data: Any) -> None:
+            super().__init__()
+            self._data = data
+
+        def raise_for_status(self) -> None:
+            pass
+
+        def json(self) -> Any:
+            return self._data
+
+    def fake_get(self, url: str, headers: dict, timeout: float) -> DummyResp:
+        urls.append(url)
+        if url == "https://api.github.com/repos/user/repo":
+            return DummyResp({"default_branch": "main", "stargazers_count": 1})
+        if "/commits" in url:
+            return DummyResp([{"sha": "abc", "commit": {"message": "feat: x"}}])
+        return DummyResp(
+            {
+                "workflow_runs": [
+                    {"conclusion": "success", "head_sha": "abc", "name": "ci"}
+                ]
+            }
+        )
+
+    monkeypatch.setattr(repo_status.requests.Session, "get", fake_get)
+    clock = FakeClock()
+    budget = RateLimitBudget(clock=clock, sleep=clock.sleep)
+    budget.record(
+        "search",
+        Resp(
+            headers=_limits(
+                2, clock.now + 60, limit=30, **{"X-RateLimit-Resource": "search"}
+            )
+        ),
+    )
+
+    (status,) = repo_status.fetch_repo_statuses([("user/repo", None)], budget=budget)
+
+    assert status == repo_status.RepoStatus("✅", stars=1, merged_prs=None)
+    assert not any("/search/" in url for url in urls)
+    assert budget.buckets["search"].deferred == 1
+    assert budget.buckets["core"].requests == len(urls)
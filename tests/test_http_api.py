@@ -1,3 +1,5 @@
+import json
+
 from fastapi.testclient import TestClient
 
 from tools.youtube_mcp.errors import InvalidArgument, NoCaptionsAvailable
@@ -6,11 +8,13 @@ from tools.youtube_mcp.models import (
     CaptionTrackInfo,
     Chunk,
     MetadataResponse,
+    SearchResponse,
     Segment,
     TracksResponse,
     TranscriptResponse,
     VideoInfo,
 )
+from tools.youtube_mcp.settings import Settings
 
 
 class StubService:
@@ -120,3 +124,171 @@ def test_http_run_sync_without_anyio(monkeypatch):
     client = TestClient(app)
     response = client.get("/transcript", params={"url": "https://youtu.be/abc"})
     assert response.status_code == 200
+
+
+def test_http_background_cache_sweep():
+    import threading
+
+    class SweepCache:
+        def __init__(self) -> None:
+            self.swept = threading.Event()
+
+        def prune(self) -> dict[str, int]:
+            self.swept.set()
+            return {"expired": 0, "evicted": 0}
+
+    service = StubService()
+    service.cache = SweepCache()
+    settings = Settings(cache_sweep_interval_seconds=0.01)
+    with TestClient(create_app(settings=settings, service=service)) as client:
+        assert client.get("/health").status_code == 200
+        assert service.cache.swept.wait(timeout=5)
+
+
+def test_http_warms_cache_on_startup(tmp_path):
+    import threading
+
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("KJVz2f4Fn_U\n")
+    warmed = threading.Event()
+
+    class WarmService(StubService):
+        def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str:
+            warmed.set()
+            return "fetched"
+
+    settings = Settings(
+        warm_on_startup=True,
+        warm_ids_file=ids_file,
+        warm_scripts_root=tmp_path / "none",
+        cache_sweep_interval_seconds=0,
+    )
+    with TestClient(create_app(settings=settings, service=WarmService())):
+        assert warmed.wait(timeout=5)
+
+
+class PayloadService(StubService):
+    def get_transcript_payload(
+        self, url: str, *, lang=None, prefer_auto=None, lazy=False
+    ):
+        return self.get_transcript(url, lang=lang, prefer_auto=prefer_auto).model_dump()
+
+
+def test_http_transcript_stream_ndjson_projection():
+    client = TestClient(create_app(service=PayloadService()))
+    response = client.get(
+        "/transcript/stream", params={"url": "abc", "fields": "video,chunks"}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    events = [json.loads(line) for line in response.text.splitlines()]
+    assert [event["type"] for event in events] == ["video", "chunk", "end"]
+    assert events[1]["data"]["cite_url"].endswith("t=0s")
+    assert events[2]["data"] == {"segments": 0, "chunks": 1, "stale": False}
+
+
+def test_http_transcript_stream_sse():
+    client = TestClient(create_app(service=PayloadService()))
+    response = client.get("/transcript/stream", params={"url": "abc", "format": "sse"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: segment\ndata:" in response.text
+
+
+def test_http_transcript_stream_rejects_bad_arguments():
+    client = TestClient(create_app(service=PayloadService()))
+    bad_fields = client.get("/transcript/stream", params={"url": "abc", "fields": "x"})
+    bad_format = client.get(
+        "/transcript/stream", params={"url": "abc", "format": "xml"}
+    )
+    assert bad_fields.status_code == 400
+    assert bad_format.json()["detail"]["code"] == "InvalidArgument"
+
+
+def test_http_transcript_forwards_window_params():
+    captured: dict = {}
+
+    class WindowService(StubService):
+        def get_transcript(self, url: str, **kwargs) -> TranscriptResponse:
+            captured.update(kwargs)
+            return super().get_transcript(url)
+
+    client = TestClient(create_app(service=WindowService()))
+    response = client.get(
+        "/transcript", params={"url": "abc", "start": 12, "end": 18, "limit": 5}
+    )
+    assert response.status_code == 200
+    assert captured == {
+        "lang": None,
+        "prefer_auto": None,
+        "start": 12.0,
+        "end": 18.0,
+        "limit": 5,
+    }
+    assert (
+        client.get("/transcript", params={"url": "abc", "offset": -1}).status_code
+        == 422
+    )
+
+
+def test_http_search_forwards_filters():
+    captured: dict = {}
+
+    class SearchService(StubService):
+        def search_transcripts(self, query: str, **kwargs) -> SearchResponse:
+            if query == "bad":
+                raise InvalidArgument("bad query")
+            captured.update(kwargs, query=query)
+            return SearchResponse(query=query, hits=[])
+
+    client = TestClient(create_app(service=SearchService()))
+    response = client.get("/search", params={"q": "starship", "video": "abc"})
+    assert response.status_code == 200
+    assert response.json() == {"query": "starship", "hits": []}
+    assert captured == {
+        "query": "starship",
+        "limit": 10,
+        "video_id": "abc",
+        "lang": None,
+    }
+    assert client.get("/search", params={"q": "bad"}).status_code == 400
+    assert client.get("/search", params={"q": "x", "limit": 0}).status_code == 422
+
+
+def test_http_metrics_exposes_latency_and_cache_gauges(tmp_path):
+    from tools.youtube_mcp.cache import TranscriptCache
+
+    class CachedService(StubService):
+        def __init__(self) -> None:
+            super().__init__()
+            self.cache = TranscriptCache(tmp_path)
+            self.cache.set("key", {"v": 1}, ttl_days=1)
+
+    client = TestClient(create_app(service=CachedService()))
+    assert client.get("/transcript", params={"url": "abc"}).status_code == 200
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert "# TYPE ytmcp_request_duration_seconds histogram" in body
+    assert (
+        'ytmcp_request_duration_seconds_count{transport="http",'
+        'endpoint="/transcript",status="200"}'
+    ) in body
+    assert "ytmcp_cache_entries 1" in body
+
+
+def test_http_module_app_is_built_on_demand(monkeypatch):
+    from tools.youtube_mcp import http_server as server_module
+
+    built = []
+
+    def fake_create_app():
+        built.append(object())
+        return built[-1]
+
+    monkeypatch.setattr(server_module, "_app", None)
+    monkeypatch.setattr(server_module, "create_app", fake_create_app)
+    assert built == []
+    assert server_module.app is server_module.app
+    assert len(built) == 1
@@ -1,9 +1,16 @@
+import io
+import json
+import threading
+import time
+
 from tools.youtube_mcp.errors import NoCaptionsAvailable
 from tools.youtube_mcp.mcp_server import MCPServer
 from tools.youtube_mcp.models import (
     CaptionTrackInfo,
     Chunk,
     MetadataResponse,
+    SearchHit,
+    SearchResponse,
     Segment,
     TracksResponse,
     TranscriptResponse,
@@ -50,6 +57,8 @@ def test_tools_list_includes_expected_methods():
     assert "youtube.get_transcript" in names
     assert "youtube.get_metadata" in names
     assert "youtube.healthcheck" in names
+    assert "youtube.search_transcripts" in names
+    assert "youtube.stats" in names
 
 
 def test_tools_call_executes_transcript():
@@ -106,3 +115,182 @@ def test_method_not_found():
         {"jsonrpc": "2.0", "id": 1, "method": "does.not.exist"}
     )
     assert response["error"]["code"] == -32601
+
+
+def _call(request_id: int, url: str) -> str:
+    return json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "tools.call",
+            "params": {"name": "youtube.get_transcript", "arguments": {"url": url}},
+        }
+    )
+
+
+def test_serve_forever_answers_requests_concurrently():
+    slow_started = threading.Event()
+    fast_done = threading.Event()
+
+    class SlowService(StubService):
+        def get_transcript(self, url: str, *, lang=None, prefer_auto=None):
+            if url == "slow":
+                slow_started.set()
+                assert fast_done.wait(timeout=5)
+            return super().get_transcript(url, lang=lang, prefer_auto=prefer_auto)
+
+    class Output(io.StringIO):
+        def write(self, text: str) -> int:
+            written = super().write(text)
+            if '"id": 2' in text:
+                fast_done.set()
+            return written
+
+    stdin = io.StringIO(
+        "\n".join([_call(1, "slow"), _call(2, "fast"), "", "not json"]) + "\n"
+    )
+    stdout = Output()
+    MCPServer(SlowService(), max_in_flight=2).serve_forever(stdin, stdout)
+
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    by_id = {response["id"]: response for response in responses}
+    assert slow_started.is_set()
+    assert [response["id"] for response in responses if response["id"]] == [2, 1]
+    assert by_id[None]["error"]["code"] == -32700
+    assert by_id[1]["result"]["video"]["url"] == "slow"
+
+
+def test_serve_forever_limits_requests_in_flight():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class CountingService(StubService):
+        def get_transcript(self, url: str, *, lang=None, prefer_auto=None):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with lock:
+                active -= 1
+            return super().get_transcript(url, lang=lang, prefer_auto=prefer_auto)
+
+    stdin = io.StringIO("\n".join(_call(idx, "abc") for idx in range(8)) + "\n")
+    stdout = io.StringIO()
+    MCPServer(CountingService(), max_in_flight=2).serve_forever(stdin, stdout)
+
+    ids = sorted(json.loads(line)["id"] for line in stdout.getvalue().splitlines())
+    assert ids == list(range(8))
+    assert peak <= 2
+
+
+def test_serve_forever_rejects_non_object_requests():
+    class BrokenService(StubService):
+        def get_metadata(self, url: str) -> MetadataResponse:
+            raise RuntimeError("boom")
+
+    metadata_call = json.dumps(
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "tools.call",
+            "params": {"name": "youtube.get_metadata", "arguments": {"url": "x"}},
+        }
+    )
+    stdin = io.StringIO("\n".join(["[]", "42", '"hi"', metadata_call]) + "\n")
+    stdout = io.StringIO()
+    MCPServer(BrokenService(), max_in_flight=2).serve_forever(stdin, stdout)
+
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    invalid = [response for response in responses if response["id"] is None]
+    assert [response["error"]["code"] for response in invalid] == [-32600] * 3
+    (failed,) = [response for response in responses if response["id"] == 3]
+    assert "error" in failed
+
+
+def test_tools_call_forwards_window_arguments():
+    captured: dict = {}
+
+    class WindowService(StubService):
+        def get_transcript(self, url: str, **kwargs) -> TranscriptResponse:
+            captured.update(kwargs)
+            return super().get_transcript(url)
+
+    server = MCPServer(WindowService())
+    response = server.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools.call",
+            "params": {
+                "name": "youtube.get_transcript",
+                "arguments": {"url": "abc", "start": 720, "end": 1080},
+            },
+        }
+    )
+    assert "result" in response
+    assert captured == {"lang": None, "prefer_auto": None, "start": 720, "end": 1080}
+
+
+def test_tools_call_search_transcripts():
+    captured: dict = {}
+
+    class SearchService(StubService):
+        def search_transcripts(self, query: str, **kwargs) -> SearchResponse:
+            captured.update(kwargs, query=query)
+            return SearchResponse(
+                query=query,
+                hits=[
+                    SearchHit(
+                        video_id="abc",
+                        chunk_id="abc:chunk:0",
+                        text="hello",
+                        snippet="[hello]",
+                        start=0.0,
+                        end=1.0,
+                        cite_url="https://www.youtube.com/watch?v=abc&t=0s",
+                        score=1.5,
+                    )
+                ],
+            )
+
+    server = MCPServer(SearchService())
+    response = server.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "id": 7,
+            "method": "tools.call",
+            "params": {
+                "name": "youtube.search_transcripts",
+                "arguments": {"query": "hello", "limit": 3},
+            },
+        }
+    )
+    assert response["result"]["hits"][0]["cite_url"].endswith("t=0s")
+    assert captured == {"query": "hello", "limit": 3, "video_id": None, "lang": None}
+
+
+def test_tools_call_stats_and_records_latency(tmp_path):
+    from tools.youtube_mcp import metrics
+    from tools.youtube_mcp.cache import TranscriptCache
+    from tools.youtube_mcp.settings import Settings
+    from tools.youtube_mcp.youtube_client import YouTubeTranscriptService
+
+    service = YouTubeTranscriptService(
+        Settings(cache_dir=tmp_path), cache=TranscriptCache(tmp_path)
+    )
+    server = MCPServer(service)
+    before = metrics.REQUEST_SECONDS.count("mcp", "youtube.stats", "ok")
+    response = server.handle_request(
+        {
+            "jsonrpc": "2.0",
+            "id": 3,
+            "method": "tools.call",
+            "params": {"name": "youtube.stats", "arguments": {}},
+        }
+    )
+    result = response["result"]
+    assert result["cache"]["entries"] == 0
+    assert result["metrics"]["ytmcp_cache_lookups_total"]["type"] == "counter"
+    assert metrics.REQUEST_SECONDS.count("mcp", "youtube.stats", "ok") == before + 1
@@ -0,0 +1,77 @@
+import pytest
+
+from tools.youtube_mcp import metrics
+from tools.youtube_mcp.cache import TranscriptCache
+from tools.youtube_mcp.metrics import MetricsRegistry
+
+
+def test_render_uses_prometheus_text_format():
+    registry = MetricsRegistry()
+    calls = registry.counter("demo_calls_total", "Demo calls.", ("outcome",))
+    latency = registry.histogram(
+        "demo_seconds", "Demo latency.", ("op",), buckets=(0.1, 1.0)
+    )
+    size = registry.gauge("demo_size", 'Size with "quotes".')
+    calls.inc("ok")
+    calls.inc("ok", amount=2)
+    latency.observe(0.05, "fetch")
+    latency.observe(0.5, "fetch")
+    size.set(7)
+
+    assert registry.render().splitlines() == [
+        "# HELP demo_calls_total Demo calls.",
+        "# TYPE demo_calls_total counter",
+        'demo_calls_total{outcome="ok"} 3',
+        "# HELP demo_seconds Demo latency.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{op="fetch",le="0.1"} 1',
+        'demo_seconds_bucket{op="fetch",le="1"} 2',
+        'demo_seconds_bucket{op="fetch",le="+Inf"} 2',
+        'demo_seconds_sum{op="fetch"} 0.55',
+        'demo_seconds_count{op="fetch"} 2',
+        '# HELP demo_size Size with \\"quotes\\".',
+        "# TYPE demo_size gauge",
+        "demo_size 7",
+    ]
+    snapshot = registry.snapshot()
+    assert snapshot["demo_seconds"]["samples"][0]["buckets"] == {"0.1": 1, "1": 2}
+    assert snapshot["demo_calls_total"]["samples"] == [
+        {"labels": {"outcome": "ok"}, "value": 3.0}
+    ]
+
+
+def test_metric_validation():
+    registry = MetricsRegistry()
+    counter = registry.counter("demo_total", "Demo.", ("kind",))
+    with pytest.raises(ValueError):
+        counter.inc()
+    with pytest.raises(ValueError):
+        counter.inc("a", amount=-1)
+    with pytest.raises(ValueError):
+        registry.counter("demo_total", "Duplicate.")
+
+
+def test_cache_records_lookups_and_evictions(tmp_path):
+    cache = TranscriptCache(tmp_path, max_entries=1)
+    before = {result: metrics.CACHE_LOOKUPS.value(result) for result in ("hit", "miss")}
+    evicted_before = metrics.CACHE_EVICTIONS.value("lru")
+    try:
+        cache.set("a", {"v": 1}, ttl_days=1)
+        assert cache.get("a") == {"v": 1}
+        assert cache.get("missing") is None
+        cache.set("b", {"v": 2}, ttl_days=1)
+    finally:
+        cache.close()
+    assert metrics.CACHE_LOOKUPS.value("hit") == before["hit"] + 1
+    assert metrics.CACHE_LOOKUPS.value("miss") == before["miss"] + 1
+    assert metrics.CACHE_EVICTIONS.value("lru") == evicted_before + 1
+    assert metrics.cache_hit_ratio() is not None
+
+
+def test_record_upstream_call_flags_rate_limits():
+    before = metrics.RATE_LIMIT_EVENTS.value("metadata")
+    calls = metrics.UPSTREAM_CALLS.value("metadata", "RateLimited")
+    metrics.record_upstream_call("metadata", "RateLimited", 0.2)
+    assert metrics.RATE_LIMIT_EVENTS.value("metadata") == before + 1
+    assert metrics.UPSTREAM_CALLS.value("metadata", "RateLimited") == calls + 1
+    assert metrics.UPSTREAM_SECONDS.count("metadata") >= 1
@@ -1,4 +1,5 @@
-from datetime import UTC, datetime
+import json
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -330,6 +331,7 @@ def test_fetch_repo_status_success(monkeypatch: pytest.MonkeyPatch) -> None:
         "https://api.github.com/repos/user/repo",
         "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=main",
+        # The consistency check re-requests the commits and runs listing heads.
         "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=main",
     ]
@@ -381,6 +383,7 @@ def test_fetch_repo_status_no_runs_returns_unknown(
         "https://api.github.com/repos/user/repo",
         "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=main",
+        # The consistency check re-requests the commits and runs listing heads.
         "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=main",
     ]
@@ -433,6 +436,7 @@ def test_fetch_repo_status_with_branch(monkeypatch: pytest.MonkeyPatch) -> None:
         "https://api.github.com/repos/user/repo",
         "https://api.github.com/repos/user/repo/commits?sha=dev&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=dev",
+        # The consistency check re-requests the commits and runs listing heads.
         "https://api.github.com/repos/user/repo/commits?sha=dev&per_page=20",
         "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed&branch=dev",
     ]
@@ -3602,6 +3606,12 @@ def test_update_readme_flywheel_regression_suppresses_stale_failure_link(
         )
 
     monkeypatch.setattr(repo_status.requests, "get", fake_get)
+    # update_readme fetches through a pooled session.
+    monkeypatch.setattr(
+        repo_status.requests.Session,
+        "get",
+        lambda self, url, headers, timeout: fake_get(url, headers, timeout),
+    )
 
     repo_status.update_readme(readme, now=datetime(2025, 9, 25, 14, 0, tzinfo=UTC))
 
@@ -4212,3 +4222,410 @@ def test_update_readme_branch_url_uses_branch_for_status_and_repo_for_stars(
     assert (
         "- ✅ ⭐ 12 🔀 ? **[DSPACE](https://democratized.space)**" in readme.read_text()
     )
+
+
+def test_fetch_repo_statuses_runs_concurrently_in_input_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import threading
+    import time
+
+    repos = [(f"user/repo{index}", None) for index in range(6)]
+    sessions: set[int] = set()
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fake_details(repo: str, token=None, branch=None) -> repo_status.RepoStatus:
+        nonlocal active, peak
+        transport = repo_status._ACTIVE_TRANSPORT.get()
+        assert transport is not None
+        with lock:
+            sessions.add(id(transport.client.session))
+            active += 1
+            peak = max(peak, active)
+        # Later repos finish first; output order must not depend on it.
+        time.sleep(0.02 * (6 - int(repo[-1])))
+        with lock:
+            active -= 1
+        return repo_status.RepoStatus("✅", stars=int(repo[-1]))
+
+    monkeypatch.setattr(repo_status, "fetch_repo_status_details", fake_details)
+
+    results = repo_status.fetch_repo_statuses(repos, max_workers=3)
+
+    assert [result.stars for result in results] == list(range(6))
+    assert len(sessions) == 1
+    assert 1 < peak <= 3
+    assert repo_status._ACTIVE_TRANSPORT.get() is None
+    assert repo_status.fetch_repo_statuses([]) == []
+
+
+def test_fetch_repo_statuses_propagates_nondeterminism(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    def fake_details(repo: str, token=None, branch=None) -> repo_status.RepoStatus:
+        if repo == "user/flaky":
+            raise RuntimeError(f"Non-deterministic workflow conclusion for {repo}")
+        return repo_status.RepoStatus("✅")
+
+    monkeypatch.setattr(repo_status, "fetch_repo_status_details", fake_details)
+
+    with pytest.raises(RuntimeError, match="user/flaky"):
+        repo_status.fetch_repo_statuses([("user/ok", None), ("user/flaky", None)])
+
+
+class HttpResp:
+    def __init__(self, status_code: int, text: str = "", headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def json(self):
+        return json.loads(self.text)
+
+
+def test_update_readme_revalidates_github_responses_with_etags(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+) -> None:
+    import logging
+
+    payloads = {
+        "https://api.github.com/search/issues?q=repo:user/repo+is:pr+is:merged&per_page=1": {
+            "total_count": 4
+        },
+        "https://api.github.com/repos/user/repo": {
+            "default_branch": "main",
+            "stargazers_count": 3,
+        },
+        "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20": [
+            _human_commit("abc")
+        ],
+        "https://api.github.com/repos/user/repo/actions/runs"
+        "?per_page=100&status=completed&branch=main": {
+            "workflow_runs": [_workflow_run("success", sha="abc")]
+        },
+    }
+    sent: list[tuple[str, str | None]] = []
+
+    def fake_session_get(self, url: str, headers: dict, timeout: int):
+        etag = headers.get("If-None-Match")
+        sent.append((url, etag))
+        if etag == f'"{url}"':
+            return HttpResp(304)
+        return HttpResp(200, json.dumps(payloads[url]), {"ETag": f'"{url}"'})
+
+    monkeypatch.setattr(repo_status.requests.Session, "get", fake_session_get)
+    readme = tmp_path / "README.md"
+    cache_path = tmp_path / "cache" / "http.json"
+    content = "## Related Projects\n- https://github.com/user/repo\n"
+    now = datetime(2020, 1, 2, 3, 4, tzinfo=UTC)
+
+    readme.write_text(content)
+    repo_status.update_readme(readme, now=now, http_cache_path=cache_path)
+    first = readme.read_text()
+    # The consistency-check attempt already revalidates within the first run.
+    first_sent = dict(reversed(sent))
+    assert set(first_sent) == set(payloads)
+    assert all(etag is None for etag in first_sent.values())
+    assert set(json.loads(cache_path.read_text())) == set(payloads)
+
+    sent.clear()
+    readme.write_text(content)
+    with caplog.at_level(logging.INFO, logger=repo_status.LOGGER.name):
+        repo_status.update_readme(readme, now=now, http_cache_path=cache_path)
+
+    assert readme.read_text() == first
+    assert "- ✅ ⭐ 3 🔀 4 https://github.com/user/repo" in first
+    assert sent and all(etag == f'"{url}"' for url, etag in sent)
+    assert f"{len(sent)} not modified (304)" in caplog.text
+
+
+def test_github_response_cache_ignores_corrupt_file_and_uncacheable_responses(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "http.json"
+    path.write_text("{not json")
+    cache = repo_status.GitHubResponseCache(path)
+    url = "https://api.github.com/repos/user/repo"
+
+    assert cache.conditional_headers(url) == {}
+    cache.store(url, HttpResp(200, "{}"))
+    assert cache.not_modified(url) is None
+    cache.store(url, HttpResp(200, '{"a": 1}', {"Last-Modified": "Mon"}))
+    assert cache.conditional_headers(url) == {"If-Modified-Since": "Mon"}
+    assert cache.not_modified(url).json() == {"a": 1}
+    assert cache.stats == {"not_modified": 1, "stored": 1, "uncached": 1}
+    cache.save()
+    assert repo_status.GitHubResponseCache(path).conditional_headers(url) == {
+        "If-Modified-Since": "Mon"
+    }
+
+
+def _graphql_repo(branch: str, stars: int, merged: int, shas: list[str]) -> dict:
+    return {
+        "stargazerCount": stars,
+        "pullRequests": {"totalCount": merged},
+        "defaultBranchRef": {
+            "name": branch,
+            "target": {
+                "history": {
+                    "nodes": [
+                        {
+                            "oid": sha,
+                            "message": "feat: update",
+                            "author": {
+                                "name": "Alice",
+                                "email": "alice@example.com",
+                                "user": {"login": "alice"},
+                            },
+                            "committer": {
+                                "name": "Alice",
+                                "email": "alice@example.com",
+                                "user": None,
+                            },
+                        }
+                        for sha in shas
+                    ]
+                }
+            },
+        },
+    }
+
+
+def test_fetch_repo_metadata_batch_uses_aliased_queries(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    posts: list[dict] = []
+
+    def fake_post(url: str, headers: dict, json: dict, timeout: int):
+        assert url == repo_status.GRAPHQL_URL
+        assert headers["Authorization"] == "Bearer t"
+        posts.append(json)
+        variables = json["variables"]
+        data = {}
+        for index in range(len(variables) // 2):
+            name = variables[f"n{index}"]
+            data[f"r{index}"] = (
+                None if name == "gone" else _graphql_repo("main", index, 7, ["abc"])
+            )
+        return DummyResp({"data": data, "errors": [{"message": "gone"}]})
+
+    monkeypatch.setattr(repo_status.requests, "post", fake_post)
+
+    assert repo_status.fetch_repo_metadata_batch(["user/a"], None) == {}
+    assert posts == []
+
+    repos = ["user/a", "user/b", "user/gone", "user/a"]
+    result = repo_status.fetch_repo_metadata_batch(repos, "t", batch_size=2)
+
+    assert len(posts) == 2
+    assert "r1: repository(owner: $o1, name: $n1)" in posts[0]["query"]
+    assert posts[0]["variables"] == {"o0": "user", "n0": "a", "o1": "user", "n1": "b"}
+    assert result == {
+        "user/a": repo_status.RepoMetadata("main", 0, 7),
+        "user/b": repo_status.RepoMetadata("main", 1, 7),
+    }
+    assert result["user/a"].head_commits == (
+        {
+            "sha": "abc",
+            "commit": {
+                "message": "feat: update",
+                "author": {"name": "Alice", "email": "alice@example.com"},
+                "committer": {"name": "Alice", "email": "alice@example.com"},
+            },
+            "author": {"login": "alice"},
+            "committer": None,
+        },
+    )
+
+
+def test_fetch_repo_statuses_uses_graphql_metadata_and_falls_back_to_rest(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    gets: list[str] = []
+
+    def fake_post(self, url: str, headers: dict, json: dict, timeout: int):
+        # user/rest is missing from the GraphQL answer and must use REST.
+        return DummyResp({"data": {"r0": _graphql_repo("main", 5, 3, ["abc"])}})
+
+    def fake_get(self, url: str, headers: dict, timeout: int):
+        gets.append(url)
+        if "/actions/runs" in url:
+            return DummyResp({"workflow_runs": [_workflow_run("success", sha="abc")]})
+        if "/commits" in url:
+            return DummyResp([_human_commit("abc")])
+        if url.startswith("https://api.github.com/search/issues"):
+            return DummyResp({"total_count": 1})
+        return DummyResp({"default_branch": "main", "stargazers_count": 2})
+
+    monkeypatch.setattr(repo_status.requests.Session, "post", fake_post)
+    monkeypatch.setattr(repo_status.requests.Session, "get", fake_get)
+
+    graphql, rest = repo_status.fetch_repo_statuses(
+        [("user/graphql", None), ("user/rest", None)], "t"
+    )
+
+    assert graphql == repo_status.RepoStatus("✅", stars=5, merged_prs=3)
+    assert rest == repo_status.RepoStatus("✅", stars=2, merged_prs=1)
+    runs_head = (
+        "https://api.github.com/repos/user/graphql/actions/runs"
+        "?per_page=100&status=completed&branch=main"
+    )
+    # The batch commits stand in for the first attempt's commits page only.
+    assert [url for url in gets if "user/graphql" in url] == [
+        runs_head,
+        "https://api.github.com/repos/user/graphql/commits?sha=main&per_page=20",
+        runs_head,
+    ]
+    assert "https://api.github.com/repos/user/rest" in gets
+
+
+@pytest.mark.parametrize("head_changes", [False, True])
+def test_fetch_repo_status_details_memoizes_pages_across_attempts(
+    monkeypatch: pytest.MonkeyPatch, head_changes: bool
+) -> None:
+    runs_head = (
+        "https://api.github.com/repos/user/repo/actions/runs"
+        "?per_page=100&status=completed&branch=main"
+    )
+    calls: list[str] = []
+
+    def fake_get(url: str, headers: dict, timeout: int):
+        calls.append(url)
+        if url == "https://api.github.com/repos/user/repo":
+            return DummyResp({"default_branch": "main"})
+        if url.startswith("https://api.github.com/search/issues"):
+            return DummyResp({"total_count": 1})
+        if url.startswith("https://api.github.com/repos/user/repo/commits"):
+            return DummyResp([_human_commit("abc")])
+        if url == runs_head:
+            # Chatty unrelated runs bury the commit's CI run on page 2.
+            head_fetches = calls.count(runs_head)
+            sha = f"other{head_fetches}" if head_changes else "other"
+            return DummyResp(
+                {
+                    "workflow_runs": [
+                        _workflow_run("success", sha=sha, run_id=1000 + index)
+                        for index in range(100)
+                    ]
+                }
+            )
+        assert url == f"{runs_head}&page=2"
+        return DummyResp({"workflow_runs": [_workflow_run("success", sha="abc")]})
+
+    monkeypatch.setattr(repo_status.requests, "get", fake_get)
+
+    assert repo_status.fetch_repo_status_details("user/repo").emoji == "✅"
+    assert calls.count(runs_head) == 2
+    assert calls.count(f"{runs_head}&page=2") == (2 if head_changes else 1)
+    assert (
+        calls.count(
+            "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20"
+        )
+        == 2
+    )
+
+
+def test_fetch_repo_status_details_sees_branch_head_move_between_attempts(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    commits_head = "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20"
+    calls: list[str] = []
+
+    def fake_get(url: str, headers: dict, timeout: int):
+        calls.append(url)
+        if url == "https://api.github.com/repos/user/repo":
+            return DummyResp({"default_branch": "main"})
+        if url.startswith("https://api.github.com/search/issues"):
+            return DummyResp({"total_count": 1})
+        if url == commits_head:
+            # A push lands between the two consistency-check attempts.
+            head = "abc" if calls.count(commits_head) == 1 else "def"
+            return DummyResp([_human_commit(head)])
+        assert "/actions/runs" in url
+        return DummyResp(
+            {
+                "workflow_runs": [
+                    _workflow_run("success", sha="abc", run_id=1),
+                    _workflow_run("failure", sha="def", run_id=2, run_number=2),
+                ]
+            }
+        )
+
+    monkeypatch.setattr(repo_status.requests, "get", fake_get)
+
+    with pytest.raises(RuntimeError, match="Non-deterministic"):
+        repo_status.fetch_repo_status_details("user/repo")
+    assert calls.count(commits_head) == 2
+
+
+def test_update_readme_skips_walk_for_repos_unchanged_since_state(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    readme = tmp_path / "README.md"
+    content = "## Related Projects\n- https://github.com/user/repo\n"
+    state_path = tmp_path / "state.json"
+    runs = [_workflow_run("success", sha="abc", run_id=1)]
+    commits = [_human_commit("abc")]
+    stars = 3
+    gets: list[str] = []
+    walks: list[str] = []
+    walk = repo_status.fetch_repo_status_details
+
+    def counting_walk(repo: str, token=None, branch=None) -> repo_status.RepoStatus:
+        walks.append(repo)
+        return walk(repo, token, branch)
+
+    def fake_get(self, url: str, headers: dict, timeout: int):
+        gets.append(url)
+        if "/actions/runs" in url:
+            return DummyResp({"workflow_runs": list(runs)})
+        if "/commits" in url:
+            return DummyResp(list(commits))
+        if url.startswith("https://api.github.com/search/issues"):
+            return DummyResp({"total_count": 1})
+        return DummyResp({"default_branch": "main", "stargazers_count": stars})
+
+    monkeypatch.setattr(repo_status.requests.Session, "get", fake_get)
+    monkeypatch.setattr(repo_status, "fetch_repo_status_details", counting_walk)
+
+    def run(hours: int = 0) -> str:
+        gets.clear()
+        walks.clear()
+        readme.write_text(content)
+        repo_status.update_readme(
+            readme,
+            now=datetime(2020, 1, 2, 3, tzinfo=UTC) + timedelta(hours=hours),
+            state_path=state_path,
+        )
+        return readme.read_text()
+
+    assert "- ✅ ⭐ 3 🔀 1 https://github.com/user/repo" in run()
+    assert walks == ["user/repo"]
+    saved = json.loads(state_path.read_text())["repos"]["user/repo@"]
+    assert saved["head_sha"] == "abc"
+
+    # A bot commit on top and fresh star counts do not need a walk.
+    commits.insert(0, _bot_commit("bot1"))
+    stars = 4
+    assert "- ✅ ⭐ 4 🔀 1 https://github.com/user/repo" in run(hours=1)
+    assert walks == []
+    assert gets == [
+        "https://api.github.com/search/issues?q=repo:user/repo+is:pr+is:merged&per_page=1",
+        "https://api.github.com/repos/user/repo",
+        "https://api.github.com/repos/user/repo/commits?sha=main&per_page=20",
+        "https://api.github.com/repos/user/repo/actions/runs?per_page=100&status=completed",
+    ]
+
+    # A newly completed run changes the fingerprint.
+    runs.insert(0, _workflow_run("failure", sha="abc", run_id=2, run_number=2))
+    assert "- ❌" in run(hours=2)
+    assert walks == ["user/repo"]
+
+    # Entries older than STATE_MAX_AGE are walked again.
+    run(hours=2 + 25)
+    assert walks == ["user/repo"]
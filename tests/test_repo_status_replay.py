@@ -0,0 +1,133 @@
+"""Tests for the offline repo status record/replay benchmark."""
+
+from __future__ import annotations
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from src import repo_status_replay
+from src.repo_status_replay import BenchReport, compare_reports
+
+README = "intro\n\n## Related Projects\n- https://github.com/user/repo\n"
+
+
+def _fake_github(request: requests.PreparedRequest) -> requests.Response:
+    url = request.url or ""
+    if url == "https://api.github.com/repos/user/repo":
+        data: object = {"default_branch": "main", "stargazers_count": 7}
+    elif "/search/issues" in url:
+        data = {"total_count": 3, "incomplete_results": False}
+    elif "/commits" in url:
+        data = [{"sha": "abc", "commit": {"message": "feat: x"}}]
+    else:
+        data = {
+            "workflow_runs": [
+                {
+                    "id": 1,
+                    "conclusion": "success",
+                    "status": "completed",
+                    "head_sha": "abc",
+                    "name": "ci",
+                }
+            ]
+        }
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response.headers["Content-Type"] = "application/json"
+    response.headers["ETag"] = '"v1"'
+    response.headers["X-RateLimit-Remaining"] = "0"
+    response._content = json.dumps(data).encode("utf-8")
+    return response
+
+
+def test_request_repo_attributes_urls() -> None:
+    repo_of = repo_status_replay.request_repo
+    assert repo_of("https://api.github.com/repos/a/b/actions/runs?page=2") == "a/b"
+    assert (
+        repo_of("https://api.github.com/search/issues?q=repo:a/b+is:pr+is:merged")
+        == "a/b"
+    )
+    assert repo_of("https://api.github.com/graphql") == "graphql"
+
+
+def test_record_then_replay_reports_requests_per_repo(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    readme = tmp_path / "README.md"
+    readme.write_text(README, encoding="utf-8")
+    store_dir = tmp_path / "fixtures"
+    sent: list[str] = []
+
+    def fake_send(self, request, **kwargs):
+        sent.append(request.url)
+        return _fake_github(request)
+
+    monkeypatch.setattr(HTTPAdapter, "send", fake_send)
+    store = repo_status_replay.record(readme, store_dir)
+    monkeypatch.undo()
+
+    assert readme.read_text(encoding="utf-8") == README
+    assert len(store.responses) == len(set(sent))
+    entry = store.get("GET https://api.github.com/repos/user/repo")
+    assert entry is not None
+    # Rate-limit headers are not replayed.
+    assert entry["headers"] == {"Content-Type": "application/json", "ETag": '"v1"'}
+    expected = (store_dir / "README.expected.md").read_text(encoding="utf-8")
+    stamp = datetime.fromisoformat(store.recorded_at or "").astimezone(UTC)
+    assert f"_Last updated: {stamp:%Y-%m-%d %H:%M} UTC" in expected
+    assert "⭐ 7 🔀 3 https://github.com/user/repo" in expected
+
+    report = repo_status_replay.run_benchmark(store_dir, latency=0)
+
+    assert report.output_matches
+    assert report.misses == []
+    assert report.requests == len(sent)
+    assert report.per_repo == {"user/repo": len(sent)}
+    assert compare_reports(report, report) == []
+
+
+def test_replay_counts_unrecorded_requests(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    readme = tmp_path / "README.md"
+    readme.write_text(README, encoding="utf-8")
+    store_dir = tmp_path / "fixtures"
+    monkeypatch.setattr(HTTPAdapter, "send", lambda self, req, **kw: _fake_github(req))
+    store = repo_status_replay.record(readme, store_dir)
+    monkeypatch.undo()
+    store.responses.pop("GET https://api.github.com/repos/user/repo")
+    store.save(store_dir)
+
+    report = repo_status_replay.run_benchmark(store_dir, latency=0)
+
+    assert report.misses == ["GET https://api.github.com/repos/user/repo"]
+    assert not report.output_matches
+
+
+def test_compare_reports_flags_regressions() -> None:
+    baseline = BenchReport(
+        requests=10, seconds=1.0, lookback_pages=10, per_repo={"a/b": 6, "c/d": 4}
+    )
+    current = BenchReport(
+        requests=12,
+        seconds=2.0,
+        lookback_pages=5,
+        per_repo={"a/b": 8, "c/d": 4},
+        misses=["GET https://api.github.com/repos/a/b/commits?page=6"],
+        output_matches=False,
+    )
+
+    assert compare_reports(baseline, current) == [
+        "total requests: 10 -> 12",
+        "a/b: 6 -> 8 requests",
+        "unrecorded requests: 0 -> 1",
+        "rendered README no longer matches the recording",
+        "wall time: 1.000s -> 2.000s",
+    ]
+    assert BenchReport.from_dict(current.to_dict()) == current
@@ -0,0 +1,201 @@
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+
+from tools.youtube_mcp.cache import TranscriptCache
+from tools.youtube_mcp.chunking import DEFAULT_PROFILE, chunk_payload_segments
+from tools.youtube_mcp.errors import InvalidArgument
+from tools.youtube_mcp.search import match_expression, search_transcripts
+
+VIDEO_A = "KJVz2f4Fn_U"
+VIDEO_B = "RDEKyxDIuLQ"
+
+
+def transcript(video_id: str, lines: list[str], lang: str = "en") -> dict:
+    segments = [
+        {"id": f"{video_id}:{idx}", "text": text, "start": idx * 30.0, "dur": 30.0}
+        for idx, text in enumerate(lines)
+    ]
+    return {
+        "video": {
+            "id": video_id,
+            "url": f"https://www.youtube.com/watch?v={video_id}",
+            "title": f"Video {video_id}",
+        },
+        "captions": {"lang": lang, "is_auto": False, "track_name": None},
+        "segments": segments,
+        "chunks": chunk_payload_segments(video_id, segments, DEFAULT_PROFILE),
+        "hash": video_id,
+    }
+
+
+@pytest.fixture()
+def cache(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set(
+        "a",
+        transcript(
+            VIDEO_A,
+            ["welcome back to the workshop " * 40, "starship refuelling in orbit"],
+        ),
+        ttl_days=1,
+    )
+    cache.set(
+        "b",
+        transcript(VIDEO_B, ["we refuel the drone battery", "solar panels"], "de"),
+        ttl_days=1,
+    )
+    yield cache
+    cache.close()
+
+
+def test_search_returns_ranked_chunks_with_citations(cache):
+    response = search_transcripts(cache, "Starship refuelling")
+    assert [hit.video_id for hit in response.hits] == [VIDEO_A]
+    hit = response.hits[0]
+    assert hit.chunk_id == f"{VIDEO_A}:chunk:1"
+    assert hit.cite_url.endswith(f"&t={int(hit.start)}s")
+    assert hit.title == f"Video {VIDEO_A}"
+    assert "[starship]" in hit.snippet.lower()
+    assert hit.score > 0
+
+    # Porter stemming lets "refuel" match "refuelling" in both videos.
+    stemmed = search_transcripts(cache, "refuel")
+    assert {hit.video_id for hit in stemmed.hits} == {VIDEO_A, VIDEO_B}
+    assert [
+        h.video_id for h in search_transcripts(cache, "refuel", lang="de").hits
+    ] == [VIDEO_B]
+    filtered = search_transcripts(
+        cache, "refuel", video_id=f"https://youtu.be/{VIDEO_A}", limit=1
+    )
+    assert [hit.video_id for hit in filtered.hits] == [VIDEO_A]
+
+
+def assert_index_consistent(cache: TranscriptCache) -> None:
+    # With a rank argument FTS5 also compares the index against its content.
+    cache._conn.execute(
+        "INSERT INTO search_fts (search_fts, rank) VALUES ('integrity-check', 1)"
+    )
+
+
+def test_search_index_follows_cache_writes(cache):
+    cache.set("a", transcript(VIDEO_A, ["nothing about rockets"]), ttl_days=1)
+    assert search_transcripts(cache, "starship").hits == []
+    assert search_transcripts(cache, "rockets").hits
+    assert_index_consistent(cache)
+
+    cache.delete("a")
+    assert search_transcripts(cache, "rockets").hits == []
+    assert_index_consistent(cache)
+
+    cache.set("a", transcript(VIDEO_A, ["rockets again"]), ttl_days=1)
+    cache.evict(max_entries=1)
+    assert search_transcripts(cache, "drone").hits == []
+    assert search_transcripts(cache, "rockets").hits
+    assert_index_consistent(cache)
+
+    cache.clear()
+    count = cache._conn.execute("SELECT COUNT(*) FROM search_chunks").fetchone()
+    assert count == (0,)
+
+
+def test_search_skips_expired_entries_and_non_transcripts(cache):
+    cache.set("alias", {"transcript_key": "a"}, ttl_days=1)
+    cache.set("a", transcript(VIDEO_A, ["starship"]), ttl_days=1)
+    cache._conn.execute(
+        "UPDATE cache_entries SET expires_at = ? WHERE cache_key = 'a'",
+        (time.time() - 1,),
+    )
+    cache._conn.commit()
+    assert search_transcripts(cache, "starship").hits == []
+
+
+def test_search_index_backfills_existing_cache(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set("a", transcript(VIDEO_A, ["starship refuelling"]), ttl_days=1)
+    cache.close()
+    conn = sqlite3.connect(tmp_path / "cache.sqlite")
+    conn.executescript("""
+        DROP TRIGGER cache_entries_search_ad;
+        DROP TABLE search_fts;
+        DROP TABLE search_chunks;
+        """)
+    conn.close()
+
+    reopened = TranscriptCache(tmp_path)
+    try:
+        assert [
+            hit.video_id for hit in search_transcripts(reopened, "starship").hits
+        ] == [VIDEO_A]
+    finally:
+        reopened.close()
+
+
+def test_search_index_keeps_no_plaintext_copy(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set("a", transcript(VIDEO_A, ["starship refuelling in orbit"]), 1)
+    hit = search_transcripts(cache, "refuel").hits[0]
+    assert hit.text == "starship refuelling in orbit"
+    cache.vacuum()
+    cache.close()
+    assert (
+        b"starship refuelling in orbit" not in (tmp_path / "cache.sqlite").read_bytes()
+    )
+
+
+def test_search_index_rebuilds_plaintext_layout(tmp_path: Path):
+    cache = TranscriptCache(tmp_path)
+    cache.set("a", transcript(VIDEO_A, ["starship refuelling"]), ttl_days=1)
+    cache.close()
+    conn = sqlite3.connect(tmp_path / "cache.sqlite")
+    conn.executescript("""
+        DROP TRIGGER cache_entries_search_ad;
+        DROP TABLE search_fts;
+        DROP VIEW search_chunk_text;
+        DROP TABLE search_chunks;
+        CREATE TABLE search_chunks (id INTEGER PRIMARY KEY, text TEXT NOT NULL);
+        CREATE VIRTUAL TABLE search_fts USING fts5(
+            text, content='search_chunks', content_rowid='id'
+        );
+        """)
+    conn.close()
+
+    reopened = TranscriptCache(tmp_path)
+    try:
+        columns = {
+            row[1] for row in reopened._conn.execute("PRAGMA table_info(search_chunks)")
+        }
+        assert "text" not in columns
+        assert [
+            hit.video_id for hit in search_transcripts(reopened, "starship").hits
+        ] == [VIDEO_A]
+        assert_index_consistent(reopened)
+    finally:
+        reopened.close()
+
+
+def test_match_expression_quotes_terms():
+    assert match_expression('starship AND "refuel*" -x') == (
+        '"starship" "AND" "refuel"* "x"'
+    )
+    with pytest.raises(InvalidArgument):
+        match_expression("  ?! ")
+
+
+def test_search_rejects_bad_arguments(cache):
+    with pytest.raises(InvalidArgument):
+        search_transcripts(cache, "starship", limit=0)
+    with pytest.raises(InvalidArgument):
+        search_transcripts(cache, "starship", video_id="not a video")
+
+
+def test_search_benchmark_smoke(tmp_path: Path):
+    from tools.youtube_mcp.benchmarks import bench_search
+
+    result = bench_search(tmp_path, videos=20, segments=20, queries=3)
+    assert result["videos"] == 20
+    assert result["median_ms"] >= 0
+    assert result["payload_bytes"] > 0
+    assert result["file_bytes"] > result["payload_bytes"]
@@ -0,0 +1,72 @@
+import json
+
+import pytest
+
+from tools.youtube_mcp.errors import InvalidArgument
+from tools.youtube_mcp.streaming import (
+    TRANSCRIPT_FIELDS,
+    encode_events,
+    iter_transcript_events,
+    parse_fields,
+)
+
+PAYLOAD = {
+    "video": {"id": "abc"},
+    "captions": {"lang": "en"},
+    "segments": [{"id": f"abc:{idx}"} for idx in range(5)],
+    "chunks": [{"id": "abc:chunk:0"}],
+    "hash": "h",
+}
+
+
+def test_parse_fields_defaults_and_ordering():
+    assert parse_fields(None) == TRANSCRIPT_FIELDS
+    assert parse_fields(" chunks , video") == ("video", "chunks")
+    with pytest.raises(InvalidArgument):
+        parse_fields("chunks,bogus")
+
+
+def test_iter_transcript_events_projection():
+    events = list(iter_transcript_events(PAYLOAD, ("chunks",)))
+    assert events == [
+        ("chunk", {"id": "abc:chunk:0"}),
+        ("end", {"segments": 0, "chunks": 1, "stale": False}),
+    ]
+
+
+def test_iter_transcript_events_streams_lazy_iterables():
+    built: list[int] = []
+
+    def segments():
+        for idx in range(3):
+            built.append(idx)
+            yield {"id": f"abc:{idx}"}
+
+    def unselected():
+        raise AssertionError("projected-away fields must not be consumed")
+        yield  # pragma: no cover
+
+    payload = {**PAYLOAD, "segments": segments(), "chunks": unselected()}
+    events = iter_transcript_events(payload, ("segments",))
+    assert next(events) == ("segment", {"id": "abc:0"})
+    assert built == [0]
+    assert list(events)[-1] == ("end", {"segments": 3, "chunks": 0, "stale": False})
+
+
+def test_encode_events_batches_ndjson_and_sse():
+    events = list(iter_transcript_events(PAYLOAD))
+    ndjson = list(encode_events(events, "ndjson", batch_size=3))
+    assert len(ndjson) == 4
+    lines = "".join(ndjson).splitlines()
+    assert [json.loads(line)["type"] for line in lines][:3] == [
+        "video",
+        "captions",
+        "segment",
+    ]
+
+    sse = "".join(encode_events(events, "sse"))
+    assert sse.startswith('event: video\ndata: {"id": "abc"}\n\n')
+    assert sse.count("event: segment") == 5
+
+    with pytest.raises(InvalidArgument):
+        list(encode_events(events, "xml"))
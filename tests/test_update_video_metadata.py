@@ -1,16 +1,22 @@
 import json
 import runpy
-import urllib.error
-import urllib.request
 
 import pytest
+import requests
 
 
-@pytest.fixture(autouse=True)
-def restore_urlopen(monkeypatch):
-    original = urllib.request.urlopen
-    yield
-    monkeypatch.setattr(urllib.request, "urlopen", original)
+def _serve(monkeypatch, payload, calls=None):
+    """Answer every videos.list request with ``payload``."""
+
+    def fake_get(self, url, params=None, headers=None, timeout=None):
+        if calls is not None:
+            calls.append(params)
+        response = requests.Response()
+        response.status_code = 200
+        response._content = json.dumps(payload).encode("utf-8")
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", fake_get)
 
 
 def test_updates_metadata_from_api(tmp_path, monkeypatch):
@@ -38,22 +44,10 @@ def test_updates_metadata_from_api(tmp_path, monkeypatch):
     monkeypatch.setattr(updater, "BASE_DIR", tmp_path)
     monkeypatch.setattr(updater, "VIDEO_ROOT", tmp_path / "video_scripts")
 
-    class FakeResponse:
-        def __init__(self, data: bytes):
-            self._data = data
-
-        def read(self) -> bytes:
-            return self._data
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
     payload = {
         "items": [
             {
+                "id": "abc123",
                 "snippet": {
                     "title": "New Title",
                     "publishedAt": "2024-08-15T12:34:56Z",
@@ -70,11 +64,7 @@ def test_updates_metadata_from_api(tmp_path, monkeypatch):
         ]
     }
 
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda url, timeout=10: FakeResponse(json.dumps(payload).encode("utf-8")),
-    )
+    _serve(monkeypatch, payload)
 
     updater.main([])
 
@@ -103,6 +93,7 @@ def test_fetch_metadata_thumbnail_fallback(monkeypatch):
     payload = {
         "items": [
             {
+                "id": "fallback",
                 "snippet": {
                     "title": "Fallback",
                     "publishedAt": "",
@@ -118,24 +109,7 @@ def test_fetch_metadata_thumbnail_fallback(monkeypatch):
         ]
     }
 
-    class FakeResponse:
-        def __init__(self, data: bytes):
-            self._data = data
-
-        def read(self) -> bytes:
-            return self._data
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda url, timeout=10: FakeResponse(json.dumps(payload).encode("utf-8")),
-    )
+    _serve(monkeypatch, payload)
 
     info = updater.fetch_metadata("fallback", "TOKEN")
     assert info["thumbnail"] == "https://img.youtube.com/high.jpg"
@@ -147,6 +121,7 @@ def test_fetch_metadata_defaults_missing_view_count(monkeypatch):
     payload = {
         "items": [
             {
+                "id": "noviews",
                 "snippet": {
                     "title": "No Views",
                     "publishedAt": "2024-01-01T00:00:00Z",
@@ -160,24 +135,7 @@ def test_fetch_metadata_defaults_missing_view_count(monkeypatch):
         ]
     }
 
-    class FakeResponse:
-        def __init__(self, data: bytes):
-            self._data = data
-
-        def read(self) -> bytes:
-            return self._data
-
-        def __enter__(self):
-            return self
-
-        def __exit__(self, exc_type, exc, tb):
-            return False
-
-    monkeypatch.setattr(
-        urllib.request,
-        "urlopen",
-        lambda url, timeout=10: FakeResponse(json.dumps(payload).encode("utf-8")),
-    )
+    _serve(monkeypatch, payload)
 
     info = updater.fetch_metadata("noviews", "TOKEN")
     assert info["view_count"] == 0
@@ -192,13 +150,10 @@ def test_entrypoint_runs(monkeypatch, tmp_path):
     (tmp_path / "video_scripts").mkdir()
     monkeypatch.setenv("YOUTUBE_API_KEY", "TEST")
 
-    class Boom(urllib.error.URLError):
-        pass
-
-    def failing_urlopen(url, timeout=10):
-        raise Boom("fail")
+    def failing_get(self, url, **kwargs):
+        raise requests.ConnectionError("fail")
 
-    monkeypatch.setattr(urllib.request, "urlopen", failing_urlopen)
+    monkeypatch.setattr(requests.Session, "get", failing_get)
 
     with pytest.raises(SystemExit):
         runpy.run_module("src.update_video_metadata", run_name="__main__")
@@ -248,23 +203,21 @@ def test_main_returns_error_on_partial_failures(monkeypatch, tmp_path):
     monkeypatch.setattr(updater, "BASE_DIR", tmp_path)
     monkeypatch.setattr(updater, "VIDEO_ROOT", scripts_dir)
 
-    responses = [
-        {
-            "title": "New Title",
-            "publish_date": "2024-08-15",
-            "duration_seconds": 10,
-            "description": "Updated",
-            "keywords": ["tag"],
-            "thumbnail": "https://img.youtube.com/fallback.jpg",
-            "view_count": 987,
-        },
-        None,
-    ]
-
-    def fake_fetch(video_id, youtube_key, timeout=10):
-        return responses.pop(0)
-
-    monkeypatch.setattr(updater, "fetch_metadata", fake_fetch)
+    def fake_fetch(video_ids, youtube_key, client=None):
+        assert list(video_ids) == ["good", "bad"]
+        return {
+            "good": {
+                "title": "New Title",
+                "publish_date": "2024-08-15",
+                "duration_seconds": 10,
+                "description": "Updated",
+                "keywords": ["tag"],
+                "thumbnail": "https://img.youtube.com/fallback.jpg",
+                "view_count": 987,
+            }
+        }
+
+    monkeypatch.setattr(updater, "fetch_metadata_batch", fake_fetch)
 
     exit_code = updater.main([])
 
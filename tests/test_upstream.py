@@ -0,0 +1,88 @@
+import pytest
+
+from tools.youtube_mcp.errors import CircuitOpen
+from tools.youtube_mcp.upstream import (
+    AdaptiveRateLimiter,
+    CircuitBreaker,
+    UpstreamGuard,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces_callers():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(2.0, burst=2, clock=clock, sleep=clock.sleep)
+    assert [limiter.acquire() for _ in range(2)] == [0.0, 0.0]
+    assert limiter.acquire() == pytest.approx(0.5)
+    assert limiter.acquire() == pytest.approx(0.5)
+    clock.now += 10
+    assert limiter.acquire() == 0.0
+
+
+def test_rate_limiter_backs_off_multiplicatively_and_recovers_additively():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(
+        4.0, burst=5, min_rate=0.5, increase=1.0, clock=clock, sleep=clock.sleep
+    )
+    limiter.on_rate_limited()
+    assert limiter.rate == 2.0
+    # Saved-up burst is dropped so the next call already waits at the new rate.
+    assert limiter.acquire() == pytest.approx(0.5)
+    for _ in range(3):
+        limiter.on_rate_limited()
+    assert limiter.rate == 0.5
+    for _ in range(10):
+        limiter.on_success()
+    assert limiter.rate == 4.0
+
+
+def test_circuit_breaker_opens_probes_and_closes():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=2, reset_seconds=30, clock=clock)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == pytest.approx(30)
+
+    clock.now += 30
+    assert breaker.allow()  # single half-open probe
+    assert not breaker.allow()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+
+def test_guard_fails_fast_and_ignores_caller_errors():
+    clock = FakeClock()
+    guard = UpstreamGuard(
+        AdaptiveRateLimiter(10.0, clock=clock, sleep=clock.sleep),
+        CircuitBreaker(failure_threshold=2, reset_seconds=60, clock=clock),
+    )
+    guard.before_call("fetch_transcript")
+    guard.after_call("NoCaptionsAvailable")
+    guard.after_call("RateLimited")
+    guard.after_call("NetworkError")
+    with pytest.raises(CircuitOpen) as excinfo:
+        guard.before_call("fetch_transcript")
+    assert excinfo.value.code == "RateLimited"
+    assert excinfo.value.retry_after == pytest.approx(60)
+    assert guard.limiter.rate == 5.0
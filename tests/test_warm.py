@@ -0,0 +1,112 @@
+import json
+from pathlib import Path
+
+from tools.youtube_mcp.cache import TranscriptCache
+from tools.youtube_mcp.errors import NoCaptionsAvailable, RateLimited
+from tools.youtube_mcp.models import MetadataResponse
+from tools.youtube_mcp.settings import Settings
+from tools.youtube_mcp.warm import discover_video_ids, warm_cache
+from tools.youtube_mcp.youtube_client import YouTubeTranscriptService
+
+VIDEO_A = "KJVz2f4Fn_U"
+VIDEO_B = "RDEKyxDIuLQ"
+VIDEO_C = "whafgZUxj0Q"
+
+
+def test_discover_video_ids_merges_and_dedupes(tmp_path: Path):
+    ids_file = tmp_path / "video_ids.txt"
+    ids_file.write_text(f"# comment\n{VIDEO_A}\n\nnot-a-video-id\n{VIDEO_B}\n")
+    scripts = tmp_path / "video_scripts"
+    for slug, youtube_id in (("one", VIDEO_B), ("two", VIDEO_C), ("three", "")):
+        (scripts / slug).mkdir(parents=True)
+        (scripts / slug / "metadata.json").write_text(
+            json.dumps({"youtube_id": youtube_id})
+        )
+    (scripts / "broken").mkdir()
+    (scripts / "broken" / "metadata.json").write_text("{")
+
+    assert discover_video_ids(ids_file, scripts) == [VIDEO_A, VIDEO_B, VIDEO_C]
+    assert discover_video_ids(tmp_path / "missing.txt", None) == []
+
+
+class FlakyService:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str:
+        self.calls.append(url)
+        if url.endswith(VIDEO_A) and self.calls.count(url) == 1:
+            raise RateLimited()
+        if url.endswith(VIDEO_C):
+            raise NoCaptionsAvailable()
+        return "fresh" if url.endswith(VIDEO_B) else "fetched"
+
+
+def test_warm_cache_backs_off_on_rate_limits():
+    service = FlakyService()
+    sleeps: list[float] = []
+    report = warm_cache(
+        service,
+        [VIDEO_A, VIDEO_B, VIDEO_C],
+        concurrency=1,
+        base_delay=1.0,
+        sleep=sleeps.append,
+    )
+    assert report.requested == 3
+    assert (report.fetched, report.fresh, report.failed) == (1, 1, 1)
+    assert report.errors[0].video_id == VIDEO_C
+    assert report.errors[0].code == "NoCaptionsAvailable"
+    assert sleeps and all(0 < delay <= 1.0 for delay in sleeps)
+
+
+def test_warm_cache_gives_up_after_max_attempts():
+    class AlwaysLimited:
+        def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str:
+            raise RateLimited()
+
+    report = warm_cache(
+        AlwaysLimited(), [VIDEO_A], max_attempts=2, sleep=lambda _: None
+    )
+    assert report.failed == 1
+    assert report.errors[0].code == "RateLimited"
+
+
+class FakeTrack:
+    language_code = "en"
+    language = "en"
+    is_generated = False
+    name = "English"
+
+    def __init__(self) -> None:
+        self.fetch_count = 0
+
+    def fetch(self):
+        self.fetch_count += 1
+        return [{"text": "hello", "start": 0.0, "duration": 1.0}]
+
+
+def test_service_warm_transcript_statuses(tmp_path: Path):
+    track = FakeTrack()
+
+    class Api:
+        @staticmethod
+        def list_transcripts(video_id: str):
+            return [track]
+
+    settings = Settings(cache_dir=tmp_path / "cache")
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=TranscriptCache(settings.cache_dir),
+        transcript_api=Api,
+        metadata_fetcher=lambda video_id: MetadataResponse(
+            id=video_id, url=f"https://www.youtube.com/watch?v={video_id}"
+        ),
+    )
+    url = f"https://youtu.be/{VIDEO_A}"
+    assert service.warm_transcript(url, refresh_before_seconds=60) == "fetched"
+    assert service.warm_transcript(url, refresh_before_seconds=60) == "fresh"
+    assert service.warm_transcript(url, refresh_before_seconds=10**9) == "refreshed"
+    assert track.fetch_count == 2
+
+    service.get_transcript(url)
+    assert track.fetch_count == 2
@@ -0,0 +1,67 @@
+import pytest
+
+from tools.youtube_mcp.chunking import chunk_segments
+from tools.youtube_mcp.errors import InvalidArgument
+from tools.youtube_mcp.models import Segment
+from tools.youtube_mcp.windowing import TranscriptIndex
+
+
+def build_payload(count: int = 40) -> dict:
+    segments = [
+        Segment(id=f"vid:{idx}", text=f"words {idx}", start=idx * 2.0, dur=2.0)
+        for idx in range(count)
+    ]
+    chunks = chunk_segments("vid", segments, target_chars=40, overlap_chars=10)
+    return {
+        "video": {"id": "vid"},
+        "segments": [segment.model_dump() for segment in segments],
+        "chunks": [chunk.model_dump() for chunk in chunks],
+        "hash": "h",
+    }
+
+
+def test_window_time_range_includes_overlapping_segment():
+    index = TranscriptIndex(build_payload())
+    window = index.window(start=11.0, end=20.0)
+    assert [seg["id"] for seg in window["segments"]] == [
+        f"vid:{idx}" for idx in range(5, 10)
+    ]
+    assert window["window"]["matched_segments"] == 5
+    assert window["window"]["next_offset"] is None
+    for chunk in window["chunks"]:
+        assert chunk["start"] <= 18.0 and chunk["end"] > 10.0
+    assert window["hash"] == "h"
+
+
+def test_window_offset_limit_pages_through_range():
+    payload = build_payload()
+    index = TranscriptIndex(payload)
+    first = index.window(start=0.0, end=40.0, limit=8)
+    second = index.window(start=0.0, end=40.0, offset=first["window"]["next_offset"])
+    assert first["window"]["next_offset"] == 8
+    assert len(second["segments"]) == 12
+    assert second["window"]["next_offset"] is None
+    assert first["segments"] + second["segments"] == payload["segments"][:20]
+
+
+def test_window_chunks_cover_returned_segments():
+    payload = build_payload()
+    index = TranscriptIndex(payload)
+    window = index.window(offset=17, limit=3)
+    returned = {seg["id"] for seg in window["segments"]}
+    expected = [
+        chunk
+        for chunk in payload["chunks"]
+        if returned.intersection(chunk["segment_ids"])
+    ]
+    assert window["chunks"] == expected
+
+
+def test_window_empty_and_invalid_ranges():
+    index = TranscriptIndex(build_payload(5))
+    empty = index.window(start=500.0)
+    assert empty["segments"] == [] and empty["chunks"] == []
+    with pytest.raises(InvalidArgument):
+        index.window(start=5.0, end=5.0)
+    with pytest.raises(InvalidArgument):
+        index.window(limit=0)
@@ -1,3 +1,5 @@
+import time
+
 import httpx
 import pytest
 from youtube_transcript_api._errors import (
@@ -485,3 +487,295 @@ def test_map_transcript_error_mappings(tmp_path):
         service._map_transcript_error(CouldNotRetrieveTranscript("err")), NetworkError
     )
     assert isinstance(service._map_transcript_error(ValueError("err")), NetworkError)
+
+
+def test_cached_request_skips_upstream_lookups(tmp_path):
+    settings = Settings(cache_dir=tmp_path / "cache")
+    transcript = FakeTranscript(
+        "en", False, "English", [{"text": "hello", "start": 0.0, "duration": 1.0}]
+    )
+    calls = {"list": 0, "metadata": 0}
+
+    class CountingApi(FakeApi):
+        def list_transcripts(self, video_id: str):
+            calls["list"] += 1
+            return super().list_transcripts(video_id)
+
+    def counting_metadata(video_id: str) -> MetadataResponse:
+        calls["metadata"] += 1
+        return metadata_stub(video_id)
+
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=TranscriptCache(settings.cache_dir),
+        transcript_api=CountingApi([transcript]),
+        metadata_fetcher=counting_metadata,
+    )
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    first = service.get_transcript(url, lang="EN")
+    second = service.get_transcript(url, lang="en")
+    assert first == second
+    assert calls == {"list": 1, "metadata": 1}
+    assert transcript.fetch_count == 1
+
+
+def test_cached_transcript_rechecks_privacy(tmp_path):
+    settings = Settings(cache_dir=tmp_path / "cache")
+    transcript = FakeTranscript(
+        "en", False, "English", [{"text": "hello", "start": 0.0, "duration": 1.0}]
+    )
+    state = {"private": False, "calls": 0}
+
+    def metadata(video_id: str) -> MetadataResponse:
+        state["calls"] += 1
+        if state["private"]:
+            raise PolicyRejected("Metadata not accessible for this video")
+        return metadata_stub(video_id)
+
+    cache = TranscriptCache(settings.cache_dir, max_stale_seconds=86400)
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=cache,
+        transcript_api=FakeApi([transcript]),
+        metadata_fetcher=metadata,
+    )
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    service.get_transcript(url)
+    state["private"] = True
+    # Within the recheck window the earlier decision is reused.
+    assert service.get_transcript(url).segments[0].text == "hello"
+    assert state["calls"] == 1
+
+    cache.delete(service._policy_key(MANUAL_VIDEO_ID))
+    with pytest.raises(PolicyRejected):
+        service.get_transcript(url)
+    assert state["calls"] == 2
+    assert cache.stats()["entries"] == 0
+    assert service.search_transcripts("hello").hits == []
+    with pytest.raises(PolicyRejected):
+        service.get_transcript(url)
+    assert transcript.fetch_count == 1
+
+
+def test_windowed_transcript_uses_memoised_index(tmp_path, monkeypatch):
+    settings = Settings(cache_dir=tmp_path / "cache")
+    segments = [
+        {"text": f"line {idx}", "start": float(idx), "duration": 1.0}
+        for idx in range(30)
+    ]
+    transcript = FakeTranscript("en", False, "English", segments)
+    cache = TranscriptCache(settings.cache_dir)
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=cache,
+        transcript_api=FakeApi([transcript]),
+        metadata_fetcher=metadata_stub,
+    )
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    window = service.get_transcript(url, start=10.0, end=15.0)
+    assert [seg.start for seg in window.segments] == [10.0, 11.0, 12.0, 13.0, 14.0]
+    assert window.window is not None and window.window.matched_segments == 5
+
+    decoded: list[str] = []
+    original_get = cache.get
+
+    def tracking_get(key, **kwargs):
+        value = original_get(key, **kwargs)
+        if isinstance(value, dict) and "segments" in value:
+            decoded.append(key)
+        return value
+
+    monkeypatch.setattr(cache, "get", tracking_get)
+    page = service.get_transcript(url, offset=25, limit=10)
+    assert [seg.start for seg in page.segments] == [25.0, 26.0, 27.0, 28.0, 29.0]
+    assert decoded == []
+    assert transcript.fetch_count == 1
+    assert service.get_transcript(url).window is None
+
+    with pytest.raises(InvalidArgument):
+        service.get_transcript(url, start=5.0, end=1.0)
+
+
+def test_chunk_profile_is_cached_per_transcript(tmp_path, monkeypatch):
+    settings = Settings(cache_dir=tmp_path / "cache")
+    segments = [
+        {"text": f"sentence {idx}.", "start": float(idx), "duration": 1.0}
+        for idx in range(120)
+    ]
+    transcript = FakeTranscript("en", False, "English", segments)
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=TranscriptCache(settings.cache_dir),
+        transcript_api=FakeApi([transcript]),
+        metadata_fetcher=metadata_stub,
+    )
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    default = service.get_transcript(url)
+    words = service.get_transcript(url, chunk_profile="words-50")
+    assert words.segments == default.segments
+    assert len(words.chunks) > len(default.chunks)
+
+    import tools.youtube_mcp.youtube_client as client_module
+
+    def fail(*args, **kwargs):
+        raise AssertionError("profile chunks should come from the cache")
+
+    monkeypatch.setattr(client_module, "chunk_payload_segments", fail)
+    assert service.get_transcript(url, chunk_profile="words-50") == words
+    window = service.get_transcript(url, chunk_profile="words-50", start=0, end=5)
+    assert window.chunks and window.chunks[0] == words.chunks[0]
+    assert transcript.fetch_count == 1
+
+    with pytest.raises(InvalidArgument):
+        service.get_transcript(url, chunk_profile="unknown")
+
+
+def test_search_transcripts_finds_cached_chunks(service):
+    svc, _, _ = service
+    svc.get_transcript(f"https://youtu.be/{MANUAL_VIDEO_ID}")
+    response = svc.search_transcripts("hello")
+    assert [hit.video_id for hit in response.hits] == [MANUAL_VIDEO_ID]
+    assert response.hits[0].cite_url.endswith("&t=0s")
+
+
+def test_upstream_calls_retries_and_rate_limits_are_recorded(tmp_path):
+    from tools.youtube_mcp import metrics
+
+    settings = Settings(cache_dir=tmp_path / "cache")
+    transcript = FakeTranscript("en", False, "English", [], exc=TooManyRequests("429"))
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=TranscriptCache(settings.cache_dir),
+        transcript_api=FakeApi([transcript]),
+        metadata_fetcher=metadata_stub,
+    )
+    service._fetch_retry.sleep = lambda _: None
+    before = {
+        "listed": metrics.UPSTREAM_CALLS.value("list_transcripts", "ok"),
+        "limited": metrics.UPSTREAM_CALLS.value("fetch_transcript", "RateLimited"),
+        "retries": metrics.UPSTREAM_RETRIES.value("fetch_transcript"),
+        "events": metrics.RATE_LIMIT_EVENTS.value("fetch_transcript"),
+    }
+    with pytest.raises(RateLimited):
+        service.get_transcript(f"https://youtu.be/{MANUAL_VIDEO_ID}")
+
+    assert (
+        metrics.UPSTREAM_CALLS.value("list_transcripts", "ok") == before["listed"] + 1
+    )
+    assert (
+        metrics.UPSTREAM_CALLS.value("fetch_transcript", "RateLimited")
+        == before["limited"] + 3
+    )
+    assert metrics.UPSTREAM_RETRIES.value("fetch_transcript") == before["retries"] + 2
+    assert metrics.RATE_LIMIT_EVENTS.value("fetch_transcript") == before["events"] + 3
+
+    stats = service.stats()
+    assert stats.cache.entries >= 0
+    assert "ytmcp_upstream_duration_seconds" in stats.metrics
+
+
+def test_stale_transcript_served_while_upstream_throttles(tmp_path):
+    from tools.youtube_mcp.upstream import (
+        AdaptiveRateLimiter,
+        CircuitBreaker,
+        UpstreamGuard,
+    )
+
+    settings = Settings(cache_dir=tmp_path / "cache", stale_while_revalidate=False)
+    cache = TranscriptCache(settings.cache_dir, max_stale_seconds=3 * 86400)
+    transcript = FakeTranscript(
+        "en", False, "English", [{"text": "hello", "start": 0.0, "duration": 1.0}]
+    )
+    listed = {"count": 0}
+
+    class CountingApi(FakeApi):
+        def list_transcripts(self, video_id: str):
+            listed["count"] += 1
+            return super().list_transcripts(video_id)
+
+    guard = UpstreamGuard(
+        AdaptiveRateLimiter(100.0),
+        CircuitBreaker(failure_threshold=1, reset_seconds=300),
+    )
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=cache,
+        transcript_api=CountingApi([transcript]),
+        metadata_fetcher=metadata_stub,
+        upstream=guard,
+    )
+    service._fetch_retry.sleep = lambda _: None
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    fresh = service.get_transcript(url)
+    cache._conn.execute("UPDATE cache_entries SET expires_at = expires_at - 15 * 86400")
+    cache._conn.commit()
+
+    transcript._exc = TooManyRequests("429")
+    stale = service.get_transcript(url)
+    assert stale.stale and stale.segments == fresh.segments
+    assert guard.breaker.state == CircuitBreaker.OPEN
+    # With the circuit open the next request does not reach YouTube at all.
+    before = listed["count"]
+    assert service.get_transcript(url).stale
+    assert listed["count"] == before
+
+    with pytest.raises(RateLimited):
+        service.get_transcript(f"https://youtu.be/{AUTO_VIDEO_ID}")
+
+
+def test_stale_while_revalidate_serves_then_refreshes(tmp_path):
+    import threading
+
+    settings = Settings(cache_dir=tmp_path / "cache", cache_max_stale_seconds=86400)
+    cache = TranscriptCache.from_settings(settings)
+
+    class GatedTranscript(FakeTranscript):
+        def __init__(self) -> None:
+            super().__init__(
+                "en", False, "English", [{"text": "v1", "start": 0.0, "duration": 1.0}]
+            )
+            self.gate = threading.Event()
+            self.gate.set()
+
+        def fetch(self):
+            assert self.gate.wait(5)
+            return super().fetch()
+
+    transcript = GatedTranscript()
+    service = YouTubeTranscriptService(
+        settings=settings,
+        cache=cache,
+        transcript_api=FakeApi([transcript]),
+        metadata_fetcher=metadata_stub,
+    )
+    url = f"https://youtu.be/{MANUAL_VIDEO_ID}"
+    assert service.get_transcript(url).stale is False
+
+    def age(seconds: float) -> None:
+        cache._conn.execute(
+            "UPDATE cache_entries SET expires_at = ?", (time.time() - seconds,)
+        )
+        cache._conn.commit()
+
+    age(3600)
+    transcript._segments = [{"text": "v2", "start": 0.0, "duration": 1.0}]
+    transcript.gate.clear()
+    first = service.get_transcript(url)
+    second = service.get_transcript(url, start=0.0, end=10.0)
+    assert first.stale and second.stale
+    assert [seg.text for seg in first.segments] == ["v1"]
+    assert transcript.fetch_count == 1  # refresh still blocked, scheduled once
+
+    transcript.gate.set()
+    service.wait_for_revalidations(timeout=5)
+    refreshed = service.get_transcript(url)
+    assert refreshed.stale is False
+    assert [seg.text for seg in refreshed.segments] == ["v2"]
+    assert transcript.fetch_count == 2
+
+    # Beyond the max staleness the request waits for a synchronous fetch.
+    age(2 * 86400)
+    transcript._segments = [{"text": "v3", "start": 0.0, "duration": 1.0}]
+    latest = service.get_transcript(url)
+    assert latest.stale is False
+    assert [seg.text for seg in latest.segments] == ["v3"]
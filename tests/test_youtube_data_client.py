@@ -0,0 +1,149 @@
+"""Tests for the shared YouTube Data API client."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+import requests
+
+from src.youtube_data_client import (
+    API_PARTS,
+    QuotaBudget,
+    QuotaExceeded,
+    VideoResponseCache,
+    YouTubeDataClient,
+    YouTubeDataError,
+    select_thumbnail,
+)
+
+
+def _response(status: int, data: object = None, etag: str | None = None):
+    response = requests.Response()
+    response.status_code = status
+    if etag:
+        response.headers["ETag"] = etag
+    response._content = b"" if data is None else json.dumps(data).encode("utf-8")
+    return response
+
+
+def _items(ids: list[str]) -> dict:
+    return {
+        "items": [
+            {
+                "id": video_id,
+                "snippet": {"title": video_id, "tags": ["a"]},
+                "contentDetails": {"duration": "PT2M"},
+                "statistics": {"viewCount": "7"},
+            }
+            for video_id in ids
+        ]
+    }
+
+
+class FakeSession:
+    def __init__(self, respond) -> None:
+        self.respond = respond
+        self.calls: list[tuple[dict, dict]] = []
+
+    def get(self, url: str, *, params: dict, headers: dict, timeout: float):
+        self.calls.append((params, headers))
+        return self.respond(params, headers)
+
+    def close(self) -> None:
+        pass
+
+
+def test_fetch_videos_batches_fifty_ids_and_counts_quota() -> None:
+    session = FakeSession(
+        lambda params, headers: _response(200, _items(params["id"].split(",")))
+    )
+    quota = QuotaBudget()
+    ids = [f"v{i}" for i in range(120)] + ["v0"]
+
+    with YouTubeDataClient("key", session=session, quota=quota) as client:
+        videos = client.fetch_videos(ids)
+
+    assert sorted(len(params["id"].split(",")) for params, _ in session.calls) == [
+        20,
+        50,
+        50,
+    ]
+    assert len(videos) == 120
+    assert videos["v3"].duration_seconds == 120
+    assert videos["v3"].keywords == ("a",)
+    assert videos["v3"].view_count == 7
+    assert quota.summary() == "3 requests, 3/10000 quota units"
+
+
+def test_etag_cache_replays_items_on_not_modified(tmp_path: Path) -> None:
+    path = tmp_path / "videos.json"
+    first = FakeSession(lambda params, headers: _response(200, _items(["a"]), '"e1"'))
+    cache = VideoResponseCache(path)
+    YouTubeDataClient("key", session=first, cache=cache).fetch_videos(["a"])
+    cache.save()
+
+    second = FakeSession(lambda params, headers: _response(304))
+    cache = VideoResponseCache(path)
+    videos = YouTubeDataClient("key", session=second, cache=cache).fetch_videos(["a"])
+
+    assert second.calls[0][1]["If-None-Match"] == '"e1"'
+    assert videos["a"].title == "a"
+    assert cache.stats["not_modified"] == 1
+
+
+def test_etag_cache_merges_with_other_runs_and_evicts(tmp_path: Path) -> None:
+    path = tmp_path / "videos.json"
+    session = FakeSession(
+        lambda params, headers: _response(200, _items(params["id"].split(",")), '"e"')
+    )
+    first = VideoResponseCache(path)
+    YouTubeDataClient("key", session=session, cache=first).fetch_videos(["b", "a"])
+    first.save()
+    second = VideoResponseCache(path)
+    YouTubeDataClient("key", session=session, cache=second).fetch_videos(["c"])
+    second.save()
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    parts = ",".join(API_PARTS)
+    assert sorted(saved) == [f"{parts}|a,b", f"{parts}|c"]
+
+    saved[f"{parts}|a,b"]["used_at"] = 0
+    path.write_text(json.dumps(saved), encoding="utf-8")
+    third = VideoResponseCache(path, max_entries=1)
+    YouTubeDataClient("key", session=session, cache=third).fetch_videos(["d"])
+    third.save()
+    assert sorted(json.loads(path.read_text(encoding="utf-8"))) == [f"{parts}|d"]
+
+
+def test_quota_exceeded_stops_remaining_batches() -> None:
+    error = {"error": {"errors": [{"reason": "quotaExceeded"}]}}
+    session = FakeSession(lambda params, headers: _response(403, error))
+    quota = QuotaBudget()
+    client = YouTubeDataClient("key", session=session, quota=quota, max_workers=1)
+    failed: list[tuple[list[str], YouTubeDataError]] = []
+
+    videos = client.fetch_videos(
+        [f"v{i}" for i in range(101)],
+        on_error=lambda batch, exc: failed.append((batch, exc)),
+    )
+
+    assert videos == {}
+    assert len(session.calls) == 1
+    assert [len(batch) for batch, _ in failed] == [50, 50, 1]
+    assert all(isinstance(exc, QuotaExceeded) for _, exc in failed)
+    with pytest.raises(QuotaExceeded):
+        client.fetch_videos(["v0"])
+
+
+def test_select_thumbnail_prefers_highest_resolution() -> None:
+    thumbnails = {
+        "default": {"url": "https://img/default.jpg"},
+        "high": {"url": " https://img/high.jpg "},
+    }
+    assert select_thumbnail(thumbnails) == "https://img/high.jpg"
+    assert select_thumbnail({"custom": "https://img/custom.jpg"}) == (
+        "https://img/custom.jpg"
+    )
+    assert select_thumbnail(None) == ""
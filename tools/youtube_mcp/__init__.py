@@ -1,21 +1,45 @@
-"""YouTube transcript MCP integration package."""
+"""YouTube transcript MCP integration package.
+
+Public names are resolved lazily (PEP 562) so that importing a submodule such
+as :mod:`tools.youtube_mcp.cli` does not pull in the YouTube client and its
+HTTP dependencies until a command actually needs them.
+"""
 
 from __future__ import annotations
 
-from .models import (
-    CaptionTrackInfo,
-    Chunk,
-    HealthResponse,
-    MetadataRequest,
-    MetadataResponse,
-    TracksRequest,
-    TracksResponse,
-    TranscriptRequest,
-    TranscriptResponse,
-    VideoInfo,
-)
-from .settings import Settings
-from .youtube_client import YouTubeTranscriptService
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .models import (
+        CaptionTrackInfo,
+        Chunk,
+        HealthResponse,
+        MetadataRequest,
+        MetadataResponse,
+        TracksRequest,
+        TracksResponse,
+        TranscriptRequest,
+        TranscriptResponse,
+        VideoInfo,
+    )
+    from .settings import Settings
+    from .youtube_client import YouTubeTranscriptService
+
+_EXPORTS = {
+    "CaptionTrackInfo": ".models",
+    "Chunk": ".models",
+    "HealthResponse": ".models",
+    "MetadataRequest": ".models",
+    "MetadataResponse": ".models",
+    "Settings": ".settings",
+    "TracksRequest": ".models",
+    "TracksResponse": ".models",
+    "TranscriptRequest": ".models",
+    "TranscriptResponse": ".models",
+    "VideoInfo": ".models",
+    "YouTubeTranscriptService": ".youtube_client",
+}
 
 __all__ = [
     "CaptionTrackInfo",
@@ -33,3 +57,17 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,303 @@
+"""Micro-benchmarks for the transcript service internals.
+
+Run ``python -m tools.youtube_mcp.benchmarks --help`` for the available suites.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .cache import TranscriptCache
+from .chunking import CHUNK_PROFILES, DEFAULT_PROFILE, chunk_payload_segments
+from .search import match_expression
+
+
+def _sample_transcript(video_id: str, segments: int) -> dict[str, Any]:
+    return {
+        "video": {"id": video_id, "url": f"https://www.youtube.com/watch?v={video_id}"},
+        "captions": {"lang": "en", "is_auto": False, "track_name": None},
+        "segments": [
+            {
+                "id": f"{video_id}:{idx}",
+                "text": f"benchmark caption {idx}",
+                "start": float(idx),
+                "dur": 1.0,
+            }
+            for idx in range(segments)
+        ],
+        "chunks": [],
+        "hash": video_id,
+    }
+
+
+def bench_cache_reads(
+    cache_dir: Path,
+    *,
+    thread_counts: list[int],
+    entries: int = 100,
+    segments: int = 50,
+    reads_per_thread: int = 500,
+) -> list[dict[str, float]]:
+    """Measure :meth:`TranscriptCache.get` throughput for each thread count."""
+
+    cache = TranscriptCache(cache_dir)
+    keys = [f"video-{idx:05d}" for idx in range(entries)]
+    for key in keys:
+        cache.set(key, _sample_transcript(key, segments), ttl_days=1)
+
+    results: list[dict[str, float]] = []
+    try:
+        for threads in thread_counts:
+            barrier = threading.Barrier(threads + 1)
+
+            def worker(offset: int, barrier: threading.Barrier = barrier) -> None:
+                barrier.wait()
+                for idx in range(reads_per_thread):
+                    cache.get(keys[(offset + idx) % len(keys)])
+
+            workers = [
+                threading.Thread(target=worker, args=(n,)) for n in range(threads)
+            ]
+            for thread in workers:
+                thread.start()
+            barrier.wait()
+            started = time.perf_counter()
+            for thread in workers:
+                thread.join()
+            elapsed = time.perf_counter() - started
+            total = threads * reads_per_thread
+            results.append(
+                {
+                    "threads": threads,
+                    "reads": total,
+                    "seconds": round(elapsed, 4),
+                    "reads_per_second": round(total / elapsed, 1) if elapsed else 0.0,
+                }
+            )
+    finally:
+        cache.close()
+    return results
+
+
+def bench_chunking(
+    *, segments: int = 10_000, repeats: int = 3
+) -> list[dict[str, float | str]]:
+    """Time :func:`chunk_payload_segments` per profile on a long transcript."""
+
+    payload = _sample_transcript("bench-chunking", segments)
+    for idx, segment in enumerate(payload["segments"]):
+        if idx % 7 == 6:
+            segment["text"] += "."
+    results: list[dict[str, float | str]] = []
+    for name, profile in CHUNK_PROFILES.items():
+        best = float("inf")
+        chunks: list[dict[str, Any]] = []
+        for _ in range(max(1, repeats)):
+            started = time.perf_counter()
+            chunks = chunk_payload_segments(
+                "bench-chunking", payload["segments"], profile
+            )
+            best = min(best, time.perf_counter() - started)
+        results.append(
+            {
+                "profile": name,
+                "segments": segments,
+                "chunks": len(chunks),
+                "seconds": round(best, 4),
+            }
+        )
+    return results
+
+
+_SEARCH_WORDS = (
+    "starship refuelling orbit booster raptor engine tower catch battery "
+    "solar panel printer filament robot arm sensor firmware camera drone "
+    "cooling pump valve heat shield landing launch telemetry"
+).split()
+
+
+def bench_search(
+    cache_dir: Path,
+    *,
+    videos: int = 2000,
+    segments: int = 100,
+    queries: int = 50,
+    seed: int = 7,
+) -> dict[str, float]:
+    """Index ``videos`` synthetic transcripts, then time full-text queries.
+
+    Also reports the compressed cache payloads next to the whole database
+    file, whose difference is what the full-text index costs on disk.
+    """
+
+    rng = random.Random(seed)
+    cache = TranscriptCache(cache_dir)
+    try:
+        started = time.perf_counter()
+        for idx in range(videos):
+            video_id = f"v{idx:010d}"
+            payload = _sample_transcript(video_id, segments)
+            for segment in payload["segments"]:
+                words = [f"filler{rng.randrange(5000)}" for _ in range(8)]
+                if rng.random() < 0.1:
+                    words[rng.randrange(8)] = rng.choice(_SEARCH_WORDS)
+                segment["text"] = " ".join(words)
+            payload["chunks"] = chunk_payload_segments(
+                video_id, payload["segments"], DEFAULT_PROFILE
+            )
+            cache.set(video_id, payload, ttl_days=1)
+        indexed = time.perf_counter() - started
+
+        timings: list[float] = []
+        for _ in range(queries):
+            expression = match_expression(" ".join(rng.sample(_SEARCH_WORDS, 2)))
+            started = time.perf_counter()
+            cache.search(expression, limit=10)
+            timings.append(time.perf_counter() - started)
+        cache.vacuum()
+        storage = cache.stats()
+    finally:
+        cache.close()
+    timings.sort()
+    return {
+        "videos": videos,
+        "index_seconds": round(indexed, 3),
+        "queries": queries,
+        "median_ms": round(timings[len(timings) // 2] * 1000, 3),
+        "max_ms": round(timings[-1] * 1000, 3),
+        "payload_bytes": storage["total_bytes"],
+        "file_bytes": storage["file_bytes"],
+    }
+
+
+# Third-party packages that only some entry points should pay for at startup.
+HEAVY_MODULES = (
+    "fastapi",
+    "httpx",
+    "tenacity",
+    "uvicorn",
+    "youtube_transcript_api",
+)
+
+
+def bench_import_time(module: str, *, repeats: int = 3) -> dict[str, Any]:
+    """Import ``module`` in fresh interpreters under ``-X importtime``.
+
+    Reports the best cumulative import time and which :data:`HEAVY_MODULES`
+    were loaded along the way.
+    """
+
+    best = float("inf")
+    loaded: set[str] = set()
+    for _ in range(max(1, repeats)):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parents[2],
+        )
+        loaded = set()
+        for line in completed.stderr.splitlines():
+            if not line.startswith("import time:"):
+                continue
+            _, cumulative, name = line.split("|")
+            name = name.strip()
+            loaded.add(name)
+            if name == module and cumulative.strip().isdigit():
+                best = min(best, int(cumulative) / 1_000_000)
+    return {
+        "module": module,
+        "seconds": round(best, 4),
+        "modules": len(loaded),
+        "heavy": sorted(name for name in HEAVY_MODULES if name in loaded),
+    }
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="youtube_mcp micro-benchmarks")
+    subparsers = parser.add_subparsers(dest="suite", required=True)
+
+    reads_parser = subparsers.add_parser(
+        "cache-reads", help="Concurrent TranscriptCache.get throughput"
+    )
+    reads_parser.add_argument(
+        "--threads", default="1,2,4,8", help="Comma-separated thread counts"
+    )
+    reads_parser.add_argument("--entries", type=int, default=100)
+    reads_parser.add_argument("--segments", type=int, default=50)
+    reads_parser.add_argument("--reads", type=int, default=500, help="Reads per thread")
+
+    chunking_parser = subparsers.add_parser(
+        "chunking", help="Chunker runtime per profile on a long transcript"
+    )
+    chunking_parser.add_argument("--segments", type=int, default=10_000)
+    chunking_parser.add_argument("--repeats", type=int, default=3)
+
+    search_parser = subparsers.add_parser(
+        "search", help="Full-text query latency over many cached transcripts"
+    )
+    search_parser.add_argument("--videos", type=int, default=2000)
+    search_parser.add_argument("--segments", type=int, default=100)
+    search_parser.add_argument("--queries", type=int, default=50)
+
+    imports_parser = subparsers.add_parser(
+        "imports", help="Cold-start import time of the service entry points"
+    )
+    imports_parser.add_argument(
+        "--modules",
+        default="tools.youtube_mcp.cli,tools.youtube_mcp.http_server,"
+        "tools.youtube_mcp.mcp_server",
+        help="Comma-separated modules to import",
+    )
+    imports_parser.add_argument("--repeats", type=int, default=3)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    rows: list[dict[str, Any]] = []
+    if args.suite == "cache-reads":
+        thread_counts = [int(value) for value in args.threads.split(",") if value]
+        with tempfile.TemporaryDirectory() as tmp:
+            rows.extend(
+                bench_cache_reads(
+                    Path(tmp),
+                    thread_counts=thread_counts,
+                    entries=args.entries,
+                    segments=args.segments,
+                    reads_per_thread=args.reads,
+                )
+            )
+    elif args.suite == "chunking":
+        rows.extend(bench_chunking(segments=args.segments, repeats=args.repeats))
+    elif args.suite == "search":
+        with tempfile.TemporaryDirectory() as tmp:
+            rows.append(
+                bench_search(
+                    Path(tmp),
+                    videos=args.videos,
+                    segments=args.segments,
+                    queries=args.queries,
+                )
+            )
+    elif args.suite == "imports":
+        for module in args.modules.split(","):
+            if module:
+                rows.append(bench_import_time(module, repeats=args.repeats))
+    for row in rows:
+        print(json.dumps(row))
+    return 0
+
+
+if __name__ == "__main__":  # pragma: no cover
+    raise SystemExit(main())
@@ -2,85 +2,591 @@
 
 from __future__ import annotations
 
+import functools
 import json
 import sqlite3
 import threading
 import time
+import zlib
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from .metrics import CACHE_EVICTIONS, CACHE_LOOKUPS
+from .search import (
+    chunk_rows,
+    chunk_texts,
+    create_search_index,
+    index_rows,
+    query_index,
+    register_search_functions,
+)
+from .utils import build_watch_url
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .settings import Settings
+
+SCHEMA_VERSION = 2
+"""Current payload schema; version 2 stores compressed, columnar transcripts."""
+
+_LEGACY_SCHEMA_VERSION = 1
+
+_FORMAT_JSON = 1
+_FORMAT_TRANSCRIPT = 2
+
+_ACCESS_FLUSH_THRESHOLD = 256
+_MAX_IDLE_READERS = 8
+
+
+def encode_value(value: Any) -> bytes:
+    """Serialise a cache value into the compact on-disk representation.
+
+    Transcript payloads have their segments stored column-wise and their chunks
+    stored as ``[first, count]`` ranges into the segment list whenever the chunk
+    can be rebuilt losslessly. Everything is zlib-compressed JSON prefixed by a
+    single format byte.
+    """
+
+    packed = _pack_transcript(value)
+    fmt = _FORMAT_TRANSCRIPT if packed is not None else _FORMAT_JSON
+    body = json.dumps(
+        packed if packed is not None else value,
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return bytes([fmt]) + zlib.compress(body, 6)
+
+
+def decode_value(raw: bytes | str, *, lazy: bool = False) -> Any:
+    """Inverse of :func:`encode_value`; also accepts legacy plain JSON text.
+
+    With ``lazy`` a packed transcript's ``segments`` and ``chunks`` are
+    one-shot iterators that build each item as it is consumed.
+    """
+
+    if isinstance(raw, str):
+        return json.loads(raw)
+    fmt = raw[0]
+    data = json.loads(zlib.decompress(raw[1:]).decode("utf-8"))
+    if fmt == _FORMAT_TRANSCRIPT:
+        return _unpack_transcript(data, lazy=lazy)
+    if fmt == _FORMAT_JSON:
+        return data
+    raise ValueError(f"Unknown cache value format: {fmt}")
+
+
+@functools.lru_cache(maxsize=64)
+def _decoded_chunk_texts(raw: bytes | str) -> tuple[str | None, ...]:
+    try:
+        return tuple(chunk_texts(decode_value(raw)))
+    except (ValueError, TypeError, zlib.error):
+        return ()
+
+
+def _search_chunk_text(raw: bytes | str, position: int) -> str | None:
+    """Chunk text for the search index, decoded from a stored cache value.
+
+    Consecutive calls for the chunks of one entry share a single decode.
+    """
+
+    texts = _decoded_chunk_texts(raw)
+    return texts[position] if 0 <= position < len(texts) else None
+
+
+def _pack_transcript(value: Any) -> dict[str, Any] | None:
+    if not isinstance(value, dict):
+        return None
+    segments = value.get("segments")
+    chunks = value.get("chunks")
+    video = value.get("video")
+    if not isinstance(segments, list) or not isinstance(chunks, list):
+        return None
+    if not isinstance(video, dict) or not isinstance(video.get("id"), str):
+        return None
+    if any(
+        not isinstance(seg, dict) or set(seg) != {"id", "text", "start", "dur"}
+        for seg in segments
+    ):
+        return None
+
+    columns: dict[str, list[Any]] = {
+        "id": [seg["id"] for seg in segments],
+        "text": [seg["text"] for seg in segments],
+        "start": [seg["start"] for seg in segments],
+        "dur": [seg["dur"] for seg in segments],
+    }
+    packed = {
+        key: item for key, item in value.items() if key not in {"segments", "chunks"}
+    }
+    packed["segments"] = columns
+
+    positions = {seg_id: index for index, seg_id in enumerate(columns["id"])}
+    ranges: list[list[int]] = []
+    for index, chunk in enumerate(chunks):
+        segment_ids = chunk.get("segment_ids") if isinstance(chunk, dict) else None
+        if not segment_ids or segment_ids[0] not in positions:
+            break
+        first = positions[segment_ids[0]]
+        count = len(segment_ids)
+        if _rebuild_chunk(video["id"], columns, index, first, count) != chunk:
+            break
+        ranges.append([first, count])
+    else:
+        packed["chunk_ranges"] = ranges
+        return packed
+
+    # Chunks that cannot be rebuilt from their segments are stored verbatim.
+    packed["chunks"] = chunks
+    return packed
+
+
+def _unpack_transcript(packed: dict[str, Any], *, lazy: bool = False) -> dict[str, Any]:
+    value = {
+        key: item
+        for key, item in packed.items()
+        if key not in {"segments", "chunks", "chunk_ranges"}
+    }
+    segments = _iter_segments(packed["segments"])
+    chunks: Iterable[dict[str, Any]]
+    if "chunk_ranges" in packed:
+        chunks = _iter_chunks(
+            value["video"]["id"], packed["segments"], packed["chunk_ranges"]
+        )
+    else:
+        chunks = packed["chunks"]
+    value["segments"] = segments if lazy else list(segments)
+    value["chunks"] = iter(chunks) if lazy else list(chunks)
+    return value
+
+
+def _iter_segments(columns: dict[str, list[Any]]) -> Iterator[dict[str, Any]]:
+    for seg_id, text, start, dur in zip(
+        columns["id"], columns["text"], columns["start"], columns["dur"], strict=True
+    ):
+        yield {"id": seg_id, "text": text, "start": start, "dur": dur}
+
+
+def _iter_chunks(
+    video_id: str, columns: dict[str, list[Any]], ranges: list[list[int]]
+) -> Iterator[dict[str, Any]]:
+    for index, (first, count) in enumerate(ranges):
+        yield _rebuild_chunk(video_id, columns, index, first, count)
+
+
+def _rebuild_chunk(
+    video_id: str, columns: dict[str, list[Any]], index: int, first: int, count: int
+) -> dict[str, Any]:
+    stop = first + count
+    starts = columns["start"][first:stop]
+    durs = columns["dur"][first:stop]
+    start = starts[0]
+    return {
+        "id": f"{video_id}:chunk:{index}",
+        "text": " ".join(columns["text"][first:stop]).strip(),
+        "start": start,
+        "end": max(
+            seg_start + dur for seg_start, dur in zip(starts, durs, strict=True)
+        ),
+        "segment_ids": columns["id"][first:stop],
+        "cite_url": f"{build_watch_url(video_id)}&t={int(start)}s",
+    }
 
 
 class TranscriptCache:
-    """Durable cache for transcript payloads."""
+    """Durable cache for transcript payloads.
 
-    def __init__(self, cache_dir: Path, schema_version: int = 1) -> None:
+    ``max_bytes`` and ``max_entries`` bound the stored payload size; once either
+    budget is exceeded the least recently accessed entries are evicted.
+    Expired entries are kept for ``max_stale_seconds`` so :meth:`get_stale` can
+    serve them while YouTube is unavailable; :meth:`get` never returns them.
+
+    Reads check out a read-only connection from a small pool so they run
+    concurrently under WAL; at most ``_MAX_IDLE_READERS`` connections stay
+    open between reads, whichever threads made them. Every write goes through
+    a single connection guarded by ``_lock``. Access times recorded by
+    :meth:`get` are buffered and flushed in batches by the writer. Transcript
+    chunks are mirrored into a full-text index on every :meth:`set`; see
+    :mod:`.search`.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        schema_version: int = SCHEMA_VERSION,
+        *,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        max_stale_seconds: float = 0.0,
+    ) -> None:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.path = self.cache_dir / "cache.sqlite"
         self.schema_version = schema_version
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.max_stale_seconds = max_stale_seconds
         self._lock = threading.RLock()
         self._conn = sqlite3.connect(self.path, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL;")
         self._conn.execute("PRAGMA synchronous=NORMAL;")
+        register_search_functions(self._conn, _search_chunk_text)
+        self._readers: list[sqlite3.Connection] = []
+        self._idle_readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._pending_access: dict[str, float] = {}
+        self._access_lock = threading.Lock()
         self._initialise()
 
+    @classmethod
+    def from_settings(cls, settings: Settings) -> TranscriptCache:
+        """Build a cache honouring the directory and budgets in ``settings``."""
+
+        return cls(
+            settings.cache_dir,
+            max_bytes=settings.cache_max_bytes,
+            max_entries=settings.cache_max_entries,
+            max_stale_seconds=settings.cache_max_stale_seconds,
+        )
+
     def _initialise(self) -> None:
         with self._conn:
             self._conn.execute("""
                 CREATE TABLE IF NOT EXISTS cache_entries (
                     cache_key TEXT PRIMARY KEY,
-                    value TEXT NOT NULL,
+                    value BLOB NOT NULL,
                     expires_at REAL NOT NULL,
-                    schema_version INTEGER NOT NULL
+                    schema_version INTEGER NOT NULL,
+                    last_access REAL NOT NULL DEFAULT 0,
+                    size_bytes INTEGER NOT NULL DEFAULT 0
                 )
                 """)
+            columns = {
+                row[1] for row in self._conn.execute("PRAGMA table_info(cache_entries)")
+            }
+            if "last_access" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE cache_entries ADD COLUMN last_access REAL NOT NULL DEFAULT 0"
+                )
+            if "size_bytes" not in columns:
+                self._conn.execute(
+                    "ALTER TABLE cache_entries ADD COLUMN size_bytes INTEGER NOT NULL DEFAULT 0"
+                )
+                self._conn.execute(
+                    "UPDATE cache_entries SET size_bytes = length(value)"
+                )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_expires_at "
+                "ON cache_entries (expires_at)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_entries_last_access "
+                "ON cache_entries (last_access)"
+            )
+            search_created = create_search_index(self._conn)
+        if self.schema_version == SCHEMA_VERSION:
+            self._migrate_legacy_rows()
+        if search_created:
+            self._backfill_search_index()
+
+    def _backfill_search_index(self) -> None:
+        """Index transcripts cached before the search index existed."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT cache_key, value FROM cache_entries WHERE schema_version = ?",
+                (self.schema_version,),
+            ).fetchall()
+            with self._conn:
+                for key, value in rows:
+                    try:
+                        decoded = decode_value(value)
+                    except (ValueError, TypeError, zlib.error):
+                        continue
+                    search_rows = chunk_rows(key, decoded)
+                    if search_rows:
+                        index_rows(self._conn, key, search_rows)
+
+    def _migrate_legacy_rows(self) -> None:
+        """Re-encode schema v1 rows (plain JSON text) into the compact format."""
+
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT cache_key, value FROM cache_entries WHERE schema_version = ?",
+                (_LEGACY_SCHEMA_VERSION,),
+            ).fetchall()
+            if not rows:
+                return
+            updates = []
+            for key, value in rows:
+                try:
+                    encoded = encode_value(decode_value(value))
+                except (ValueError, TypeError, zlib.error):
+                    encoded = None
+                updates.append((key, encoded))
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE cache_entries SET value = ?, schema_version = ? WHERE cache_key = ?",
+                    [
+                        (encoded, SCHEMA_VERSION, key)
+                        for key, encoded in updates
+                        if encoded
+                    ],
+                )
+                self._conn.executemany(
+                    "DELETE FROM cache_entries WHERE cache_key = ?",
+                    [(key,) for key, encoded in updates if not encoded],
+                )
+
+    @contextmanager
+    def _reading(self) -> Iterator[sqlite3.Connection]:
+        """Check out a pooled read-only connection for the duration of a read."""
+
+        with self._readers_lock:
+            conn = self._idle_readers.pop() if self._idle_readers else None
+        if conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA query_only=ON;")
+            register_search_functions(conn, _search_chunk_text)
+            with self._readers_lock:
+                self._readers.append(conn)
+        try:
+            yield conn
+        finally:
+            with self._readers_lock:
+                keep = len(self._idle_readers) < _MAX_IDLE_READERS
+                if keep:
+                    self._idle_readers.append(conn)
+                else:
+                    self._readers.remove(conn)
+            if not keep:
+                conn.close()
+
+    def _record_access(self, key: str, when: float) -> None:
+        with self._access_lock:
+            self._pending_access[key] = when
+            should_flush = len(self._pending_access) >= _ACCESS_FLUSH_THRESHOLD
+        if should_flush:
+            self.flush_access()
+
+    def flush_access(self) -> None:
+        """Persist buffered last-access times so eviction sees recent reads."""
+
+        with self._access_lock:
+            pending, self._pending_access = self._pending_access, {}
+        if not pending:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "UPDATE cache_entries SET last_access = MAX(last_access, ?) "
+                    "WHERE cache_key = ?",
+                    [(when, key) for key, when in pending.items()],
+                )
 
     def close(self) -> None:
+        self.flush_access()
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+            self._idle_readers = []
+        for conn in readers:
+            conn.close()
         with self._lock:
             self._conn.close()
 
-    def clear_expired(self) -> None:
-        now = time.time()
+    def clear_expired(self) -> int:
+        """Delete entries expired beyond the stale window; return how many."""
+
+        cutoff = time.time() - self.max_stale_seconds
         with self._lock:
             with self._conn:
-                self._conn.execute(
-                    "DELETE FROM cache_entries WHERE expires_at <= ?", (now,)
+                cursor = self._conn.execute(
+                    "DELETE FROM cache_entries WHERE expires_at <= ?", (cutoff,)
                 )
+            if cursor.rowcount:
+                CACHE_EVICTIONS.inc("expired", amount=cursor.rowcount)
+            return cursor.rowcount
+
+    def evict(
+        self, *, max_bytes: int | None = None, max_entries: int | None = None
+    ) -> int:
+        """Evict least recently accessed entries until both budgets are met.
+
+        Budgets default to the limits configured on the cache; ``None`` means
+        unbounded. Returns the number of evicted entries.
+        """
 
-    def get(self, key: str) -> Any | None:
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        max_entries = self.max_entries if max_entries is None else max_entries
+        if max_bytes is None and max_entries is None:
+            return 0
+        self.flush_access()
         with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM cache_entries"
+            ).fetchone()
+            excess_entries = count - max_entries if max_entries is not None else 0
+            excess_bytes = total - max_bytes if max_bytes is not None else 0
+            if excess_entries <= 0 and excess_bytes <= 0:
+                return 0
+            victims: list[tuple[str]] = []
             cursor = self._conn.execute(
+                "SELECT cache_key, size_bytes FROM cache_entries "
+                "ORDER BY last_access ASC, rowid ASC"
+            )
+            for key, size in cursor:
+                if excess_entries <= 0 and excess_bytes <= 0:
+                    break
+                victims.append((key,))
+                excess_entries -= 1
+                excess_bytes -= size
+            with self._conn:
+                self._conn.executemany(
+                    "DELETE FROM cache_entries WHERE cache_key = ?", victims
+                )
+            CACHE_EVICTIONS.inc("lru", amount=len(victims))
+            return len(victims)
+
+    def prune(self) -> dict[str, int]:
+        """Drop expired entries, then enforce the size budgets."""
+
+        with self._lock:
+            expired = self.clear_expired()
+            evicted = self.evict()
+        return {"expired": expired, "evicted": evicted}
+
+    def vacuum(self) -> None:
+        """Reclaim free pages and truncate the write-ahead log."""
+
+        with self._lock:
+            self._conn.execute("VACUUM")
+            self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def stats(self) -> dict[str, Any]:
+        """Summarise entry counts, payload bytes and on-disk footprint."""
+
+        with self._reading() as conn:
+            entries, expired, total_bytes = conn.execute(
+                """
+                SELECT COUNT(*),
+                       COALESCE(SUM(expires_at <= ?), 0),
+                       COALESCE(SUM(size_bytes), 0)
+                FROM cache_entries
+                """,
+                (time.time(),),
+            ).fetchone()
+        file_bytes = sum(
+            candidate.stat().st_size
+            for candidate in (
+                self.path,
+                self.path.with_name(self.path.name + "-wal"),
+                self.path.with_name(self.path.name + "-shm"),
+            )
+            if candidate.exists()
+        )
+        return {
+            "entries": entries,
+            "expired": expired,
+            "total_bytes": total_bytes,
+            "file_bytes": file_bytes,
+            "max_bytes": self.max_bytes,
+            "max_entries": self.max_entries,
+        }
+
+    def expires_in(self, key: str) -> float | None:
+        """Seconds until ``key`` expires, or ``None`` when it is not cached."""
+
+        with self._reading() as conn:
+            row = conn.execute(
+                "SELECT expires_at FROM cache_entries WHERE cache_key = ? AND schema_version = ?",
+                (key, self.schema_version),
+            ).fetchone()
+        if not row:
+            return None
+        return float(row[0]) - time.time()
+
+    def get(self, key: str, *, lazy: bool = False) -> Any | None:
+        """Return the live value for ``key``; ``lazy`` is passed to :func:`decode_value`."""
+
+        with self._reading() as conn:
+            row = conn.execute(
                 "SELECT value, expires_at, schema_version FROM cache_entries WHERE cache_key = ?",
                 (key,),
-            )
-            row = cursor.fetchone()
-            if not row:
-                return None
-            value, expires_at, schema_version = row
-            if schema_version != self.schema_version:
-                self.delete(key)
-                return None
-            if expires_at <= time.time():
+            ).fetchone()
+        if not row:
+            CACHE_LOOKUPS.inc("miss")
+            return None
+        value, expires_at, schema_version = row
+        now = time.time()
+        if schema_version != self.schema_version:
+            CACHE_LOOKUPS.inc("miss")
+            self.delete(key)
+            return None
+        if expires_at <= now:
+            CACHE_LOOKUPS.inc("expired")
+            if expires_at <= now - self.max_stale_seconds:
+                CACHE_EVICTIONS.inc("expired")
                 self.delete(key)
-                return None
-            return json.loads(value)
+            return None
+        CACHE_LOOKUPS.inc("hit")
+        self._record_access(key, now)
+        return decode_value(value, lazy=lazy)
+
+    def get_stale(self, key: str) -> Any | None:
+        """Return ``key`` even if expired, as long as it is within the stale window."""
 
-    def set(self, key: str, value: Any, ttl_days: int) -> None:
-        expires_at = time.time() + ttl_days * 24 * 60 * 60
-        payload = json.dumps(value, ensure_ascii=False)
+        with self._reading() as conn:
+            row = conn.execute(
+                "SELECT value FROM cache_entries "
+                "WHERE cache_key = ? AND schema_version = ? AND expires_at > ?",
+                (key, self.schema_version, time.time() - self.max_stale_seconds),
+            ).fetchone()
+        return decode_value(row[0]) if row else None
+
+    def set(self, key: str, value: Any, ttl_days: float) -> None:
+        now = time.time()
+        expires_at = now + ttl_days * 24 * 60 * 60
+        payload = encode_value(value)
+        search_rows = chunk_rows(key, value)
         with self._lock:
             with self._conn:
+                index_rows(self._conn, key, search_rows)
                 self._conn.execute(
                     """
-                    INSERT INTO cache_entries (cache_key, value, expires_at, schema_version)
-                    VALUES(?, ?, ?, ?)
+                    INSERT INTO cache_entries (
+                        cache_key, value, expires_at, schema_version, last_access, size_bytes
+                    )
+                    VALUES(?, ?, ?, ?, ?, ?)
                     ON CONFLICT(cache_key) DO UPDATE SET
                         value = excluded.value,
                         expires_at = excluded.expires_at,
-                        schema_version = excluded.schema_version
+                        schema_version = excluded.schema_version,
+                        last_access = excluded.last_access,
+                        size_bytes = excluded.size_bytes
                     """,
-                    (key, payload, expires_at, self.schema_version),
+                    (key, payload, expires_at, self.schema_version, now, len(payload)),
                 )
+            self.evict()
+
+    def search(
+        self,
+        expression: str,
+        *,
+        limit: int = 10,
+        video_id: str | None = None,
+        lang: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Ranked chunks of live transcripts matching an FTS5 ``expression``."""
+
+        with self._reading() as conn:
+            return query_index(
+                conn,
+                expression,
+                schema_version=self.schema_version,
+                limit=limit,
+                video_id=video_id,
+                lang=lang,
+            )
 
     def delete(self, key: str) -> None:
         with self._lock:
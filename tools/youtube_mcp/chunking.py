@@ -2,11 +2,112 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
+from bisect import bisect_right
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Any
 
+from .errors import InvalidArgument
 from .models import Chunk, Segment
 from .utils import build_watch_url
 
+Tokenizer = Callable[[str], int]
+"""Callable returning the size of a piece of text in the profile's unit."""
+
+_SENTENCE_END = (".", "!", "?", "…", '."', '!"', '?"')
+
+
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+_TOKENIZERS: dict[str, Tokenizer] = {"chars": len, "words": _word_count}
+
+
+def register_tokenizer(name: str, tokenizer: Tokenizer) -> None:
+    """Make ``tokenizer`` available to chunk profiles under ``name``."""
+
+    _TOKENIZERS[name] = tokenizer
+
+
+def get_tokenizer(name: str) -> Tokenizer:
+    """Resolve a tokenizer by name.
+
+    ``tiktoken:<encoding>`` loads an OpenAI encoding when :mod:`tiktoken` is
+    installed; it is an optional dependency.
+    """
+
+    if name in _TOKENIZERS:
+        return _TOKENIZERS[name]
+    if name.startswith("tiktoken:"):  # pragma: no cover - optional dependency
+        try:
+            import tiktoken
+        except ImportError as exc:
+            raise InvalidArgument(f"Tokenizer {name} requires tiktoken") from exc
+        encoding = tiktoken.get_encoding(name.split(":", 1)[1])
+
+        def count(text: str) -> int:
+            return len(encoding.encode(text))
+
+        register_tokenizer(name, count)
+        return count
+    raise InvalidArgument(f"Unknown tokenizer: {name}")
+
+
+@dataclass(frozen=True)
+class ChunkProfile:
+    """How a transcript is cut into retrieval windows.
+
+    ``target`` and ``overlap`` are measured with ``tokenizer``. With
+    ``sentence_boundaries`` a chunk ends on the last segment that closes a
+    sentence, provided that keeps at least half of ``target``.
+    """
+
+    name: str = "default"
+    target: int = 1000
+    overlap: int = 100
+    tokenizer: str = "chars"
+    sentence_boundaries: bool = False
+
+
+DEFAULT_PROFILE = ChunkProfile()
+
+CHUNK_PROFILES: dict[str, ChunkProfile] = {
+    profile.name: profile
+    for profile in (
+        DEFAULT_PROFILE,
+        ChunkProfile(name="sentences", sentence_boundaries=True),
+        ChunkProfile(
+            name="words-200",
+            target=200,
+            overlap=25,
+            tokenizer="words",
+            sentence_boundaries=True,
+        ),
+        ChunkProfile(
+            name="words-50",
+            target=50,
+            overlap=10,
+            tokenizer="words",
+            sentence_boundaries=True,
+        ),
+    )
+}
+
+
+def get_chunk_profile(name: str | None) -> ChunkProfile:
+    """Look up a named chunk profile; ``None`` selects the default."""
+
+    if name is None:
+        return DEFAULT_PROFILE
+    try:
+        return CHUNK_PROFILES[name]
+    except KeyError:
+        raise InvalidArgument(
+            f"Unknown chunk profile: {name}; expected one of {', '.join(CHUNK_PROFILES)}"
+        ) from None
+
 
 def chunk_segments(
     video_id: str,
@@ -14,56 +115,127 @@ def chunk_segments(
     *,
     target_chars: int = 1000,
     overlap_chars: int = 100,
+    profile: ChunkProfile | None = None,
 ) -> list[Chunk]:
-    """Chunk a transcript into retrieval-friendly windows."""
+    """Chunk a transcript into retrieval-friendly windows.
+
+    ``profile`` overrides ``target_chars``/``overlap_chars`` when given.
+    """
 
     segment_list = list(segments)
-    if not segment_list:
-        return []
+    if profile is None:
+        profile = ChunkProfile(target=target_chars, overlap=overlap_chars)
+    chunks = chunk_columns(
+        video_id,
+        [segment.id for segment in segment_list],
+        [segment.text for segment in segment_list],
+        [segment.start for segment in segment_list],
+        [segment.dur for segment in segment_list],
+        profile,
+    )
+    return [Chunk(**chunk) for chunk in chunks]
 
-    chunks: list[Chunk] = []
-    current_segments: list[Segment] = []
-    current_length = 0
 
-    for segment in segment_list:
-        seg_len = len(segment.text)
-        if current_segments and current_length + seg_len > target_chars:
-            chunks.append(_build_chunk(video_id, current_segments, len(chunks)))
-            current_segments = _tail_with_overlap(current_segments, overlap_chars)
-            current_length = sum(len(seg.text) for seg in current_segments)
-        current_segments.append(segment)
-        current_length += seg_len
+def chunk_payload_segments(
+    video_id: str, segments: Sequence[dict[str, Any]], profile: ChunkProfile
+) -> list[dict[str, Any]]:
+    """Chunk already-serialised segment dicts, e.g. straight from the cache."""
 
-    if current_segments:
-        chunks.append(_build_chunk(video_id, current_segments, len(chunks)))
+    return chunk_columns(
+        video_id,
+        [seg["id"] for seg in segments],
+        [seg["text"] for seg in segments],
+        [seg["start"] for seg in segments],
+        [seg["dur"] for seg in segments],
+        profile,
+    )
 
-    return chunks
 
+def chunk_columns(
+    video_id: str,
+    ids: Sequence[str],
+    texts: Sequence[str],
+    starts: Sequence[float],
+    durs: Sequence[float],
+    profile: ChunkProfile,
+) -> list[dict[str, Any]]:
+    """Core chunker over column lists, returning plain chunk dicts.
 
-def _tail_with_overlap(segments: list[Segment], overlap_chars: int) -> list[Segment]:
-    if not segments or overlap_chars <= 0:
+    Segment sizes are turned into prefix sums once, so finding each chunk's end
+    and the overlap tail is a bisect rather than a re-summation; the whole pass
+    is linear in the number of segments plus the overlap carried between chunks.
+    """
+
+    count = len(ids)
+    if not count:
         return []
-    retained: list[Segment] = []
-    total = 0
-    for segment in reversed(segments):
-        retained.insert(0, segment)
-        total += len(segment.text)
-        if total >= overlap_chars:
-            break
-    return retained
-
-
-def _build_chunk(video_id: str, segments: list[Segment], index: int) -> Chunk:
-    start = segments[0].start
-    end = max(segment.start + segment.dur for segment in segments)
-    text = " ".join(segment.text for segment in segments).strip()
-    segment_ids = [segment.id for segment in segments]
-    cite_url = f"{build_watch_url(video_id)}&t={int(start)}s"
-    return Chunk(
-        id=f"{video_id}:chunk:{index}",
-        text=text,
-        start=start,
-        end=end,
-        segment_ids=segment_ids,
-        cite_url=cite_url,
+
+    measure = get_tokenizer(profile.tokenizer)
+    prefix = [0, *accumulate(measure(text) for text in texts)]
+    last_sentence_end = (
+        _last_sentence_ends(texts) if profile.sentence_boundaries else None
     )
+    target = profile.target
+    overlap = profile.overlap
+
+    bounds: list[tuple[int, int]] = []
+    first = 0
+    fresh = 0  # first segment not yet emitted in any chunk
+    while fresh < count:
+        # Always take at least one new segment, then grow while within target.
+        stop = max(
+            fresh + 1, bisect_right(prefix, prefix[first] + target, lo=fresh + 1) - 1
+        )
+        if last_sentence_end is not None and stop < count:
+            boundary = last_sentence_end[stop - 1] + 1
+            if boundary > fresh and prefix[boundary] - prefix[first] >= target // 2:
+                stop = boundary
+        bounds.append((first, stop))
+        fresh = stop
+        if stop >= count:
+            break
+        if overlap <= 0:
+            first = stop
+        else:
+            # Smallest tail (from the end) whose size reaches the overlap.
+            tail = bisect_right(prefix, prefix[stop] - overlap, lo=first) - 1
+            first = max(first, min(tail, stop - 1))
+
+    return [
+        _build_chunk(video_id, ids, texts, starts, durs, index, lo, hi)
+        for index, (lo, hi) in enumerate(bounds)
+    ]
+
+
+def _last_sentence_ends(texts: Sequence[str]) -> list[int]:
+    """For each index, the latest index at or before it whose text ends a sentence."""
+
+    result: list[int] = []
+    latest = -1
+    for index, text in enumerate(texts):
+        if text.rstrip().endswith(_SENTENCE_END):
+            latest = index
+        result.append(latest)
+    return result
+
+
+def _build_chunk(
+    video_id: str,
+    ids: Sequence[str],
+    texts: Sequence[str],
+    starts: Sequence[float],
+    durs: Sequence[float],
+    index: int,
+    lo: int,
+    hi: int,
+) -> dict[str, Any]:
+    start = starts[lo]
+    end = max(starts[pos] + durs[pos] for pos in range(lo, hi))
+    return {
+        "id": f"{video_id}:chunk:{index}",
+        "text": " ".join(texts[lo:hi]).strip(),
+        "start": start,
+        "end": end,
+        "segment_ids": list(ids[lo:hi]),
+        "cite_url": f"{build_watch_url(video_id)}&t={int(start)}s",
+    }
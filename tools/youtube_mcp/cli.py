@@ -1,17 +1,27 @@
-"""Command line interface for the YouTube MCP service."""
+"""Command line interface for the YouTube MCP service.
+
+Each command imports only what it needs: ``cache`` and ``search`` read the
+SQLite cache without loading the YouTube client, and the client (with httpx,
+tenacity and youtube-transcript-api) is imported only by commands that talk
+to YouTube.
+"""
 
 from __future__ import annotations
 
 import argparse
 import json
 import sys
-
-from pydantic import BaseModel
+from pathlib import Path
+from typing import TYPE_CHECKING
 
 from .errors import BaseYtMcpError
 from .settings import Settings
 from .utils import ensure_utf8
-from .youtube_client import YouTubeTranscriptService
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pydantic import BaseModel
+
+    from .youtube_client import YouTubeTranscriptService
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -30,6 +40,22 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Prefer auto-generated captions when available",
     )
+    transcript_parser.add_argument(
+        "--start", type=float, help="Window start in seconds (inclusive)"
+    )
+    transcript_parser.add_argument(
+        "--end", type=float, help="Window end in seconds (exclusive)"
+    )
+    transcript_parser.add_argument(
+        "--offset", type=int, help="Segments to skip within the window"
+    )
+    transcript_parser.add_argument(
+        "--limit", type=int, help="Maximum number of segments to return"
+    )
+    transcript_parser.add_argument(
+        "--chunk-profile",
+        help="Named chunk profile (default, sentences, words-200, words-50)",
+    )
 
     tracks_parser = subparsers.add_parser(
         "tracks", help="List available caption tracks"
@@ -39,26 +65,138 @@ def build_parser() -> argparse.ArgumentParser:
     metadata_parser = subparsers.add_parser("metadata", help="Fetch video metadata")
     metadata_parser.add_argument("--url", required=True, help="YouTube video URL or ID")
 
+    cache_parser = subparsers.add_parser("cache", help="Inspect or maintain the cache")
+    cache_parser.add_argument(
+        "action",
+        choices=["stats", "prune", "vacuum"],
+        help="stats: summarise; prune: drop expired and over-budget entries; "
+        "vacuum: reclaim disk space",
+    )
+
+    search_parser = subparsers.add_parser(
+        "search", help="Full-text search across cached transcripts"
+    )
+    search_parser.add_argument("query", help="Words to search for")
+    search_parser.add_argument(
+        "--limit", type=int, default=10, help="Maximum number of hits"
+    )
+    search_parser.add_argument(
+        "--video", help="Restrict results to one video URL or ID"
+    )
+    search_parser.add_argument("--lang", help="Restrict results to a caption language")
+
+    warm_parser = subparsers.add_parser(
+        "warm", help="Prefetch transcripts for the channel's own videos"
+    )
+    warm_parser.add_argument(
+        "--ids-file", type=Path, help="Video IDs file (defaults to settings)"
+    )
+    warm_parser.add_argument(
+        "--scripts-root",
+        type=Path,
+        help="Directory of <slug>/metadata.json files (defaults to settings)",
+    )
+    warm_parser.add_argument(
+        "--concurrency", type=int, help="Parallel fetches (defaults to settings)"
+    )
+    warm_parser.add_argument(
+        "--refresh-before-days",
+        type=float,
+        help="Re-fetch entries expiring within this many days",
+    )
+
     return parser
 
 
+def create_service(settings: Settings) -> YouTubeTranscriptService:
+    from .youtube_client import YouTubeTranscriptService
+
+    return YouTubeTranscriptService(settings=settings)
+
+
+def run_cache_command(action: str, settings: Settings) -> BaseModel:
+    from .cache import TranscriptCache
+    from .models import CachePruneResponse, CacheStats
+
+    cache = TranscriptCache.from_settings(settings)
+    try:
+        if action == "prune":
+            return CachePruneResponse(**cache.prune())
+        if action == "vacuum":
+            cache.vacuum()
+        return CacheStats(**cache.stats())
+    finally:
+        cache.close()
+
+
+def run_search_command(args: argparse.Namespace, settings: Settings) -> BaseModel:
+    from .cache import TranscriptCache
+    from .search import search_transcripts
+
+    cache = TranscriptCache.from_settings(settings)
+    try:
+        return search_transcripts(
+            cache, args.query, limit=args.limit, video_id=args.video, lang=args.lang
+        )
+    finally:
+        cache.close()
+
+
 def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
     settings = Settings.from_env()
-    service = YouTubeTranscriptService(settings=settings)
+    if args.command == "cache":
+        print(
+            ensure_utf8(
+                run_cache_command(args.action, settings).model_dump_json(indent=2)
+            )
+        )
+        return 0
 
     result: BaseModel
+    if args.command == "search":
+        try:
+            result = run_search_command(args, settings)
+        except BaseYtMcpError as exc:
+            print(ensure_utf8(json.dumps(exc.to_dict(), indent=2)), file=sys.stderr)
+            return 1
+        print(ensure_utf8(result.model_dump_json(indent=2)))
+        return 0
+
+    service = create_service(settings)
     try:
         if args.command == "transcript":
+            window = {
+                key: getattr(args, key)
+                for key in ("start", "end", "offset", "limit", "chunk_profile")
+                if getattr(args, key) is not None
+            }
             result = service.get_transcript(
-                args.url, lang=args.lang, prefer_auto=args.prefer_auto
+                args.url, lang=args.lang, prefer_auto=args.prefer_auto, **window
             )
         elif args.command == "tracks":
             result = service.search_captions(args.url)
         elif args.command == "metadata":
             result = service.get_metadata(args.url)
+        elif args.command == "warm":
+            from .warm import discover_video_ids, warm_cache
+
+            refresh_days = (
+                args.refresh_before_days
+                if args.refresh_before_days is not None
+                else settings.warm_refresh_before_days
+            )
+            result = warm_cache(
+                service,
+                discover_video_ids(
+                    args.ids_file or settings.warm_ids_file,
+                    args.scripts_root or settings.warm_scripts_root,
+                ),
+                concurrency=args.concurrency or settings.warm_concurrency,
+                refresh_before_seconds=refresh_days * 24 * 60 * 60,
+            )
         else:  # pragma: no cover - argparse ensures known commands
             parser.error(f"Unknown command: {args.command}")
             return 2
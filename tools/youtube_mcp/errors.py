@@ -47,3 +47,13 @@ class NetworkError(BaseYtMcpError):
 class RateLimited(BaseYtMcpError):  # noqa: N818
     def __init__(self, message: str = "Rate limited by upstream service"):
         super().__init__("RateLimited", message, HTTPStatus.TOO_MANY_REQUESTS)
+
+
+class CircuitOpen(RateLimited):
+    """Raised without calling YouTube while the upstream circuit is open."""
+
+    def __init__(self, retry_after: float = 0.0):
+        super().__init__(
+            f"Upstream is throttling requests; retry in {retry_after:.0f}s"
+        )
+        self.retry_after = retry_after
@@ -2,18 +2,40 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import contextlib
+import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator, Callable
 from typing import Any, TypeVar, cast
 
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
-from .errors import BaseYtMcpError
-from .models import HealthResponse, MetadataResponse, TracksResponse, TranscriptResponse
+from .errors import BaseYtMcpError, InvalidArgument
+from .metrics import REGISTRY, REQUEST_SECONDS, update_cache_gauges
+from .models import (
+    HealthResponse,
+    MetadataResponse,
+    SearchResponse,
+    TracksResponse,
+    TranscriptResponse,
+)
 from .settings import Settings
+from .streaming import (
+    STREAM_MEDIA_TYPES,
+    encode_events,
+    iter_transcript_events,
+    parse_fields,
+)
+from .warm import discover_video_ids, warm_cache
 from .youtube_client import YouTubeTranscriptService
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
 anyio_module: Any | None
 try:  # pragma: no cover - optional dependency for ASGI lifespan
     import anyio as _anyio_module
@@ -25,6 +47,27 @@ else:
 anyio: Any | None = anyio_module
 
 
+def transcript_options(
+    start: float | None = Query(None, ge=0, description="Window start in seconds"),
+    end: float | None = Query(None, ge=0, description="Window end in seconds"),
+    offset: int | None = Query(None, ge=0, description="Segments to skip"),
+    limit: int | None = Query(None, ge=1, description="Maximum segments to return"),
+    chunk_profile: str | None = Query(
+        None, description="Named chunk profile, e.g. sentences or words-200"
+    ),
+) -> dict[str, Any]:
+    """Collect optional window and chunking options, forwarding only those supplied."""
+
+    options = {
+        "start": start,
+        "end": end,
+        "offset": offset,
+        "limit": limit,
+        "chunk_profile": chunk_profile,
+    }
+    return {key: value for key, value in options.items() if value is not None}
+
+
 def create_service(settings: Settings) -> YouTubeTranscriptService:
     return YouTubeTranscriptService(settings=settings)
 
@@ -36,8 +79,6 @@ def create_app(
     settings = settings or Settings.from_env()
     service = service or create_service(settings)
 
-    app = FastAPI(title="YouTube Transcript MCP", version="0.1.0")
-
     def _handle_error(exc: BaseYtMcpError) -> HTTPException:
         return HTTPException(status_code=exc.http_status.value, detail=exc.to_dict())
 
@@ -50,6 +91,90 @@ def create_app(
 
         return cast(T, await anyio.to_thread.run_sync(call))
 
+    async def _sweep_cache(cache: Any, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                result = await _run_sync(cache.prune)
+            except sqlite3.Error:  # pragma: no cover - disk failures are logged only
+                logger.exception("Transcript cache sweep failed")
+            else:
+                logger.info("Transcript cache sweep: %s", result)
+
+    async def _warm_cache() -> None:
+        refresh_before = settings.warm_refresh_before_days * 24 * 60 * 60
+        while True:
+            try:
+                video_ids = await _run_sync(
+                    discover_video_ids,
+                    settings.warm_ids_file,
+                    settings.warm_scripts_root,
+                )
+                report = await _run_sync(
+                    warm_cache,
+                    service,
+                    video_ids,
+                    concurrency=settings.warm_concurrency,
+                    refresh_before_seconds=refresh_before,
+                )
+            except Exception:  # pragma: no cover - keep serving if warming breaks
+                logger.exception("Transcript cache warm failed")
+            else:
+                logger.info(
+                    "Transcript cache warm: %s", report.model_dump(exclude={"errors"})
+                )
+            if settings.warm_interval_seconds <= 0:
+                return
+            await asyncio.sleep(settings.warm_interval_seconds)
+
+    @contextlib.asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        cache = getattr(service, "cache", None)
+        interval = settings.cache_sweep_interval_seconds
+        tasks: list[asyncio.Task[None]] = []
+        if cache is not None and interval > 0:
+            tasks.append(asyncio.create_task(_sweep_cache(cache, interval)))
+        if settings.warm_on_startup:
+            tasks.append(asyncio.create_task(_warm_cache()))
+        try:
+            yield
+        finally:
+            for task in tasks:
+                task.cancel()
+            for task in tasks:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    app = FastAPI(title="YouTube Transcript MCP", version="0.1.0", lifespan=lifespan)
+
+    @app.middleware("http")
+    async def record_latency(
+        request: Request, call_next: Callable[[Request], Any]
+    ) -> Response:
+        started = time.perf_counter()
+        status = 500
+        try:
+            response = cast(Response, await call_next(request))
+            status = response.status_code
+            return response
+        finally:
+            route = request.scope.get("route")
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started,
+                "http",
+                getattr(route, "path", "unmatched"),
+                status,
+            )
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    async def metrics() -> PlainTextResponse:
+        cache = getattr(service, "cache", None)
+        if cache is not None:
+            update_cache_gauges(await _run_sync(cache.stats))
+        return PlainTextResponse(
+            REGISTRY.render(), media_type="text/plain; version=0.0.4"
+        )
+
     @app.get("/health", response_model=HealthResponse)
     async def health() -> HealthResponse:
         return HealthResponse(ok=True, version="0.1.0")
@@ -61,6 +186,7 @@ def create_app(
         prefer_auto: bool | None = Query(
             None, description="If true, prefer auto-generated captions"
         ),
+        options: dict[str, Any] = Depends(transcript_options),
     ) -> TranscriptResponse:
         try:
             result = await _run_sync(
@@ -68,6 +194,60 @@ def create_app(
                 url,
                 lang=lang,
                 prefer_auto=prefer_auto,
+                **options,
+            )
+        except BaseYtMcpError as exc:
+            raise _handle_error(exc) from exc
+        return result
+
+    @app.get("/transcript/stream")
+    async def transcript_stream(
+        url: str = Query(..., description="YouTube video URL or identifier"),
+        lang: str | None = Query(None, description="Preferred caption language"),
+        prefer_auto: bool | None = Query(
+            None, description="If true, prefer auto-generated captions"
+        ),
+        format: str = Query(  # noqa: A002 - public query parameter name
+            "ndjson", description="Stream encoding: ndjson or sse"
+        ),
+        fields: str | None = Query(
+            None,
+            description="Comma-separated subset of video,captions,segments,chunks,hash,window",
+        ),
+        options: dict[str, Any] = Depends(transcript_options),
+    ) -> StreamingResponse:
+        try:
+            selected = parse_fields(fields)
+            media_type = STREAM_MEDIA_TYPES.get(format)
+            if media_type is None:
+                raise InvalidArgument(
+                    f"Unsupported stream format: {format}; expected ndjson or sse"
+                )
+            payload = await _run_sync(
+                service.get_transcript_payload,
+                url,
+                lang=lang,
+                prefer_auto=prefer_auto,
+                lazy=True,
+                **options,
+            )
+        except BaseYtMcpError as exc:
+            raise _handle_error(exc) from exc
+        return StreamingResponse(
+            encode_events(iter_transcript_events(payload, selected), format),
+            media_type=media_type,
+        )
+
+    @app.get("/search", response_model=SearchResponse)
+    async def search(
+        q: str = Query(..., min_length=1, description="Words to search for"),
+        limit: int = Query(10, ge=1, le=100, description="Maximum hits"),
+        video: str | None = Query(None, description="Restrict to one video"),
+        lang: str | None = Query(None, description="Restrict to a caption language"),
+    ) -> SearchResponse:
+        try:
+            result = await _run_sync(
+                service.search_transcripts, q, limit=limit, video_id=video, lang=lang
             )
         except BaseYtMcpError as exc:
             raise _handle_error(exc) from exc
@@ -96,4 +276,23 @@ def create_app(
     return app
 
 
-app = create_app()
+_app: FastAPI | None = None
+
+
+def get_app() -> FastAPI:
+    """The process-wide app used by ``uvicorn ...http_server:app``, built on demand.
+
+    Importing this module no longer constructs a service and opens the cache;
+    that happens the first time ``app`` is looked up.
+    """
+
+    global _app
+    if _app is None:
+        _app = create_app()
+    return _app
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        return get_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
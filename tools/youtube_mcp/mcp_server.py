@@ -4,11 +4,21 @@ from __future__ import annotations
 
 import json
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 from .errors import BaseYtMcpError, InvalidArgument
-from .models import HealthResponse, MetadataRequest, TracksRequest, TranscriptRequest
+from .metrics import REQUEST_SECONDS
+from .models import (
+    HealthResponse,
+    MetadataRequest,
+    SearchRequest,
+    TracksRequest,
+    TranscriptRequest,
+)
 from .settings import Settings
 from .utils import ensure_utf8
 from .youtube_client import YouTubeTranscriptService
@@ -19,15 +29,31 @@ _SCHEMAS = {
     / "transcript.schema.json",
     "youtube.search_captions": Path(__file__).parent / "schemas" / "tracks.schema.json",
     "youtube.get_metadata": Path(__file__).parent / "schemas" / "metadata.schema.json",
+    "youtube.search_transcripts": Path(__file__).parent
+    / "schemas"
+    / "search.schema.json",
     "youtube.healthcheck": Path(__file__).parent / "schemas" / "health.schema.json",
+    "youtube.stats": Path(__file__).parent / "schemas" / "stats.schema.json",
 }
 
 
+def _error_response(request: object, code: int, message: str) -> dict[str, Any]:
+    request_id = request.get("id") if isinstance(request, dict) else None
+    return {
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "error": {"code": code, "message": message},
+    }
+
+
 class MCPServer:
     """Simple stdio JSON-RPC dispatcher for the MCP protocol."""
 
-    def __init__(self, service: YouTubeTranscriptService) -> None:
+    def __init__(
+        self, service: YouTubeTranscriptService, *, max_in_flight: int = 8
+    ) -> None:
         self.service = service
+        self.max_in_flight = max(1, max_in_flight)
         self.tools = self._load_tool_definitions()
 
     def _load_tool_definitions(self) -> dict[str, dict[str, Any]]:
@@ -63,9 +89,14 @@ class MCPServer:
             params = request.get("params", {})
             name = params.get("name")
             arguments = params.get("arguments", {})
+            started = time.perf_counter()
+            endpoint = name if name in self.tools else "unknown"
             try:
                 result = self._call_tool(name, arguments)
             except BaseYtMcpError as exc:
+                REQUEST_SECONDS.observe(
+                    time.perf_counter() - started, "mcp", endpoint, exc.code
+                )
                 return {
                     "jsonrpc": "2.0",
                     "id": request_id,
@@ -75,6 +106,9 @@ class MCPServer:
                         "data": exc.to_dict(),
                     },
                 }
+            REQUEST_SECONDS.observe(
+                time.perf_counter() - started, "mcp", endpoint, "ok"
+            )
             return {"jsonrpc": "2.0", "id": request_id, "result": result}
 
         return {
@@ -89,10 +123,15 @@ class MCPServer:
     def _call_tool(self, name: str, arguments: dict[str, Any]) -> dict[str, Any]:
         if name == "youtube.get_transcript":
             transcript_request = TranscriptRequest(**arguments)
+            options = transcript_request.model_dump(
+                include={"start", "end", "offset", "limit", "chunk_profile"},
+                exclude_none=True,
+            )
             response = self.service.get_transcript(
                 transcript_request.url,
                 lang=transcript_request.lang,
                 prefer_auto=transcript_request.prefer_auto,
+                **options,
             )
             payload: dict[str, Any] = response.model_dump()
             return payload
@@ -108,6 +147,18 @@ class MCPServer:
                 metadata_request.url
             ).model_dump()
             return metadata_payload
+        if name == "youtube.search_transcripts":
+            search_request = SearchRequest(**arguments)
+            search_payload: dict[str, Any] = self.service.search_transcripts(
+                search_request.query,
+                limit=search_request.limit,
+                video_id=search_request.video_id,
+                lang=search_request.lang,
+            ).model_dump()
+            return search_payload
+        if name == "youtube.stats":
+            stats_payload: dict[str, Any] = self.service.stats().model_dump()
+            return stats_payload
         if name == "youtube.healthcheck":
             health_payload: dict[str, Any] = HealthResponse(
                 ok=True, version="0.1.0"
@@ -115,32 +166,86 @@ class MCPServer:
             return health_payload
         raise InvalidArgument(f"Unknown tool: {name}")
 
-    def serve_forever(self) -> None:
-        for line in sys.stdin:
-            line = line.strip()
-            if not line:
-                continue
+    def _safe_handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        try:
+            return self.handle_request(request)
+        except Exception as exc:
+            return _error_response(request, -32603, f"Internal error: {exc}")
+
+    def serve_forever(
+        self, stdin: TextIO | None = None, stdout: TextIO | None = None
+    ) -> None:
+        """Read JSON-RPC lines and answer them concurrently.
+
+        Up to ``max_in_flight`` requests run on a worker pool; responses are
+        written as soon as each finishes and carry the request's ``id``. Reading
+        pauses while the pool is saturated, and end of input waits for in-flight
+        requests before returning.
+        """
+
+        stdin = stdin or sys.stdin
+        stdout = stdout or sys.stdout
+        write_lock = threading.Lock()
+        slots = threading.BoundedSemaphore(self.max_in_flight)
+
+        def write(response: dict[str, Any]) -> None:
+            line = ensure_utf8(json.dumps(response)) + "\n"
+            with write_lock:
+                stdout.write(line)
+                stdout.flush()
+
+        def finish(future: Future[dict[str, Any]]) -> None:
+            slots.release()
+            if future.cancelled():
+                return
             try:
-                payload = json.loads(line)
-            except json.JSONDecodeError as exc:  # pragma: no cover - defensive
-                response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": f"Invalid JSON: {exc}",
-                    },
-                }
-            else:
-                response = self.handle_request(payload)
-            sys.stdout.write(ensure_utf8(json.dumps(response)) + "\n")
-            sys.stdout.flush()
+                response = future.result()
+            except Exception as exc:  # pragma: no cover - _safe_handle catches
+                response = _error_response(None, -32603, f"Internal error: {exc}")
+            write(response)
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="mcp-request"
+        )
+        try:
+            for line in stdin:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    payload = json.loads(line)
+                except json.JSONDecodeError as exc:  # pragma: no cover - defensive
+                    write(
+                        {
+                            "jsonrpc": "2.0",
+                            "id": None,
+                            "error": {
+                                "code": -32700,
+                                "message": f"Invalid JSON: {exc}",
+                            },
+                        }
+                    )
+                    continue
+                if not isinstance(payload, dict):
+                    # Batches and bare scalars are not supported.
+                    write(
+                        _error_response(
+                            None, -32600, "Invalid Request: expected a JSON object"
+                        )
+                    )
+                    continue
+                slots.acquire()
+                executor.submit(self._safe_handle, payload).add_done_callback(finish)
+        except KeyboardInterrupt:  # pragma: no cover - interactive shutdown
+            executor.shutdown(wait=True, cancel_futures=True)
+            return
+        executor.shutdown(wait=True)
 
 
 def main() -> None:  # pragma: no cover - exercised manually
     settings = Settings.from_env()
     service = YouTubeTranscriptService(settings=settings)
-    server = MCPServer(service)
+    server = MCPServer(service, max_in_flight=settings.mcp_max_in_flight)
     server.serve_forever()
 
 
@@ -0,0 +1,323 @@
+"""In-process Prometheus-style metrics for the transcript service.
+
+Instruments are declared once at module level on :data:`REGISTRY`, following
+the ``prometheus_client`` idiom without adding it as a dependency.
+:meth:`MetricsRegistry.render` produces the text exposition format served at
+``/metrics``; :meth:`MetricsRegistry.snapshot` backs the ``youtube.stats`` MCP
+tool.
+"""
+
+from __future__ import annotations
+
+import math
+import threading
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Sequence[Any]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(
+                f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}"
+            )
+        return tuple(str(value) for value in labels)
+
+    def _labels(self, key: LabelValues) -> dict[str, str]:
+        return dict(zip(self.labelnames, key, strict=True))
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        raise NotImplementedError
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, optionally split by labels."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, *labels: Any, amount: float = 1.0) -> None:
+        if amount < 0:
+            raise ValueError("Counters can only increase")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, *labels: Any) -> float:
+        with self._lock:
+            return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield self.name, self._labels(key), value
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [
+            {"labels": labels, "value": value} for _, labels, value in self.samples()
+        ]
+
+
+class Gauge(Counter):
+    """Value that can go up and down, e.g. the current cache size."""
+
+    kind = "gauge"
+
+    def set(self, value: float, *labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+
+class Histogram(_Metric):
+    """Cumulative bucketed observations, e.g. request latency in seconds."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket..., +Inf count], sum
+        self._values: dict[LabelValues, tuple[list[int], float]] = {}
+
+    def observe(self, value: float, *labels: Any) -> None:
+        key = self._key(labels)
+        with self._lock:
+            counts, total = self._values.get(key) or ([0] * (len(self.buckets) + 1), 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+            counts[-1] += 1
+            self._values[key] = (counts, total + value)
+
+    def count(self, *labels: Any) -> int:
+        with self._lock:
+            entry = self._values.get(self._key(labels))
+        return entry[0][-1] if entry else 0
+
+    def _entries(self) -> list[tuple[LabelValues, list[int], float]]:
+        with self._lock:
+            return [
+                (key, list(counts), total)
+                for key, (counts, total) in sorted(self._values.items())
+            ]
+
+    def samples(self) -> Iterator[tuple[str, dict[str, str], float]]:
+        for key, counts, total in self._entries():
+            labels = self._labels(key)
+            for bound, count in zip((*self.buckets, math.inf), counts, strict=True):
+                yield f"{self.name}_bucket", {**labels, "le": _format(bound)}, count
+            yield f"{self.name}_sum", labels, total
+            yield f"{self.name}_count", labels, counts[-1]
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "labels": self._labels(key),
+                "count": counts[-1],
+                "sum": total,
+                "buckets": {
+                    _format(bound): count
+                    for bound, count in zip(self.buckets, counts, strict=False)
+                },
+            }
+            for key, counts, total in self._entries()
+        ]
+
+
+class MetricsRegistry:
+    """Named collection of instruments rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, help_text: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        metric: Counter = self._register(Counter(name, help_text, labelnames))
+        return metric
+
+    def gauge(self, name: str, help_text: str, labelnames: Sequence[str] = ()) -> Gauge:
+        metric: Gauge = self._register(Gauge(name, help_text, labelnames))
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        metric: Histogram = self._register(
+            Histogram(name, help_text, labelnames, buckets)
+        )
+        return metric
+
+    def render(self) -> str:
+        """Prometheus text exposition format (version 0.0.4)."""
+
+        lines: list[str] = []
+        with self._lock:
+            metrics = list(self._metrics.values())
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {_escape(metric.help)}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for name, labels, value in metric.samples():
+                if labels:
+                    rendered = ",".join(
+                        f'{label}="{_escape(raw)}"' for label, raw in labels.items()
+                    )
+                    name = f"{name}{{{rendered}}}"
+                lines.append(f"{name} {_format(value)}")
+        return "\n".join(lines) + "\n"
+
+    def snapshot(self) -> dict[str, Any]:
+        """JSON-friendly view of every instrument and its samples."""
+
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                "type": metric.kind,
+                "help": metric.help,
+                "samples": metric.snapshot(),
+            }
+            for metric in metrics
+        }
+
+
+def _format(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_SECONDS = REGISTRY.histogram(
+    "ytmcp_request_duration_seconds",
+    "Time spent serving HTTP and MCP requests.",
+    ("transport", "endpoint", "status"),
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "ytmcp_cache_lookups_total",
+    "Transcript cache reads by result (hit, miss, expired).",
+    ("result",),
+)
+CACHE_EVICTIONS = REGISTRY.counter(
+    "ytmcp_cache_evictions_total",
+    "Cache entries removed by reason (lru, expired).",
+    ("reason",),
+)
+CACHE_ENTRIES = REGISTRY.gauge(
+    "ytmcp_cache_entries", "Entries currently stored in the transcript cache."
+)
+CACHE_BYTES = REGISTRY.gauge(
+    "ytmcp_cache_bytes", "Compressed payload bytes stored in the transcript cache."
+)
+UPSTREAM_CALLS = REGISTRY.counter(
+    "ytmcp_upstream_calls_total",
+    "Calls to YouTube by operation and outcome (ok or error code).",
+    ("operation", "outcome"),
+)
+UPSTREAM_SECONDS = REGISTRY.histogram(
+    "ytmcp_upstream_duration_seconds",
+    "Latency of individual YouTube calls.",
+    ("operation",),
+)
+UPSTREAM_RETRIES = REGISTRY.counter(
+    "ytmcp_upstream_retries_total",
+    "Retry attempts scheduled after a failed YouTube call.",
+    ("operation",),
+)
+RATE_LIMIT_EVENTS = REGISTRY.counter(
+    "ytmcp_rate_limit_events_total",
+    "Upstream responses that reported rate limiting.",
+    ("operation",),
+)
+UPSTREAM_RATE = REGISTRY.gauge(
+    "ytmcp_upstream_rate_per_second",
+    "Current adaptive rate limit for YouTube calls.",
+)
+CIRCUIT_STATE = REGISTRY.gauge(
+    "ytmcp_circuit_state",
+    "Upstream circuit breaker state: 0 closed, 1 half-open, 2 open.",
+)
+CIRCUIT_REJECTIONS = REGISTRY.counter(
+    "ytmcp_circuit_rejections_total",
+    "Upstream calls refused because the circuit was open.",
+    ("operation",),
+)
+STALE_SERVED = REGISTRY.counter(
+    "ytmcp_stale_served_total",
+    "Expired cache entries served, by reason (revalidate, fallback).",
+    ("reason",),
+)
+REVALIDATIONS = REGISTRY.counter(
+    "ytmcp_revalidations_total",
+    "Background refreshes of stale transcripts by outcome (ok or error code).",
+    ("outcome",),
+)
+
+
+def record_upstream_call(operation: str, outcome: str, seconds: float) -> None:
+    """Count one upstream attempt and its latency; flag rate-limit outcomes."""
+
+    UPSTREAM_CALLS.inc(operation, outcome)
+    UPSTREAM_SECONDS.observe(seconds, operation)
+    if outcome == "RateLimited":
+        RATE_LIMIT_EVENTS.inc(operation)
+
+
+def update_cache_gauges(stats: dict[str, Any]) -> None:
+    """Copy :meth:`TranscriptCache.stats` totals into the cache gauges."""
+
+    CACHE_ENTRIES.set(stats["entries"])
+    CACHE_BYTES.set(stats["total_bytes"])
+
+
+def cache_hit_ratio() -> float | None:
+    """Share of cache lookups served from the cache, or ``None`` before any."""
+
+    hits = CACHE_LOOKUPS.value("hit")
+    total = hits + CACHE_LOOKUPS.value("miss") + CACHE_LOOKUPS.value("expired")
+    return hits / total if total else None
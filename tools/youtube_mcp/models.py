@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from pydantic import BaseModel, ConfigDict, Field
 
 
@@ -59,6 +61,21 @@ class Chunk(StrictModel):
     cite_url: str = Field(description="URL anchored to the chunk start time.")
 
 
+class TranscriptWindow(StrictModel):
+    """Describes the slice returned for a windowed transcript request."""
+
+    start: float | None = None
+    end: float | None = None
+    offset: int = 0
+    limit: int | None = None
+    matched_segments: int = Field(
+        description="Segments inside the time range before offset/limit paging."
+    )
+    next_offset: int | None = Field(
+        default=None, description="Offset of the next page, or null on the last one."
+    )
+
+
 class TranscriptResponse(StrictModel):
     """Full transcript payload returned by the service."""
 
@@ -67,6 +84,15 @@ class TranscriptResponse(StrictModel):
     segments: list[Segment]
     chunks: list[Chunk]
     hash: str = Field(description="Stable sha256 hash of metadata and transcript text.")
+    window: TranscriptWindow | None = Field(
+        default=None,
+        description="Present when only part of the transcript was requested.",
+    )
+    stale: bool = Field(
+        default=False,
+        description="True when served from an expired cache entry while it is "
+        "being refreshed or while YouTube is unavailable.",
+    )
 
 
 class TranscriptRequest(StrictModel):
@@ -78,6 +104,35 @@ class TranscriptRequest(StrictModel):
         default=None,
         description="If true, prefer auto-generated captions when available.",
     )
+    start: float | None = Field(
+        default=None, ge=0, description="Window start in seconds (inclusive)."
+    )
+    end: float | None = Field(
+        default=None, ge=0, description="Window end in seconds (exclusive)."
+    )
+    offset: int | None = Field(
+        default=None, ge=0, description="Segments to skip within the window."
+    )
+    limit: int | None = Field(
+        default=None, ge=1, description="Maximum number of segments to return."
+    )
+    chunk_profile: str | None = Field(
+        default=None,
+        description="Named chunk profile: default, sentences, words-200 or words-50.",
+    )
+
+
+class SearchRequest(StrictModel):
+    """Input model for full-text search across cached transcripts."""
+
+    query: str = Field(min_length=1, description="Words to find in transcript text.")
+    limit: int = Field(default=10, ge=1, le=100, description="Maximum hits.")
+    video_id: str | None = Field(
+        default=None, description="Restrict results to one video (ID or URL)."
+    )
+    lang: str | None = Field(
+        default=None, description="Restrict to a caption language."
+    )
 
 
 class TracksRequest(StrictModel):
@@ -109,8 +164,79 @@ class MetadataResponse(StrictModel):
     duration: int | None = None
 
 
+class SearchHit(StrictModel):
+    """Transcript chunk matching a search query."""
+
+    video_id: str
+    title: str | None = None
+    lang: str | None = None
+    chunk_id: str
+    text: str
+    snippet: str = Field(description="Matching excerpt with hits wrapped in [ ].")
+    start: float
+    end: float
+    cite_url: str = Field(description="URL anchored to the chunk start time.")
+    score: float = Field(description="BM25 relevance; higher is better.")
+
+
+class SearchResponse(StrictModel):
+    """Ranked search results across cached transcripts."""
+
+    query: str
+    hits: list[SearchHit]
+
+
 class HealthResponse(StrictModel):
     """Healthcheck payload."""
 
     ok: bool
     version: str
+
+
+class CacheStats(StrictModel):
+    """Summary of the transcript cache contents and footprint."""
+
+    entries: int
+    expired: int
+    total_bytes: int = Field(description="Sum of stored (compressed) payload sizes.")
+    file_bytes: int = Field(description="Size of the SQLite database and WAL on disk.")
+    max_bytes: int | None = None
+    max_entries: int | None = None
+
+
+class CachePruneResponse(StrictModel):
+    """Result of a cache prune run."""
+
+    expired: int
+    evicted: int
+
+
+class StatsResponse(StrictModel):
+    """Service counters and latency histograms for the ``youtube.stats`` tool."""
+
+    cache: CacheStats
+    cache_hit_ratio: float | None = Field(
+        default=None, description="Hits over all cache lookups since start-up."
+    )
+    metrics: dict[str, Any] = Field(
+        description="Every instrument keyed by metric name, with labelled samples."
+    )
+
+
+class WarmError(StrictModel):
+    """Failure recorded for a single video during cache warming."""
+
+    video_id: str
+    code: str
+    message: str
+
+
+class WarmReport(StrictModel):
+    """Outcome of a cache warming run."""
+
+    requested: int
+    fresh: int = Field(description="Entries already cached beyond the refresh window.")
+    fetched: int = Field(description="Transcripts fetched because none were cached.")
+    refreshed: int = Field(description="Cached entries re-fetched before expiry.")
+    failed: int
+    errors: list[WarmError] = Field(default_factory=list)
@@ -0,0 +1,294 @@
+"""Full-text search over cached transcript chunks.
+
+Chunks of every cached transcript are indexed by an SQLite FTS5 table that
+lives next to ``cache_entries`` in the same database. The index keeps no copy
+of the chunk text: ``search_chunks`` records where each chunk sits inside its
+compressed cache row and the ``search_chunk_text`` view decodes it on demand
+through the ``search_chunk_text()`` SQL function, which every connection must
+register (see :func:`register_search_functions`). :class:`TranscriptCache`
+keeps the index in step with its writes; a trigger drops indexed chunks
+whenever the owning cache entry is deleted, expired or evicted.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from .errors import InvalidArgument
+from .models import SearchHit, SearchResponse
+from .utils import InvalidVideoId, parse_video_id
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .cache import TranscriptCache
+
+_SEARCH_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS search_chunks (
+        id INTEGER PRIMARY KEY,
+        cache_key TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        video_id TEXT NOT NULL,
+        title TEXT,
+        lang TEXT,
+        chunk_id TEXT NOT NULL,
+        start_time REAL NOT NULL,
+        end_time REAL NOT NULL,
+        cite_url TEXT NOT NULL
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_search_chunks_cache_key "
+    "ON search_chunks (cache_key)",
+    "CREATE INDEX IF NOT EXISTS idx_search_chunks_video_id "
+    "ON search_chunks (video_id)",
+    """
+    CREATE VIEW IF NOT EXISTS search_chunk_text AS
+    SELECT c.id AS id, search_chunk_text(e.value, c.position) AS text
+    FROM search_chunks AS c
+    JOIN cache_entries AS e ON e.cache_key = c.cache_key
+    """,
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS search_fts USING fts5(
+        text, content='search_chunk_text', content_rowid='id',
+        tokenize='porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS cache_entries_search_ad AFTER DELETE ON cache_entries
+    BEGIN
+        INSERT INTO search_fts (search_fts, rowid, text)
+        SELECT 'delete', id, search_chunk_text(old.value, position)
+        FROM search_chunks WHERE cache_key = old.cache_key;
+        DELETE FROM search_chunks WHERE cache_key = old.cache_key;
+    END
+    """,
+)
+
+# Objects of the first index layout, which stored a plaintext copy of every chunk.
+_LEGACY_SEARCH_OBJECTS = (
+    "DROP TRIGGER IF EXISTS search_chunks_ai",
+    "DROP TRIGGER IF EXISTS search_chunks_ad",
+    "DROP TRIGGER IF EXISTS cache_entries_search_ad",
+    "DROP TABLE IF EXISTS search_fts",
+    "DROP TABLE IF EXISTS search_chunks",
+)
+
+_TERM = re.compile(r"(\w+)(\*?)")
+
+
+def register_search_functions(
+    conn: sqlite3.Connection, chunk_text: Callable[[Any, int], str | None]
+) -> None:
+    """Install ``search_chunk_text(value, position)`` on ``conn``.
+
+    ``chunk_text`` maps a raw ``cache_entries.value`` and a chunk position to
+    that chunk's text; it must return exactly the text that was indexed.
+    """
+
+    conn.create_function("search_chunk_text", 2, chunk_text, deterministic=True)
+
+
+def create_search_index(conn: sqlite3.Connection) -> bool:
+    """Create the search tables if needed; return ``True`` when newly created.
+
+    An index in the old layout is dropped and reported as new so the caller
+    rebuilds it.
+    """
+
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'search_fts'"
+    ).fetchone()
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(search_chunks)")}
+    if "text" in columns:
+        for statement in _LEGACY_SEARCH_OBJECTS:
+            conn.execute(statement)
+        exists = None
+    for statement in _SEARCH_SCHEMA:
+        conn.execute(statement)
+    return exists is None
+
+
+def chunk_texts(value: Any) -> list[str | None]:
+    """Text of every chunk of a transcript payload, by position."""
+
+    chunks = value.get("chunks") if isinstance(value, dict) else None
+    if not isinstance(chunks, list):
+        return []
+    return [chunk.get("text") if isinstance(chunk, dict) else None for chunk in chunks]
+
+
+def chunk_rows(key: str, value: Any) -> list[tuple[Any, ...]]:
+    """Rows to index for a cache value; empty unless it is a transcript payload.
+
+    The chunk text comes last; it goes to the full-text index only.
+    """
+
+    if not isinstance(value, dict):
+        return []
+    video = value.get("video")
+    chunks = value.get("chunks")
+    if not isinstance(video, dict) or not isinstance(chunks, list):
+        return []
+    captions = value.get("captions")
+    lang = captions.get("lang") if isinstance(captions, dict) else None
+    return [
+        (
+            key,
+            position,
+            video["id"],
+            video.get("title"),
+            lang,
+            chunk["id"],
+            chunk["start"],
+            chunk["end"],
+            chunk["cite_url"],
+            chunk["text"],
+        )
+        for position, chunk in enumerate(chunks)
+        if isinstance(chunk, dict) and chunk.get("text")
+    ]
+
+
+def index_rows(
+    conn: sqlite3.Connection, key: str, rows: Iterable[tuple[Any, ...]]
+) -> None:
+    """Replace the indexed chunks for ``key``; call inside the writer transaction.
+
+    Must run before the new value replaces the old one in ``cache_entries``:
+    removing entries from the index needs the text they were indexed with.
+    """
+
+    conn.execute(
+        """
+        INSERT INTO search_fts (search_fts, rowid, text)
+        SELECT 'delete', c.id, search_chunk_text(e.value, c.position)
+        FROM search_chunks AS c
+        JOIN cache_entries AS e ON e.cache_key = c.cache_key
+        WHERE c.cache_key = ?
+        """,
+        (key,),
+    )
+    conn.execute("DELETE FROM search_chunks WHERE cache_key = ?", (key,))
+    for *row, text in rows:
+        cursor = conn.execute(
+            """
+            INSERT INTO search_chunks (
+                cache_key, position, video_id, title, lang, chunk_id,
+                start_time, end_time, cite_url
+            )
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            row,
+        )
+        conn.execute(
+            "INSERT INTO search_fts (rowid, text) VALUES (?, ?)",
+            (cursor.lastrowid, text),
+        )
+
+
+def match_expression(query: str) -> str:
+    """Turn free text into an FTS5 query matching every word.
+
+    Terms are quoted so punctuation and FTS operators in user input cannot
+    cause syntax errors; a trailing ``*`` keeps prefix matching available.
+    """
+
+    terms = [f'"{word}"{star}' for word, star in _TERM.findall(query)]
+    if not terms:
+        raise InvalidArgument("Search query must contain at least one word")
+    return " ".join(terms)
+
+
+def query_index(
+    conn: sqlite3.Connection,
+    expression: str,
+    *,
+    schema_version: int,
+    limit: int,
+    video_id: str | None = None,
+    lang: str | None = None,
+) -> list[dict[str, Any]]:
+    """Run a ranked FTS5 query, skipping chunks of expired cache entries.
+
+    Ranking needs only the index; the chunk text and snippets are decoded
+    afterwards for the ``limit`` best hits alone.
+    """
+
+    filters = ""
+    params: list[Any] = [expression, time.time(), schema_version]
+    if video_id is not None:
+        filters += " AND c.video_id = ?"
+        params.append(video_id)
+    if lang is not None:
+        filters += " AND c.lang = ?"
+        params.append(lang)
+    params.append(limit)
+    ranked = conn.execute(
+        f"""
+        SELECT search_fts.rowid, bm25(search_fts) AS rank
+        FROM search_fts
+        JOIN search_chunks AS c ON c.id = search_fts.rowid
+        JOIN cache_entries AS e ON e.cache_key = c.cache_key
+        WHERE search_fts MATCH ?
+          AND e.expires_at > ? AND e.schema_version = ?{filters}
+        ORDER BY rank
+        LIMIT ?
+        """,
+        params,
+    ).fetchall()
+    if not ranked:
+        return []
+    placeholders = ", ".join("?" for _ in ranked)
+    cursor = conn.execute(
+        f"""
+        SELECT search_fts.rowid, c.video_id, c.title, c.lang, c.chunk_id,
+               search_fts.text, snippet(search_fts, 0, '[', ']', '…', 16),
+               c.start_time, c.end_time, c.cite_url
+        FROM search_fts
+        JOIN search_chunks AS c ON c.id = search_fts.rowid
+        WHERE search_fts MATCH ? AND search_fts.rowid IN ({placeholders})
+        """,
+        [expression, *(rowid for rowid, _ in ranked)],
+    )
+    columns = (
+        "video_id",
+        "title",
+        "lang",
+        "chunk_id",
+        "text",
+        "snippet",
+        "start",
+        "end",
+        "cite_url",
+    )
+    details = {row[0]: dict(zip(columns, row[1:], strict=True)) for row in cursor}
+    # bm25() is lower-is-better; flip it so larger scores rank higher.
+    return [
+        {**details[rowid], "score": -rank} for rowid, rank in ranked if rowid in details
+    ]
+
+
+def search_transcripts(
+    cache: TranscriptCache,
+    query: str,
+    *,
+    limit: int = 10,
+    video_id: str | None = None,
+    lang: str | None = None,
+) -> SearchResponse:
+    """Search every cached transcript and return the best-matching chunks."""
+
+    if limit < 1:
+        raise InvalidArgument("limit must be at least 1")
+    if video_id is not None:
+        try:
+            video_id = parse_video_id(video_id)
+        except InvalidVideoId as exc:
+            raise InvalidArgument(str(exc)) from exc
+    hits = cache.search(
+        match_expression(query), limit=limit, video_id=video_id, lang=lang
+    )
+    return SearchResponse(query=query, hits=[SearchHit(**hit) for hit in hits])
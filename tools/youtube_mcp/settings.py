@@ -13,8 +13,60 @@ class Settings(BaseSettings):
 
     cache_dir: Path = Field(default=Path(".ytmcp_cache"))
     cache_ttl_days: int = Field(default=14, ge=1, le=90)
+    cache_max_bytes: int | None = Field(default=None, ge=0)
+    cache_max_entries: int | None = Field(default=None, ge=0)
+    cache_sweep_interval_seconds: float = Field(
+        default=3600.0,
+        ge=0,
+        description="Seconds between background cache sweeps; 0 disables them.",
+    )
+    transcript_index_cache_size: int = Field(
+        default=32,
+        ge=1,
+        description="Transcripts kept indexed in memory for windowed requests.",
+    )
+    cache_max_stale_seconds: float = Field(
+        default=7 * 24 * 60 * 60,
+        ge=0,
+        description="How long expired entries are kept as a fallback while "
+        "YouTube is throttling or unreachable.",
+    )
+    stale_while_revalidate: bool = Field(
+        default=True,
+        description="Serve entries within the stale window immediately and "
+        "refresh them in the background.",
+    )
+    revalidate_concurrency: int = Field(default=2, ge=1, le=16)
+    upstream_rate_per_second: float = Field(default=5.0, gt=0)
+    upstream_min_rate_per_second: float = Field(default=0.2, gt=0)
+    upstream_burst: int = Field(default=10, ge=1)
+    circuit_failure_threshold: int = Field(
+        default=5,
+        ge=1,
+        description="Consecutive rate-limit or network failures that open the circuit.",
+    )
+    circuit_reset_seconds: float = Field(
+        default=60.0, ge=0, description="Seconds the circuit stays open before a probe."
+    )
     allow_auto: bool = Field(default=True)
     reject_private_or_unlisted: bool = Field(default=True)
+    policy_recheck_seconds: float = Field(
+        default=3600.0,
+        ge=0,
+        description="How long a cached transcript is served before its video is "
+        "checked again for being private or unlisted; 0 checks on every request.",
+    )
+    warm_on_startup: bool = Field(default=False)
+    warm_interval_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="Seconds between repeated warm runs in the HTTP server; 0 runs once.",
+    )
+    warm_ids_file: Path = Field(default=Path("video_ids.txt"))
+    warm_scripts_root: Path = Field(default=Path("video_scripts"))
+    warm_concurrency: int = Field(default=4, ge=1, le=32)
+    warm_refresh_before_days: float = Field(default=2.0, ge=0)
+    mcp_max_in_flight: int = Field(default=8, ge=1, le=64)
     http_host: str = Field(default="127.0.0.1")
     http_port: int = Field(default=8765)
 
@@ -0,0 +1,73 @@
+"""Incremental NDJSON / Server-Sent Events encoding of transcript payloads."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from .errors import InvalidArgument
+
+TRANSCRIPT_FIELDS = ("video", "captions", "segments", "chunks", "hash", "window")
+STREAM_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "sse": "text/event-stream"}
+
+_LIST_EVENTS = {"segments": "segment", "chunks": "chunk"}
+
+
+def parse_fields(raw: str | None) -> tuple[str, ...]:
+    """Validate a comma-separated ``fields=`` projection, preserving stream order."""
+
+    if raw is None or not raw.strip():
+        return TRANSCRIPT_FIELDS
+    requested = {item.strip() for item in raw.split(",") if item.strip()}
+    unknown = sorted(requested - set(TRANSCRIPT_FIELDS))
+    if unknown:
+        raise InvalidArgument(
+            f"Unknown transcript fields: {', '.join(unknown)}; "
+            f"expected any of {', '.join(TRANSCRIPT_FIELDS)}"
+        )
+    return tuple(field for field in TRANSCRIPT_FIELDS if field in requested)
+
+
+def iter_transcript_events(
+    payload: dict[str, Any], fields: Iterable[str] = TRANSCRIPT_FIELDS
+) -> Iterator[tuple[str, Any]]:
+    """Yield ``(event, data)`` pairs: video, captions, each segment, each chunk, hash.
+
+    ``segments`` and ``chunks`` may be any iterables, and are consumed only if
+    selected. The closing ``end`` event counts the items actually sent.
+    """
+
+    sent = {"segments": 0, "chunks": 0}
+    for field in fields:
+        if field in _LIST_EVENTS:
+            event = _LIST_EVENTS[field]
+            for item in payload.get(field, ()):
+                sent[field] += 1
+                yield event, item
+        elif field in payload:
+            yield field, payload[field]
+    yield "end", {**sent, "stale": bool(payload.get("stale", False))}
+
+
+def encode_events(
+    events: Iterable[tuple[str, Any]], fmt: str, *, batch_size: int = 200
+) -> Iterator[str]:
+    """Serialise events as NDJSON lines or SSE frames, grouped into write batches."""
+
+    if fmt not in STREAM_MEDIA_TYPES:
+        raise InvalidArgument(
+            f"Unsupported stream format: {fmt}; expected ndjson or sse"
+        )
+    batch: list[str] = []
+    for event, data in events:
+        if fmt == "sse":
+            frame = f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+        else:
+            frame = json.dumps({"type": event, "data": data}, ensure_ascii=False) + "\n"
+        batch.append(frame)
+        if len(batch) >= batch_size:
+            yield "".join(batch)
+            batch = []
+    if batch:
+        yield "".join(batch)
@@ -0,0 +1,201 @@
+"""Shared protection for calls to YouTube.
+
+Every upstream attempt made by :class:`YouTubeTranscriptService` passes through
+one :class:`UpstreamGuard`. The guard paces calls with an adaptive token bucket
+that halves its rate on ``RateLimited`` and creeps back up on success (AIMD).
+A circuit breaker stops calls outright after repeated throttling or network
+failures, so callers fail fast and the service can fall back to stale cache
+entries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, ClassVar
+
+from .errors import CircuitOpen
+from .metrics import CIRCUIT_REJECTIONS, CIRCUIT_STATE, UPSTREAM_RATE
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .settings import Settings
+
+Clock = Callable[[], float]
+
+# Error codes that indicate upstream trouble rather than a bad request.
+TRIP_CODES = frozenset({"RateLimited", "NetworkError"})
+
+
+class AdaptiveRateLimiter:
+    """Token bucket whose refill rate adapts to upstream throttling.
+
+    ``acquire`` reserves a token and sleeps until it is due, so concurrent
+    callers queue behind each other instead of bursting in lockstep.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: int = 10,
+        min_rate: float = 0.1,
+        increase: float | None = None,
+        decrease_factor: float = 0.5,
+        clock: Clock = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.increase = increase if increase is not None else rate / 20
+        self.decrease_factor = decrease_factor
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        UPSTREAM_RATE.set(rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(float(self.burst), self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self) -> float:
+        """Take one token, sleeping until it is available; return the wait."""
+
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+    def on_success(self) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = min(self.max_rate, self.rate + self.increase)
+            UPSTREAM_RATE.set(self.rate)
+
+    def on_rate_limited(self) -> None:
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = max(self.min_rate, self.rate * self.decrease_factor)
+            # Drop saved-up burst so the slower rate takes effect immediately.
+            self._tokens = min(self._tokens, 0.0)
+            UPSTREAM_RATE.set(self.rate)
+
+
+class CircuitBreaker:
+    """Closed → open after ``failure_threshold`` consecutive failures.
+
+    While open every call is rejected until ``reset_seconds`` pass; then a
+    single probe is let through (half-open) and its outcome closes or re-opens
+    the circuit.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    _STATE_VALUES: ClassVar[dict[str, int]] = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        reset_seconds: float = 60.0,
+        clock: Clock = time.monotonic,
+    ) -> None:
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_seconds = reset_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self.state = self.CLOSED
+        CIRCUIT_STATE.set(0)
+
+    def _set_state(self, state: str) -> None:
+        self.state = state
+        CIRCUIT_STATE.set(self._STATE_VALUES[state])
+
+    def retry_after(self) -> float:
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.reset_seconds - self._clock())
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN:
+                if self._clock() - self._opened_at < self.reset_seconds:
+                    return False
+                self._set_state(self.HALF_OPEN)
+                self._probing = False
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._probing = False
+            if self.state != self.CLOSED:
+                self._set_state(self.CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                self._set_state(self.OPEN)
+
+
+class UpstreamGuard:
+    """Rate limiter and circuit breaker shared by every upstream operation."""
+
+    def __init__(self, limiter: AdaptiveRateLimiter, breaker: CircuitBreaker) -> None:
+        self.limiter = limiter
+        self.breaker = breaker
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> UpstreamGuard:
+        return cls(
+            AdaptiveRateLimiter(
+                settings.upstream_rate_per_second,
+                burst=settings.upstream_burst,
+                min_rate=settings.upstream_min_rate_per_second,
+            ),
+            CircuitBreaker(
+                failure_threshold=settings.circuit_failure_threshold,
+                reset_seconds=settings.circuit_reset_seconds,
+            ),
+        )
+
+    def before_call(self, operation: str) -> None:
+        """Fail fast while the circuit is open, otherwise wait for a token."""
+
+        if not self.breaker.allow():
+            CIRCUIT_REJECTIONS.inc(operation)
+            raise CircuitOpen(self.breaker.retry_after())
+        self.limiter.acquire()
+
+    def after_call(self, outcome: str) -> None:
+        """Feed an attempt's outcome (``"ok"`` or an error code) back in."""
+
+        if outcome == "RateLimited":
+            self.limiter.on_rate_limited()
+        elif outcome == "ok":
+            self.limiter.on_success()
+        if outcome in TRIP_CODES:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
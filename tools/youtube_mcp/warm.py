@@ -0,0 +1,139 @@
+"""Cache warming for the channel's own videos.
+
+Agents mostly request transcripts for videos listed in ``video_ids.txt`` and the
+``youtube_id`` fields of ``video_scripts/*/metadata.json``. :func:`warm_cache`
+walks those IDs and fetches anything missing or close to expiry so production
+requests are served from the cache.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Protocol
+
+from .errors import BaseYtMcpError, RateLimited
+from .models import WarmError, WarmReport
+from .utils import InvalidVideoId, build_watch_url, parse_video_id
+
+DEFAULT_IDS_FILE = Path("video_ids.txt")
+DEFAULT_SCRIPTS_ROOT = Path("video_scripts")
+
+
+class WarmableService(Protocol):
+    def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str: ...
+
+
+def discover_video_ids(
+    ids_file: Path | None = DEFAULT_IDS_FILE,
+    scripts_root: Path | None = DEFAULT_SCRIPTS_ROOT,
+) -> list[str]:
+    """Collect unique, valid video IDs from the IDs file and script metadata."""
+
+    candidates: list[str] = []
+    if ids_file is not None and ids_file.exists():
+        for line in ids_file.read_text(encoding="utf-8").splitlines():
+            stripped = line.strip()
+            if stripped and not stripped.startswith("#"):
+                candidates.append(stripped)
+    if scripts_root is not None and scripts_root.is_dir():
+        for meta_path in sorted(scripts_root.glob("*/metadata.json")):
+            try:
+                data = json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                continue
+            if isinstance(data, dict):
+                candidates.append(str(data.get("youtube_id") or "").strip())
+
+    seen: set[str] = set()
+    video_ids: list[str] = []
+    for candidate in candidates:
+        if not candidate:
+            continue
+        try:
+            video_id = parse_video_id(candidate)
+        except InvalidVideoId:
+            continue
+        if video_id not in seen:
+            seen.add(video_id)
+            video_ids.append(video_id)
+    return video_ids
+
+
+class _RateLimitGate:
+    """Shared pause so one ``RateLimited`` response backs off every worker."""
+
+    def __init__(
+        self,
+        base_delay: float,
+        max_delay: float,
+        sleep: Callable[[float], None],
+    ) -> None:
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+
+    def wait(self) -> None:
+        with self._lock:
+            delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            self._sleep(delay)
+
+    def penalise(self, attempt: int) -> None:
+        delay = min(self._max_delay, self._base_delay * 2**attempt)
+        delay *= random.uniform(0.5, 1.0)
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+
+def warm_cache(
+    service: WarmableService,
+    video_ids: Iterable[str],
+    *,
+    concurrency: int = 4,
+    refresh_before_seconds: float = 2 * 24 * 60 * 60,
+    max_attempts: int = 4,
+    base_delay: float = 2.0,
+    max_delay: float = 60.0,
+    sleep: Callable[[float], None] = time.sleep,
+) -> WarmReport:
+    """Fetch missing or soon-to-expire transcripts with bounded concurrency."""
+
+    ids = list(video_ids)
+    gate = _RateLimitGate(base_delay, max_delay, sleep)
+
+    def warm_one(video_id: str) -> tuple[str, str, BaseYtMcpError | None]:
+        error: BaseYtMcpError | None = None
+        for attempt in range(max_attempts):
+            gate.wait()
+            try:
+                status = service.warm_transcript(
+                    build_watch_url(video_id),
+                    refresh_before_seconds=refresh_before_seconds,
+                )
+            except RateLimited as exc:
+                error = exc
+                gate.penalise(attempt)
+                continue
+            except BaseYtMcpError as exc:
+                return video_id, "failed", exc
+            return video_id, status, None
+        return video_id, "failed", error
+
+    counts: dict[str, Any] = {"fresh": 0, "fetched": 0, "refreshed": 0, "failed": 0}
+    errors: list[WarmError] = []
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        for video_id, status, exc in pool.map(warm_one, ids):
+            counts[status] += 1
+            if exc is not None:
+                errors.append(
+                    WarmError(video_id=video_id, code=exc.code, message=exc.message)
+                )
+    return WarmReport(requested=len(ids), errors=errors, **counts)
@@ -0,0 +1,108 @@
+"""Time-range and offset/limit slicing over cached transcript payloads."""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any
+
+from .errors import InvalidArgument
+
+
+def validate_window(
+    start: float | None,
+    end: float | None,
+    offset: int | None,
+    limit: int | None,
+) -> None:
+    """Reject negative or inverted windows before any work is done."""
+
+    if start is not None and start < 0:
+        raise InvalidArgument("start must be non-negative")
+    if end is not None and end < 0:
+        raise InvalidArgument("end must be non-negative")
+    if start is not None and end is not None and end <= start:
+        raise InvalidArgument("end must be greater than start")
+    if offset is not None and offset < 0:
+        raise InvalidArgument("offset must be non-negative")
+    if limit is not None and limit < 1:
+        raise InvalidArgument("limit must be at least 1")
+
+
+class TranscriptIndex:
+    """Bisect index over a transcript payload's segment and chunk timings.
+
+    Building the index is O(n); each :meth:`window` call afterwards costs
+    O(log n + k) for ``k`` returned items. Segments and chunks are assumed to
+    be sorted by start time, which the service guarantees.
+    """
+
+    def __init__(self, payload: dict[str, Any]) -> None:
+        self.payload = payload
+        segments = payload.get("segments", [])
+        chunks = payload.get("chunks", [])
+        self._segment_starts = [float(seg["start"]) for seg in segments]
+        self._chunk_starts = [float(chunk["start"]) for chunk in chunks]
+        # Chunk ends are not strictly monotonic, so bisect over their running max.
+        self._chunk_end_max = list(
+            accumulate((float(chunk["end"]) for chunk in chunks), max)
+        )
+
+    def window(
+        self,
+        *,
+        start: float | None = None,
+        end: float | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> dict[str, Any]:
+        """Return a copy of the payload restricted to the requested window.
+
+        ``start``/``end`` select segments overlapping ``[start, end)`` seconds;
+        ``offset``/``limit`` then page through those segments. Chunks are the
+        ones that start no later than the last returned segment and end after
+        the first one starts. A ``window`` entry describes the slice and the
+        ``next_offset`` to continue from.
+        """
+
+        validate_window(start, end, offset, limit)
+        segments = self.payload.get("segments", [])
+        chunks = self.payload.get("chunks", [])
+        starts = self._segment_starts
+
+        lo = 0 if start is None else bisect_left(starts, start)
+        if start is not None and lo > 0:
+            previous = segments[lo - 1]
+            if float(previous["start"]) + float(previous["dur"]) > start:
+                lo -= 1
+        hi = len(starts) if end is None else bisect_left(starts, end)
+        hi = max(hi, lo)
+        matched = hi - lo
+
+        first = min(lo + (offset or 0), hi)
+        last = hi if limit is None else min(hi, first + limit)
+        page = segments[first:last]
+
+        selected_chunks: list[dict[str, Any]] = []
+        if page:
+            span_start = float(page[0]["start"])
+            chunk_lo = bisect_right(self._chunk_end_max, span_start)
+            chunk_hi = bisect_right(self._chunk_starts, float(page[-1]["start"]))
+            selected_chunks = [
+                chunk
+                for chunk in chunks[chunk_lo:chunk_hi]
+                if float(chunk["end"]) > span_start
+            ]
+
+        windowed = dict(self.payload)
+        windowed["segments"] = page
+        windowed["chunks"] = selected_chunks
+        windowed["window"] = {
+            "start": start,
+            "end": end,
+            "offset": offset or 0,
+            "limit": limit,
+            "matched_segments": matched,
+            "next_offset": (last - lo) if last < hi else None,
+        }
+        return windowed
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import dataclasses
+import logging
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable, Iterable
-from typing import Any, cast
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, TypeVar, cast
 
 import httpx
-from tenacity import RetryError, Retrying, stop_after_attempt, wait_exponential
+from tenacity import (
+    RetryCallState,
+    RetryError,
+    Retrying,
+    retry_if_not_exception_type,
+    stop_after_attempt,
+    wait_random_exponential,
+)
 from youtube_transcript_api import YouTubeTranscriptApi
 from youtube_transcript_api._errors import (
     CouldNotRetrieveTranscript,
@@ -23,9 +36,16 @@ from youtube_transcript_api._errors import (
 )
 
 from .cache import TranscriptCache
-from .chunking import chunk_segments
+from .chunking import (
+    DEFAULT_PROFILE,
+    ChunkProfile,
+    chunk_payload_segments,
+    chunk_segments,
+    get_chunk_profile,
+)
 from .errors import (
     BaseYtMcpError,
+    CircuitOpen,
     InvalidArgument,
     NetworkError,
     NoCaptionsAvailable,
@@ -33,14 +53,28 @@ from .errors import (
     RateLimited,
     VideoUnavailable,
 )
+from .metrics import (
+    REGISTRY,
+    REVALIDATIONS,
+    STALE_SERVED,
+    UPSTREAM_RETRIES,
+    cache_hit_ratio,
+    record_upstream_call,
+    update_cache_gauges,
+)
 from .models import (
+    CacheStats,
     CaptionTrackInfo,
     MetadataResponse,
+    SearchResponse,
     Segment,
+    StatsResponse,
     TracksResponse,
     TranscriptResponse,
 )
+from .search import search_transcripts
 from .settings import Settings
+from .upstream import UpstreamGuard
 from .utils import (
     InvalidVideoId,
     build_watch_url,
@@ -48,14 +82,28 @@ from .utils import (
     is_unlisted_or_private,
     parse_video_id,
 )
+from .windowing import TranscriptIndex, validate_window
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+def _create_retry(operation: str) -> Retrying:
+    """Build the retry configuration for one upstream ``operation``.
 
+    Waits are fully jittered so concurrent requests that failed together do not
+    retry together; an open circuit is never retried.
+    """
 
-def _create_retry() -> Retrying:
-    """Build a retry configuration shared across HTTP and transcript calls."""
+    def count_retry(_: RetryCallState) -> None:
+        UPSTREAM_RETRIES.inc(operation)
 
     return Retrying(
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=0.5, min=0.5, max=4),
+        wait=wait_random_exponential(multiplier=0.5, max=4),
+        retry=retry_if_not_exception_type(CircuitOpen),
+        before_sleep=count_retry,
         reraise=True,
     )
 
@@ -70,13 +118,40 @@ class YouTubeTranscriptService:
         cache: TranscriptCache | None = None,
         transcript_api: Any = None,
         metadata_fetcher: Callable[[str], MetadataResponse] | None = None,
+        upstream: UpstreamGuard | None = None,
     ) -> None:
         self.settings = settings
-        self.cache = cache or TranscriptCache(settings.cache_dir)
+        self._cache = cache
+        self._cache_lock = threading.Lock()
         self._api = transcript_api or YouTubeTranscriptApi
         self._metadata_fetcher = metadata_fetcher or self._default_metadata_fetcher
-        self._transcript_retry = _create_retry()
-        self._http_retry = _create_retry()
+        self.upstream = upstream or UpstreamGuard.from_settings(settings)
+        self._revalidator: ThreadPoolExecutor | None = None
+        self._revalidating: dict[str, Future[None]] = {}
+        self._revalidating_lock = threading.Lock()
+        self._list_retry = _create_retry("list_transcripts")
+        self._fetch_retry = _create_retry("fetch_transcript")
+        self._http_retry = _create_retry("metadata")
+        self._indexes: OrderedDict[tuple[str, str], TranscriptIndex] = OrderedDict()
+        self._indexes_lock = threading.Lock()
+
+    @property
+    def cache(self) -> TranscriptCache:
+        """The transcript cache, opened on first use.
+
+        Commands that never read transcripts (tracks, metadata) do not pay for
+        opening and migrating the SQLite database.
+        """
+
+        if self._cache is None:
+            with self._cache_lock:
+                if self._cache is None:
+                    self._cache = TranscriptCache.from_settings(self.settings)
+        return self._cache
+
+    @cache.setter
+    def cache(self, cache: TranscriptCache) -> None:
+        self._cache = cache
 
     def get_transcript(
         self,
@@ -84,8 +159,119 @@ class YouTubeTranscriptService:
         *,
         lang: str | None = None,
         prefer_auto: bool | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        chunk_profile: str | None = None,
     ) -> TranscriptResponse:
-        """Fetch a transcript response, consulting the cache when possible."""
+        """Fetch a transcript response, consulting the cache when possible.
+
+        Repeated requests for the same video and preferences are answered from
+        the cache without contacting YouTube for metadata or track listings.
+        ``start``/``end`` (seconds) and ``offset``/``limit`` return only a
+        window of the transcript; see :meth:`TranscriptIndex.window`.
+        ``chunk_profile`` names one of :data:`CHUNK_PROFILES`; its chunks are
+        computed once per transcript and cached alongside it.
+        """
+
+        return TranscriptResponse.model_validate(
+            self.get_transcript_payload(
+                url,
+                lang=lang,
+                prefer_auto=prefer_auto,
+                start=start,
+                end=end,
+                offset=offset,
+                limit=limit,
+                chunk_profile=chunk_profile,
+            )
+        )
+
+    def get_transcript_payload(
+        self,
+        url: str,
+        *,
+        lang: str | None = None,
+        prefer_auto: bool | None = None,
+        start: float | None = None,
+        end: float | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        chunk_profile: str | None = None,
+        lazy: bool = False,
+    ) -> dict[str, Any]:
+        """Like :meth:`get_transcript` but return the plain, already-validated dict.
+
+        Streaming and projection callers use this to skip re-validating every
+        segment and chunk of large cached transcripts. With ``lazy``, a cached
+        whole transcript in the default chunk profile comes back with
+        ``segments`` and ``chunks`` as one-shot iterators, so a stream can start
+        before every item is built and skips the ones it does not send.
+        """
+
+        profile = get_chunk_profile(chunk_profile)
+        if start is None and end is None and offset is None and limit is None:
+            transcript_key, payload = self._resolve_transcript(
+                url,
+                lang=lang,
+                prefer_auto=prefer_auto,
+                lazy=lazy and profile == DEFAULT_PROFILE,
+            )
+            return self._apply_profile(
+                transcript_key, cast(dict[str, Any], payload), profile
+            )
+
+        validate_window(start, end, offset, limit)
+        index = self._transcript_index(
+            url, lang=lang, prefer_auto=prefer_auto, profile=profile
+        )
+        return index.window(start=start, end=end, offset=offset, limit=limit)
+
+    def _apply_profile(
+        self, transcript_key: str, payload: dict[str, Any], profile: ChunkProfile
+    ) -> dict[str, Any]:
+        """Swap in ``profile``'s chunks, computing and caching them on first use."""
+
+        if profile == DEFAULT_PROFILE:
+            return payload
+        chunks_key = hash_content(
+            {"chunks": payload["hash"], "profile": dataclasses.asdict(profile)}
+        )
+        chunks = self.cache.get(chunks_key)
+        if chunks is None:
+            chunks = chunk_payload_segments(
+                payload["video"]["id"], payload["segments"], profile
+            )
+            remaining = self.cache.expires_in(transcript_key)
+            if remaining is None or remaining > 0:
+                ttl_days = (
+                    remaining / (24 * 60 * 60)
+                    if remaining is not None
+                    else self.settings.cache_ttl_days
+                )
+                self.cache.set(chunks_key, chunks, ttl_days)
+        return {**payload, "chunks": chunks}
+
+    def _resolve_transcript(
+        self,
+        url: str,
+        *,
+        lang: str | None,
+        prefer_auto: bool | None,
+        memoised: ChunkProfile | None = None,
+        lazy: bool = False,
+    ) -> tuple[str, dict[str, Any] | None]:
+        """Return ``(transcript_key, payload)`` from the cache or upstream.
+
+        When ``memoised`` names a profile whose in-memory index already holds
+        the payload, it is not decoded again and ``None`` is returned instead.
+        Expired entries still inside the stale window are returned marked
+        ``stale`` while a background refresh runs, and also stand in when
+        YouTube is throttling or unreachable. Cached answers are only served
+        while the video's privacy check is fresh; see :meth:`_recheck_policy`.
+        ``lazy`` is passed to :meth:`TranscriptCache.get` for cache hits.
+        """
 
         try:
             video_id = parse_video_id(url)
@@ -93,15 +279,231 @@ class YouTubeTranscriptService:
             raise InvalidArgument(str(exc)) from exc
 
         prefer_auto_final = bool(prefer_auto) if prefer_auto is not None else False
-        watch_url = build_watch_url(video_id)
+        request_key = self._request_key(video_id, lang, prefer_auto_final)
+        alias = self.cache.get(request_key)
+        if isinstance(alias, dict):
+            transcript_key = alias["transcript_key"]
+            self._recheck_policy(video_id, request_key)
+            if memoised and (transcript_key, memoised.name) in self._indexes:
+                remaining = self.cache.expires_in(transcript_key)
+                if remaining is not None and remaining > 0:
+                    return transcript_key, None
+            cached_raw = self.cache.get(transcript_key, lazy=lazy)
+            if cached_raw is not None:
+                return transcript_key, cast(dict[str, Any], cached_raw)
+
+        if self.settings.stale_while_revalidate:
+            stale = self._stale_transcript(request_key, reason="revalidate")
+            if stale is not None:
+                self._recheck_policy(video_id, request_key)
+                self._revalidate(video_id, lang, prefer_auto_final, request_key)
+                return stale
+
+        try:
+            return self._fetch_transcript(
+                video_id,
+                lang=lang,
+                prefer_auto=prefer_auto_final,
+                request_key=request_key,
+            )
+        except (RateLimited, NetworkError):
+            stale = self._stale_transcript(request_key, reason="fallback")
+            if stale is None:
+                raise
+            logger.warning(
+                "Serving stale transcript %s: upstream unavailable", video_id
+            )
+            return stale
 
-        metadata = self.get_metadata(watch_url)
-        if self.settings.reject_private_or_unlisted and is_unlisted_or_private(
-            metadata.model_dump()
-        ):
+    def _policy_key(self, video_id: str) -> str:
+        return hash_content({"policy": video_id})
+
+    def _enforce_policy(self, video_id: str, metadata: MetadataResponse) -> None:
+        """Reject private or unlisted videos and remember that ``video_id`` passed."""
+
+        if not self.settings.reject_private_or_unlisted:
+            return
+        if is_unlisted_or_private(metadata.model_dump()):
             raise PolicyRejected("Video is private or unlisted")
+        if self.settings.policy_recheck_seconds > 0:
+            self.cache.set(
+                self._policy_key(video_id),
+                {"allowed": True},
+                self.settings.policy_recheck_seconds / (24 * 60 * 60),
+            )
 
-        track = self._select_track(video_id, lang=lang, prefer_auto=prefer_auto_final)
+    def _recheck_policy(self, video_id: str, request_key: str) -> None:
+        """Re-run the privacy check for a cached transcript once it has gone stale.
+
+        A video that turned private or unlisted has its cached transcript
+        dropped, so neither stale serving nor search returns it again. When
+        YouTube cannot be reached the last decision stands.
+        """
+
+        if not self.settings.reject_private_or_unlisted:
+            return
+        if self.cache.get(self._policy_key(video_id)) is not None:
+            return
+        try:
+            self._enforce_policy(video_id, self.get_metadata(build_watch_url(video_id)))
+        except PolicyRejected:
+            self._forget_transcript(request_key)
+            raise
+        except (RateLimited, NetworkError, CircuitOpen) as exc:
+            logger.warning(
+                "Could not re-check privacy of %s: %s", video_id, exc.message
+            )
+
+    def _forget_transcript(self, request_key: str) -> None:
+        """Delete ``request_key`` and the transcript it points at, even if expired."""
+
+        alias = self.cache.get_stale(request_key)
+        if isinstance(alias, dict):
+            self.cache.delete(alias["transcript_key"])
+        self.cache.delete(request_key)
+
+    def _stale_transcript(
+        self, request_key: str, *, reason: str
+    ) -> tuple[str, dict[str, Any]] | None:
+        """Expired-but-retained transcript for ``request_key``, marked stale."""
+
+        alias = self.cache.get_stale(request_key)
+        if not isinstance(alias, dict):
+            return None
+        transcript_key = alias["transcript_key"]
+        payload = self.cache.get_stale(transcript_key)
+        if payload is None:
+            return None
+        STALE_SERVED.inc(reason)
+        return transcript_key, {**cast(dict[str, Any], payload), "stale": True}
+
+    def _revalidate(
+        self, video_id: str, lang: str | None, prefer_auto: bool, request_key: str
+    ) -> None:
+        """Refresh ``request_key`` in the background unless already in progress."""
+
+        with self._revalidating_lock:
+            if request_key in self._revalidating:
+                return
+            if self._revalidator is None:
+                self._revalidator = ThreadPoolExecutor(
+                    max_workers=self.settings.revalidate_concurrency,
+                    thread_name_prefix="ytmcp-revalidate",
+                )
+
+            def refresh() -> None:
+                outcome = "ok"
+                try:
+                    self._fetch_transcript(
+                        video_id,
+                        lang=lang,
+                        prefer_auto=prefer_auto,
+                        request_key=request_key,
+                        force=True,
+                    )
+                except BaseYtMcpError as exc:
+                    outcome = exc.code
+                    logger.info("Revalidating %s failed: %s", video_id, exc.message)
+                except Exception:  # pragma: no cover - never kill the worker
+                    outcome = "error"
+                    logger.exception("Revalidating %s failed", video_id)
+                finally:
+                    REVALIDATIONS.inc(outcome)
+                    with self._revalidating_lock:
+                        self._revalidating.pop(request_key, None)
+
+            self._revalidating[request_key] = self._revalidator.submit(refresh)
+
+    def wait_for_revalidations(self, timeout: float | None = None) -> None:
+        """Block until background refreshes scheduled so far have finished."""
+
+        with self._revalidating_lock:
+            pending = list(self._revalidating.values())
+        wait(pending, timeout=timeout)
+
+    def _transcript_index(
+        self,
+        url: str,
+        *,
+        lang: str | None,
+        prefer_auto: bool | None,
+        profile: ChunkProfile,
+    ) -> TranscriptIndex:
+        transcript_key, payload = self._resolve_transcript(
+            url, lang=lang, prefer_auto=prefer_auto, memoised=profile
+        )
+        if payload is None:
+            with self._indexes_lock:
+                index = self._indexes.get((transcript_key, profile.name))
+                if index is not None:
+                    self._indexes.move_to_end((transcript_key, profile.name))
+                    return index
+            # Evicted by another thread in the meantime; decode it again.
+            transcript_key, payload = self._resolve_transcript(
+                url, lang=lang, prefer_auto=prefer_auto
+            )
+        index = TranscriptIndex(
+            self._apply_profile(transcript_key, cast(dict[str, Any], payload), profile)
+        )
+        with self._indexes_lock:
+            self._indexes[(transcript_key, profile.name)] = index
+            while len(self._indexes) > self.settings.transcript_index_cache_size:
+                self._indexes.popitem(last=False)
+        return index
+
+    def warm_transcript(self, url: str, *, refresh_before_seconds: float) -> str:
+        """Ensure the default transcript for ``url`` is cached and not about to expire.
+
+        Returns ``"fresh"`` when the cached entry outlives ``refresh_before_seconds``,
+        ``"refreshed"`` when an expiring entry was re-fetched, and ``"fetched"``
+        when nothing was cached yet.
+        """
+
+        try:
+            video_id = parse_video_id(url)
+        except InvalidVideoId as exc:
+            raise InvalidArgument(str(exc)) from exc
+
+        request_key = self._request_key(video_id, None, False)
+        alias = self.cache.get(request_key)
+        if isinstance(alias, dict):
+            remaining = self.cache.expires_in(alias["transcript_key"])
+            if remaining is not None and remaining > refresh_before_seconds:
+                return "fresh"
+        self._fetch_transcript(
+            video_id, lang=None, prefer_auto=False, request_key=request_key, force=True
+        )
+        return "refreshed" if isinstance(alias, dict) else "fetched"
+
+    def _request_key(self, video_id: str, lang: str | None, prefer_auto: bool) -> str:
+        return hash_content(
+            {
+                "request": video_id,
+                "lang": (lang or "").lower(),
+                "prefer_auto": prefer_auto,
+                "allow_auto": self.settings.allow_auto,
+            }
+        )
+
+    def _fetch_transcript(
+        self,
+        video_id: str,
+        *,
+        lang: str | None,
+        prefer_auto: bool,
+        request_key: str,
+        force: bool = False,
+    ) -> tuple[str, dict[str, Any]]:
+        watch_url = build_watch_url(video_id)
+
+        try:
+            metadata = self.get_metadata(watch_url)
+            self._enforce_policy(video_id, metadata)
+        except PolicyRejected:
+            self._forget_transcript(request_key)
+            raise
+
+        track = self._select_track(video_id, lang=lang, prefer_auto=prefer_auto)
         track_identifier = getattr(track, "id", None) or getattr(
             track, "language_code", ""
         )
@@ -113,14 +515,20 @@ class YouTubeTranscriptService:
                 "track": track_identifier,
             }
         )
+        ttl_days = self.settings.cache_ttl_days
 
-        cached_raw = self.cache.get(cache_key)
+        cached_raw = None if force else self.cache.get(cache_key)
         if cached_raw is not None:
-            cached_payload = cast(dict[str, Any], cached_raw)
-            return TranscriptResponse.model_validate(cached_payload)
+            self.cache.set(request_key, {"transcript_key": cache_key}, ttl_days)
+            return cache_key, cast(dict[str, Any], cached_raw)
 
         try:
-            segments_raw = self._transcript_retry(self._fetch_track_segments, track)
+            segments_raw = self._fetch_retry(
+                self._call_upstream,
+                "fetch_transcript",
+                self._fetch_track_segments,
+                track,
+            )
         except RetryError as exc:  # pragma: no cover - network retries are hard to hit
             last_exc = exc.last_attempt.exception()
             if isinstance(last_exc, BaseYtMcpError):
@@ -147,9 +555,15 @@ class YouTubeTranscriptService:
         }
         payload_hash = hash_content(payload)
         payload["hash"] = payload_hash
-        response = TranscriptResponse.model_validate(payload)
-        self.cache.set(cache_key, response.model_dump(), self.settings.cache_ttl_days)
-        return response
+        validated: dict[str, Any] = TranscriptResponse.model_validate(
+            payload
+        ).model_dump()
+        self.cache.set(cache_key, validated, ttl_days)
+        self.cache.set(request_key, {"transcript_key": cache_key}, ttl_days)
+        with self._indexes_lock:
+            for memo_key in [key for key in self._indexes if key[0] == cache_key]:
+                del self._indexes[memo_key]
+        return cache_key, validated
 
     def search_captions(self, url: str) -> TracksResponse:
         video_id = self._parse_for_tracks(url)
@@ -164,6 +578,34 @@ class YouTubeTranscriptService:
         tracks.sort(key=lambda t: (t.is_auto, t.lang))
         return TracksResponse(tracks=tracks)
 
+    def search_transcripts(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        video_id: str | None = None,
+        lang: str | None = None,
+    ) -> SearchResponse:
+        """Rank chunks of every cached transcript against ``query``.
+
+        Only the local cache is searched; nothing is fetched from YouTube.
+        """
+
+        return search_transcripts(
+            self.cache, query, limit=limit, video_id=video_id, lang=lang
+        )
+
+    def stats(self) -> StatsResponse:
+        """Cache footprint plus every metric recorded by this process."""
+
+        cache_stats = self.cache.stats()
+        update_cache_gauges(cache_stats)
+        return StatsResponse(
+            cache=CacheStats(**cache_stats),
+            cache_hit_ratio=cache_hit_ratio(),
+            metrics=REGISTRY.snapshot(),
+        )
+
     def get_metadata(self, url: str) -> MetadataResponse:
         try:
             video_id = parse_video_id(url)
@@ -227,8 +669,11 @@ class YouTubeTranscriptService:
 
     def _list_transcripts(self, video_id: str) -> list[Any]:
         try:
-            transcripts_obj = self._transcript_retry(
-                self._api.list_transcripts, video_id
+            transcripts_obj = self._list_retry(
+                self._call_upstream,
+                "list_transcripts",
+                self._api.list_transcripts,
+                video_id,
             )
         except RetryError as exc:  # pragma: no cover
             last_exc = exc.last_attempt.exception()
@@ -245,6 +690,26 @@ class YouTubeTranscriptService:
             # Older versions of youtube_transcript_api return iterables without __iter__
             return [cast(Any, transcripts_obj)]
 
+    def _call_upstream(self, operation: str, func: Callable[..., T], *args: Any) -> T:
+        """Run one upstream attempt through the shared guard, recording metrics."""
+
+        self.upstream.before_call(operation)
+        started = time.perf_counter()
+        outcome = "ok"
+        try:
+            return func(*args)
+        except Exception as exc:
+            error = (
+                exc
+                if isinstance(exc, BaseYtMcpError)
+                else self._map_transcript_error(exc)
+            )
+            outcome = error.code
+            raise
+        finally:
+            record_upstream_call(operation, outcome, time.perf_counter() - started)
+            self.upstream.after_call(outcome)
+
     def _fetch_track_segments(self, track: Any) -> list[dict[str, Any]]:
         try:
             data = track.fetch()
@@ -315,7 +780,10 @@ class YouTubeTranscriptService:
             return metadata
 
         try:
-            return self._http_retry(_request)
+            return cast(
+                MetadataResponse,
+                self._http_retry(self._call_upstream, "metadata", _request),
+            )
         except RetryError as exc:  # pragma: no cover
             last_exc = exc.last_attempt.exception()
             if isinstance(last_exc, BaseYtMcpError):
@@ -327,6 +795,8 @@ class YouTubeTranscriptService:
             raise NetworkError("Failed to fetch metadata after retries") from exc
 
     def _map_transcript_error(self, exc: Exception) -> BaseYtMcpError:
+        if isinstance(exc, BaseYtMcpError):
+            return exc
         if isinstance(exc, YtInvalidVideoId | InvalidVideoId):
             return InvalidArgument(str(exc))
         if isinstance(exc, YtVideoUnavailable):